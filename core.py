@@ -1,25 +1,107 @@
 """
 Municipal Governance Analysis Framework - Core Module
 Mixed-Methods Framework für kommunale Digitalisierungs-Governance-Analyse
+
+Schwere Abhängigkeiten (pandas, numpy und die Analyse-Module der einzelnen
+Phasen) werden erst bei Bedarf geladen, damit ``import`` und CLI schnell starten.
 """
 
+from __future__ import annotations
+
 __version__ = "1.0.0"
 __author__ = "Governance Research Team"
 
-from typing import Dict, List, Optional, Any, Tuple
-import pandas as pd
-import numpy as np
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, Optional, Any, Sequence, Tuple
+import copy
+import importlib
 import logging
+import os
+import threading
 from pathlib import Path
 import json
 
-# Setup Logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from .keyword_matcher import KeywordMatcher
+from .name_index import NameIndex
+from .result_cache import ResultCache, config_hash, corpus_hash
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+    from .mixed_methods import MixedMethodsIntegrator
+    from .nlp_analyzer import QuantitativeNLPAnalyzer
+    from .sharded_engine import ShardedAnalysisEngine
+    from .stellenplan_analyzer import QualitativeStellenpladrivenAnalyzer
+
 logger = logging.getLogger(__name__)
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Setup Logging (für CLI und Skripte; der Import selbst konfiguriert nichts)."""
+    logging.basicConfig(level=level, format=LOG_FORMAT)
+
+# Keyword-Treffer pro Dokument, bei denen ein Dimensions-Score 1 - 1/e erreicht
+SCORE_SCALE = 2.0
+
+# Standard-Dimensionen, falls die Konfiguration keine eigenen festlegt
+DEFAULT_GOVERNANCE_DIMENSIONS: Dict[str, Dict[str, Any]] = {
+    "macht": {
+        "description": "IT-Abhängigkeiten und Vendor-Kontrolle",
+        "keywords": ["IT-Vergabe", "externe Dienstleister", "Cloud-Anbieter", 
+                     "Vendor", "Abhängigkeit", "Microsoft", "SAP"],
+        "color": "#E74C3C"
+    },
+    "legitimation": {
+        "description": "Transparenz und demokratische Teilhabe", 
+        "keywords": ["Bürgerbeteiligung", "Transparenz", "Open Data", 
+                     "Partizipation", "Vertrauen", "Rechenschaft"],
+        "color": "#3498DB"
+    },
+    "institution": {
+        "description": "Pfadabhängigkeiten und Wandelfähigkeit",
+        "keywords": ["Verfahren", "Zuständigkeit", "Modernisierung", 
+                     "Legacy-System", "Wandel", "Innovation"],
+        "color": "#F39C12"
+    },
+    "souveraenitaet": {
+        "description": "Digitale Selbstbestimmung und OSS-Adoption",
+        "keywords": ["digitale Souveränität", "Open Source", "Eigenentwicklung", 
+                     "Unabhängigkeit", "Kontrolle", "Linux"],
+        "color": "#27AE60"
+    }
+}
+
+def load_governance_dimensions(config_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Lade die Governance-Dimensionen aus einer Konfigurationsdatei.
+
+    Gelesen wird der Schlüssel ``governance_dimensions`` einer JSON- oder
+    YAML-Datei (Aufbau wie ``config/governance_keywords.json``). Fehlt die Datei
+    oder der Schlüssel, gelten :data:`DEFAULT_GOVERNANCE_DIMENSIONS`.
+
+    Args:
+        config_path: Pfad der Konfigurationsdatei
+
+    Returns:
+        Dict Dimension -> Beschreibung, Keywords und Farbe
+    """
+    path = Path(config_path)
+    config: Dict[str, Any] = {}
+    if path.is_file():
+        with open(path, 'r', encoding='utf-8') as f:
+            if path.suffix == ".json":
+                config = json.load(f)
+            else:
+                import yaml
+                config = yaml.safe_load(f)
+    else:
+        logger.debug(f"Config file not found, using default dimensions: {config_path}")
+    dimensions = (config or {}).get("governance_dimensions")
+    if not dimensions:
+        return copy.deepcopy(DEFAULT_GOVERNANCE_DIMENSIONS)
+    return dimensions
+
 class GovernanceAnalyzer:
     """
     Haupt-Framework-Klasse für Mixed-Methods Governance-Analyse.
@@ -28,50 +110,133 @@ class GovernanceAnalyzer:
     über 120 deutsche Kommunen in 4 theoretischen Governance-Dimensionen.
     """
 
-    def __init__(self, config_path: Optional[str] = None):
-        """Initialize Governance Analyzer."""
+    def __init__(self, config_path: Optional[str] = None,
+                 cache: Optional[ResultCache] = None):
+        """
+        Initialize Governance Analyzer.
+
+        Args:
+            config_path: Pfad der Konfigurationsdatei; deren
+                ``governance_dimensions`` legen die bewerteten Dimensionen fest
+            cache: Optionaler Ergebnis-Cache für :meth:`analyze_municipality` und
+                :meth:`generate_governance_report`
+        """
         self.config_path = config_path or "config/settings.yaml"
-        self.governance_dimensions = {
-            "macht": {
-                "description": "IT-Abhängigkeiten und Vendor-Kontrolle",
-                "keywords": ["IT-Vergabe", "externe Dienstleister", "Cloud-Anbieter", 
-                           "Vendor", "Abhängigkeit", "Microsoft", "SAP"],
-                "color": "#E74C3C"
-            },
-            "legitimation": {
-                "description": "Transparenz und demokratische Teilhabe", 
-                "keywords": ["Bürgerbeteiligung", "Transparenz", "Open Data", 
-                           "Partizipation", "Vertrauen", "Rechenschaft"],
-                "color": "#3498DB"
-            },
-            "institution": {
-                "description": "Pfadabhängigkeiten und Wandelfähigkeit",
-                "keywords": ["Verfahren", "Zuständigkeit", "Modernisierung", 
-                           "Legacy-System", "Wandel", "Innovation"],
-                "color": "#F39C12"
-            },
-            "souveraenitaet": {
-                "description": "Digitale Selbstbestimmung und OSS-Adoption",
-                "keywords": ["digitale Souveränität", "Open Source", "Eigenentwicklung", 
-                           "Unabhängigkeit", "Kontrolle", "Linux"],
-                "color": "#27AE60"
-            }
-        }
+        self.cache = cache
+        self._nlp_analyzer: Optional[QuantitativeNLPAnalyzer] = None
+        self._nlp_lock = threading.Lock()
+        self.governance_dimensions = load_governance_dimensions(self.config_path)
+
+        # Keyword-Automat für das Batch-Scoring, passend zu ``_config_hash``
+        self._config_hash: Optional[str] = None
+        self._sync_config()
 
         logger.info("🏛️ Governance Analyzer initialized")
 
-    def analyze_municipality(self, municipality_name: str) -> Dict[str, Any]:
+    def _sync_config(self) -> str:
+        """
+        Hash der aktuellen Dimensionen; nach Änderungen an
+        ``governance_dimensions`` wird der Keyword-Automat neu kompiliert.
+        """
+        current = config_hash(self.governance_dimensions)
+        if current != self._config_hash:
+            self.matcher = KeywordMatcher(self.governance_dimensions, fields=("keywords",))
+            self.keywords = [keyword for keyword, _ in self.matcher.keywords]
+            self._dimension_matrix = None
+            self._config_hash = current
+        return current
+
+    @property
+    def dimension_matrix(self) -> np.ndarray:
+        """Zuordnungsmatrix Keywords x Dimensionen (beim ersten Zugriff aufgebaut)."""
+        if self._dimension_matrix is None:
+            import numpy as np
+
+            dimensions = list(self.governance_dimensions)
+            matrix = np.zeros((len(self.keywords), len(dimensions)))
+            for row, (_, dims) in enumerate(self.matcher.keywords):
+                for dim in dims:
+                    matrix[row, dimensions.index(dim)] = 1.0
+            self._dimension_matrix = matrix
+        return self._dimension_matrix
+
+    @property
+    def nlp_analyzer(self) -> QuantitativeNLPAnalyzer:
+        """
+        NLP-Analyzer der quantitativen Phase; wird beim ersten Zugriff einmalig geladen.
+
+        Ist ``config_path`` eine JSON-Keyword-Datei, nutzt er dieselbe
+        Konfiguration, sonst ``config/governance_keywords.json``.
+        """
+        if self._nlp_analyzer is None:
+            with self._nlp_lock:
+                if self._nlp_analyzer is None:
+                    from .nlp_analyzer import QuantitativeNLPAnalyzer
+
+                    if Path(self.config_path).suffix == ".json":
+                        self._nlp_analyzer = QuantitativeNLPAnalyzer(self.config_path)
+                    else:
+                        self._nlp_analyzer = QuantitativeNLPAnalyzer()
+        return self._nlp_analyzer
+
+    def _cached(self, kind: str, municipality_name: str,
+                documents: Optional[List[str]],
+                compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Ergebnis aus dem Cache oder berechnen und ablegen.
+
+        Ohne Cache oder ohne Dokumente wird nur berechnet: Simulierte Scores
+        sind Zufallswerte und dürfen nicht als Ergebnis festgeschrieben werden.
+        """
+        if self.cache is None or documents is None:
+            return compute()
+        key = ResultCache.make_key(kind, municipality_name, corpus_hash(documents),
+                                   self._sync_config())
+        result = self.cache.get(key)
+        if result is None:
+            result = compute()
+            self.cache.put(key, result, kind=kind, municipality=municipality_name)
+        return result
+
+    def analyze_municipality(self, municipality_name: str,
+                             documents: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Analysiere eine spezifische Kommune über alle 4 Governance-Dimensionen.
 
+        Mit ``cache`` wird das Ergebnis unter Kommune, Korpus-Hash und
+        Konfigurations-Hash abgelegt und bei gleichem Inhalt wiederverwendet.
+
         Args:
             municipality_name: Name der Kommune
+            documents: Optional Dokumenttexte der Kommune; ohne Dokumente werden
+                simulierte Scores erzeugt (und nicht gecacht)
 
         Returns:
             Dict mit Governance-Scores und Analyse-Ergebnissen
         """
+        texts = None if documents is None else list(documents)
+        return self._cached("analysis", municipality_name, texts,
+                            lambda: self._analyze(municipality_name, texts))
+
+    def _analyze(self, municipality_name: str,
+                 documents: Optional[List[str]]) -> Dict[str, Any]:
+        import numpy as np
+        import pandas as pd
+
         logger.info(f"Analyzing municipality: {municipality_name}")
 
+        if documents is not None:
+            counts, n_documents = self.keyword_counts({municipality_name: documents})
+            row = self.score_keyword_counts(counts, n_documents).iloc[0]
+            return {
+                "municipality": municipality_name,
+                "timestamp": row["timestamp"].isoformat(),
+                "governance_scores": {dim: float(row[dim]) for dim in self.governance_dimensions},
+                "overall_score": float(row["overall_score"]),
+                "data_quality": row["data_quality"],
+                "methodology": row["methodology"]
+            }
+
         # Placeholder für echte Implementierung
         analysis_result = {
             "municipality": municipality_name,
@@ -88,25 +253,108 @@ class GovernanceAnalyzer:
         return analysis_result
 
     def compare_municipalities(self, 
-                             municipality_names: List[str]) -> pd.DataFrame:
+                             municipality_names: List[str],
+                             documents: Optional[Mapping[str, Iterable[str]]] = None) -> pd.DataFrame:
         """
         Vergleiche mehrere Kommunen über alle Governance-Dimensionen.
 
+        Alle Kommunen werden gemeinsam bewertet (siehe :meth:`score_keyword_counts`),
+        ohne Zwischenergebnis je Kommune.
+
         Args:
             municipality_names: Liste der zu vergleichenden Kommunen
+            documents: Optional Dokumenttexte je Kommune; ohne Dokumente werden
+                (wie in :meth:`analyze_municipality`) simulierte Scores erzeugt
 
         Returns:
             DataFrame mit Vergleichsergebnissen
         """
+        import numpy as np
+
         logger.info(f"Comparing {len(municipality_names)} municipalities")
 
-        results = []
-        for name in municipality_names:
-            result = self.analyze_municipality(name)
-            result.update(result.pop("governance_scores"))
-            results.append(result)
+        if documents is not None:
+            counts, n_documents = self.keyword_counts(
+                {name: documents.get(name, ()) for name in municipality_names}
+            )
+            return self.score_keyword_counts(counts, n_documents)
+
+        n = len(municipality_names)
+        scores = np.random.uniform(0.3, 0.95, size=(n, len(self.governance_dimensions)))
+        overall = np.random.uniform(0.5, 0.9, size=n)
+        return self._scores_frame(municipality_names, scores, overall, "simulated")
 
-        return pd.DataFrame(results)
+    def keyword_counts(self,
+                       documents: Mapping[str, Iterable[str]]) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Zähle die Dimensions-Keywords je Kommune.
+
+        Args:
+            documents: Dokumenttexte je Kommune
+
+        Returns:
+            Keyword-Zählmatrix (Kommunen x Keywords) und Anzahl Dokumente je Kommune
+        """
+        import numpy as np
+        import pandas as pd
+
+        self._sync_config()
+        counts = np.zeros((len(documents), len(self.keywords)), dtype=np.int64)
+        n_documents = np.zeros(len(documents), dtype=np.int64)
+        column = {keyword: i for i, keyword in enumerate(self.keywords)}
+        for row, texts in enumerate(documents.values()):
+            for text in texts:
+                n_documents[row] += 1
+                for keyword, count in self.matcher.count_keywords(text).items():
+                    counts[row, column[keyword]] += count
+        frame = pd.DataFrame(counts, index=pd.Index(list(documents), name="municipality"),
+                             columns=self.keywords)
+        return frame, n_documents
+
+    def score_keyword_counts(self,
+                             counts: pd.DataFrame,
+                             n_documents: Optional[Sequence[int]] = None) -> pd.DataFrame:
+        """
+        Batch-Scoring: alle Dimensions-Scores für N Kommunen als Matrixoperation.
+
+        Die Treffer je Dimension ergeben sich als ``counts @ dimension_matrix``;
+        der Score ist die Sättigung ``1 - exp(-treffer / (dokumente * SCORE_SCALE))``
+        und liegt in [0, 1). Der Gesamtscore ist der Mittelwert der Dimensionen.
+
+        Args:
+            counts: Keyword-Zählmatrix (Index: Kommunen, Spalten: Keywords),
+                z. B. aus :meth:`keyword_counts`; fehlende Keywords zählen 0
+            n_documents: Anzahl Dokumente je Kommune (Standard: 1)
+
+        Returns:
+            Typisierter DataFrame mit einer Zeile je Kommune
+        """
+        import numpy as np
+
+        matrix = counts.reindex(columns=self.keywords, fill_value=0).to_numpy(dtype=np.float64)
+        hits = matrix @ self.dimension_matrix
+        docs = np.ones(len(counts)) if n_documents is None else np.asarray(n_documents, float)
+        scores = 1.0 - np.exp(-hits / (np.maximum(docs, 1.0)[:, None] * SCORE_SCALE))
+        return self._scores_frame(list(counts.index), scores, scores.mean(axis=1),
+                                  "keyword_counts")
+
+    def _scores_frame(self, names: Sequence[str], scores: np.ndarray,
+                      overall: np.ndarray, data_quality: str) -> pd.DataFrame:
+        """Ergebnis-DataFrame mit festen Spaltentypen (Spalten wie bisher pro Kommune)."""
+        import numpy as np
+        import pandas as pd
+
+        n = len(names)
+        frame = pd.DataFrame({
+            "municipality": pd.array(names, dtype="string"),
+            "timestamp": pd.Series(pd.Timestamp.now(), index=range(n)),
+            "overall_score": overall.astype(np.float64),
+            "data_quality": pd.Categorical([data_quality] * n),
+            "methodology": pd.Categorical(["mixed_methods"] * n),
+        })
+        for i, dim in enumerate(self.governance_dimensions):
+            frame[dim] = scores[:, i].astype(np.float64)
+        return frame
 
     def get_available_municipalities(self) -> List[Dict[str, Any]]:
         """
@@ -126,18 +374,27 @@ class GovernanceAnalyzer:
 
     def generate_governance_report(self, 
                                  municipality_name: str,
-                                 include_recommendations: bool = True) -> Dict[str, Any]:
+                                 include_recommendations: bool = True,
+                                 documents: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Erstelle umfassenden Governance-Report für eine Kommune.
 
         Args:
             municipality_name: Name der Kommune
             include_recommendations: Ob Handlungsempfehlungen inkludiert werden sollen
+            documents: Optional Dokumenttexte der Kommune (siehe :meth:`analyze_municipality`)
 
         Returns:
             Umfassender Governance-Report
         """
-        analysis = self.analyze_municipality(municipality_name)
+        texts = None if documents is None else list(documents)
+        kind = "report" if include_recommendations else "report_brief"
+        return self._cached(kind, municipality_name, texts,
+                            lambda: self._report(municipality_name, include_recommendations, texts))
+
+    def _report(self, municipality_name: str, include_recommendations: bool,
+                documents: Optional[List[str]]) -> Dict[str, Any]:
+        analysis = self.analyze_municipality(municipality_name, documents)
 
         report = {
             "municipality": municipality_name,
@@ -167,6 +424,12 @@ class MunicipalityDatabase:
         """Initialize municipality database."""
         self.data_file = data_file
         self.municipalities = self._load_municipalities()
+        self._name_index = NameIndex(
+            (key, muni.get("name", ""))
+            for key, muni in self.municipalities.get("municipalities", {}).items()
+        )
+        from .municipality_table import MunicipalityTable
+        self._table = MunicipalityTable(self.municipalities.get("municipalities", {}))
         logger.info(f"📊 Municipality database loaded: {len(self.municipalities)} cities")
 
     def _load_municipalities(self) -> Dict[str, Any]:
@@ -178,54 +441,156 @@ class MunicipalityDatabase:
             logger.warning(f"Municipality data file not found: {self.data_file}")
             return {"municipalities": {}}
 
-    def get_municipality(self, name: str) -> Optional[Dict[str, Any]]:
-        """Get specific municipality data."""
+    def get_municipality(self, name: str, fuzzy: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get specific municipality data.
+
+        Schreibweisen werden normalisiert (München/Muenchen/MÜNCHEN). Mit
+        ``fuzzy`` wird ohne exakten Treffer der beste Kandidat der
+        Trigramm-Suche zurückgegeben.
+        """
         municipalities = self.municipalities.get("municipalities", {})
 
-        # Fuzzy search
-        for key, muni in municipalities.items():
-            if muni.get("name", "").lower() == name.lower():
-                return muni
+        keys = self._name_index.lookup(name)
+        if keys:
+            return municipalities[keys[0]]
+
+        if fuzzy:
+            candidates = self._name_index.search(name, limit=1)
+            if candidates:
+                return municipalities[candidates[0][0]]
 
         return None
 
+    def search_municipalities(self, query: str, limit: int = 5,
+                              min_score: float = 0.3) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Unscharfe Namenssuche mit gerankten Kandidaten.
+
+        Args:
+            query: Suchbegriff, z. B. eine Schreibvariante aus einem RIS-Dokument
+            limit: Maximale Anzahl Kandidaten
+            min_score: Mindest-Ähnlichkeit (0-1)
+
+        Returns:
+            Liste aus (Kommune, Score), absteigend nach Score
+        """
+        municipalities = self.municipalities.get("municipalities", {})
+        return [(municipalities[key], score)
+                for key, score in self._name_index.search(query, limit, min_score)]
+
     def filter_municipalities(self, 
                             bundesland: Optional[str] = None,
                             min_population: Optional[int] = None,
                             ris_system: Optional[str] = None,
                             api_available: Optional[bool] = None) -> List[Dict[str, Any]]:
-        """Filter municipalities by criteria."""
-        municipalities = list(self.municipalities.get("municipalities", {}).values())
-
-        if bundesland:
-            municipalities = [m for m in municipalities if m.get("bundesland") == bundesland]
-
-        if min_population:
-            municipalities = [m for m in municipalities if m.get("population", 0) >= min_population]
-
-        if ris_system:
-            municipalities = [m for m in municipalities if m.get("ris_system") == ris_system]
+        """
+        Filter municipalities by criteria.
 
-        if api_available is not None:
-            municipalities = [m for m in municipalities if m.get("api_available") == api_available]
+        Die Kriterien werden als Bitmasken über die spaltenorientierte
+        :class:`MunicipalityTable` kombiniert. Das Ergebnis ist eine Liste der
+        Kommunen-Dicts der Datenbank (keine Kopien).
+        """
+        return self._table.select(
+            self._table.mask(bundesland, min_population, ris_system, api_available)
+        )
+
+# Convenience Imports - erst beim ersten Zugriff geladen (PEP 562)
+_LAZY_IMPORTS = {
+    "QuantitativeNLPAnalyzer": ".nlp_analyzer",
+    "QualitativeStellenpladrivenAnalyzer": ".stellenplan_analyzer",
+    "MixedMethodsIntegrator": ".mixed_methods",
+    "ShardedAnalysisEngine": ".sharded_engine",
+}
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __package__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+class AnalyzerRegistry:
+    """
+    Prozessweite, vorgewärmte GovernanceAnalyzer-Instanzen je Konfigurationspfad.
 
-        return municipalities
+    Jede Konfiguration wird einmal geladen und danach wiederverwendet; der
+    Zugriff ist thread-sicher. ``reload()`` baut Instanzen nach Änderungen an
+    Konfiguration oder Modellen neu auf.
+    """
 
-# Convenience Imports
-from .nlp_analyzer import QuantitativeNLPAnalyzer
-from .stellenplan_analyzer import QualitativeStellenpladrivenAnalyzer  
-from .mixed_methods import MixedMethodsIntegrator
+    def __init__(
+        self, factory: Optional[Callable[[Optional[str]], GovernanceAnalyzer]] = None
+    ) -> None:
+        """
+        Args:
+            factory: Erzeugt einen Analyzer aus dem Konfigurationspfad
+                (Standard: :class:`GovernanceAnalyzer`)
+        """
+        self._factory = factory or GovernanceAnalyzer
+        self._instances: Dict[Optional[str], GovernanceAnalyzer] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(config_path: Optional[str]) -> Optional[str]:
+        return None if config_path is None else os.path.abspath(config_path)
+
+    def get(self, config_path: Optional[str] = None) -> GovernanceAnalyzer:
+        """Warme Instanz zur Konfiguration (beim ersten Aufruf erzeugt)."""
+        key = self._key(config_path)
+        analyzer = self._instances.get(key)
+        if analyzer is None:
+            with self._lock:
+                analyzer = self._instances.get(key)
+                if analyzer is None:
+                    analyzer = self._factory(config_path)
+                    self._instances[key] = analyzer
+        return analyzer
+
+    def reload(self, config_path: Optional[str] = None) -> GovernanceAnalyzer:
+        """Ersetze die Instanz zur Konfiguration durch eine neu geladene."""
+        key = self._key(config_path)
+        analyzer = self._factory(config_path)
+        with self._lock:
+            self._instances[key] = analyzer
+        logger.info(f"🔄 Analyzer reloaded: {config_path or 'default config'}")
+        return analyzer
+
+    def clear(self) -> None:
+        """Verwerfe alle Instanzen; die nächsten Aufrufe laden neu."""
+        with self._lock:
+            self._instances.clear()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+
+_registry = AnalyzerRegistry()
+
+def get_analyzer(config_path: Optional[str] = None) -> GovernanceAnalyzer:
+    """Shared, warm analyzer instance for the given configuration."""
+    return _registry.get(config_path)
+
+def reload_analyzers(config_path: Optional[str] = None) -> None:
+    """Reload one configuration, or all analyzers if no path is given."""
+    if config_path is None:
+        _registry.clear()
+    else:
+        _registry.reload(config_path)
 
 # Main API Functions
-def analyze_governance(municipality: str) -> Dict[str, Any]:
+def analyze_governance(municipality: str, config_path: Optional[str] = None) -> Dict[str, Any]:
     """Quick analysis function."""
-    analyzer = GovernanceAnalyzer()
-    return analyzer.analyze_municipality(municipality)
+    return get_analyzer(config_path).analyze_municipality(municipality)
 
-def compare_governance(municipalities: List[str]) -> pd.DataFrame:
+def compare_governance(municipalities: List[str],
+                       config_path: Optional[str] = None) -> pd.DataFrame:
     """Quick comparison function.""" 
-    analyzer = GovernanceAnalyzer()
-    return analyzer.compare_municipalities(municipalities)
+    return get_analyzer(config_path).compare_municipalities(municipalities)
 
 def get_municipalities_database() -> MunicipalityDatabase:
     """Get municipality database instance."""
@@ -237,7 +602,12 @@ __all__ = [
     "QuantitativeNLPAnalyzer",
     "QualitativeStellenpladrivenAnalyzer",
     "MixedMethodsIntegrator",
+    "AnalyzerRegistry",
+    "ShardedAnalysisEngine",
     "analyze_governance",
     "compare_governance", 
+    "configure_logging",
+    "get_analyzer",
+    "reload_analyzers",
     "get_municipalities_database"
 ]
@@ -0,0 +1,103 @@
+"""
+Startzeit-Budget für ``import governance_framework.core``.
+
+Misst den Import in einem frischen Interpreter mit ``python -X importtime`` und
+schlägt fehl, wenn die kumulierte Importzeit das Budget überschreitet oder ein
+schweres Paket (pandas, numpy, ML-Bibliotheken) schon beim Import geladen wird.
+
+Aufruf::
+
+    python -m governance_framework.importtime_budget --budget-ms 150
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import argparse
+import logging
+import subprocess
+import sys
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODULE = f"{__package__ or 'governance_framework'}.core"
+DEFAULT_BUDGET_MS = 150.0
+
+# Pakete, die erst bei Bedarf geladen werden dürfen
+HEAVY_MODULES = ("pandas", "numpy", "scipy", "sklearn", "torch", "transformers",
+                 "spacy", "bertopic", "matplotlib")
+
+
+def measure_import(module: str = DEFAULT_MODULE,
+                   python: str = sys.executable) -> Dict[str, float]:
+    """
+    Importiere ``module`` in einem frischen Interpreter.
+
+    Args:
+        module: Vollqualifizierter Modulname
+        python: Interpreter für die Messung
+
+    Returns:
+        Kumulierte Importzeit je Modul in Millisekunden
+    """
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import von {module} fehlgeschlagen:\n{result.stderr}")
+    return parse_importtime(result.stderr)
+
+
+def parse_importtime(output: str) -> Dict[str, float]:
+    """Kumulierte Zeiten (ms) aus der ``-X importtime``-Ausgabe."""
+    timings: Dict[str, float] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        timings[name.strip()] = int(cumulative) / 1000.0
+    return timings
+
+
+def check_budget(timings: Dict[str, float], module: str = DEFAULT_MODULE,
+                 budget_ms: float = DEFAULT_BUDGET_MS,
+                 forbidden: Sequence[str] = HEAVY_MODULES) -> Tuple[float, List[str]]:
+    """
+    Prüfe die Messung gegen Budget und Verbotsliste.
+
+    Returns:
+        Importzeit des Moduls (ms) und Liste der Verstöße (leer = ok)
+    """
+    total = timings.get(module, 0.0)
+    problems = []
+    if total > budget_ms:
+        problems.append(f"{module}: {total:.1f} ms > Budget {budget_ms:.1f} ms")
+    for name in forbidden:
+        if name in timings:
+            problems.append(f"{name} wird beim Import geladen ({timings[name]:.1f} ms)")
+    return total, problems
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Anzahl Messungen; gewertet wird die schnellste")
+    parser.add_argument("--top", type=int, default=10,
+                        help="Anzahl der teuersten Module in der Ausgabe")
+    args = parser.parse_args(argv)
+
+    runs = [measure_import(args.module) for _ in range(max(args.repeat, 1))]
+    timings = min(runs, key=lambda run: run.get(args.module, 0.0))
+    total, problems = check_budget(timings, args.module, args.budget_ms)
+
+    print(f"{args.module}: {total:.1f} ms (Budget {args.budget_ms:.1f} ms)")
+    for name, ms in sorted(timings.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {ms:8.1f} ms  {name}")
+    for problem in problems:
+        print(f"❌ {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+Keyword-Matching für die Governance-Dimensionen.
+Kompiliert alle Keywords und Stellenplan-Indikatoren in einen Aho-Corasick-Automaten,
+sodass jedes Dokument in einem einzigen Durchlauf über alle Dimensionen gezählt wird.
+"""
+
+from typing import Dict, List, Any, Tuple, Sequence
+from collections import deque
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (start, end, keyword, dimension) - Offsets beziehen sich auf den Originaltext
+KeywordHit = Tuple[int, int, str, str]
+
+DEFAULT_KEYWORD_FIELDS = ("keywords", "stellenplan_indicators")
+
+# Wortgrenzen-Modi: "prefix" - Treffer muss am Wortanfang beginnen (deutsche Komposita
+# wie "Digitalisierungsstrategie" zählen für "Digitalisierung"), "word" - ganzes Wort,
+# "none" - beliebiger Teilstring
+BOUNDARIES = ("prefix", "word", "none")
+
+# Keywords bis zu dieser Länge gelten auch im "prefix"-Modus nur als ganzes Wort
+SHORT_KEYWORD_LENGTH = 3
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick-Automat über alle Governance-Keywords.
+
+    Die Laufzeit eines Scans hängt nur von der Textlänge und der Anzahl der
+    Treffer ab, nicht von der Größe des Vokabulars. Gematcht wird
+    case-insensitiv. Standardmäßig muss ein Treffer am Wortanfang beginnen
+    (``boundary="prefix"``), damit Komposita mitgezählt werden
+    ("Bürgerbeteiligungsverfahren" für "Bürgerbeteiligung"), Wortinnenteile aber
+    nicht ("Beteiligung" nicht in "Bürgerbeteiligung"). Akronyme und kurze
+    Keywords (Großbuchstaben oder höchstens :data:`SHORT_KEYWORD_LENGTH`
+    Zeichen) zählen dabei nur als ganzes Wort ("SAP" nicht in "Sapporo", aber
+    in "SAP-Module"). Mit ``boundary="word"`` zählen nur ganze Wörter.
+    """
+
+    def __init__(self,
+                 governance_dimensions: Dict[str, Dict[str, Any]],
+                 fields: Sequence[str] = DEFAULT_KEYWORD_FIELDS,
+                 boundary: str = "prefix"):
+        """
+        Args:
+            governance_dimensions: Dimensionen wie in ``governance_keywords.json``
+            fields: Keyword-Listen je Dimension, die kompiliert werden
+            boundary: Wortgrenzen-Modus, einer von :data:`BOUNDARIES`
+        """
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"boundary must be one of {BOUNDARIES}, got {boundary!r}")
+        self.dimensions = list(governance_dimensions)
+        self.boundary = boundary
+
+        # Normalisiertes Keyword -> (Originalschreibweise, Dimensionen)
+        patterns: Dict[str, Tuple[str, List[str]]] = {}
+        for dim, config in governance_dimensions.items():
+            for field in fields:
+                for keyword in config.get(field, []):
+                    key = keyword.lower()
+                    if not key:
+                        continue
+                    original, dims = patterns.setdefault(key, (keyword, []))
+                    if dim not in dims:
+                        dims.append(dim)
+
+        self._patterns: List[Tuple[str, int, Tuple[str, ...], bool]] = [
+            (original, len(key), tuple(dims), self._is_whole_word(original))
+            for key, (original, dims) in patterns.items()
+        ]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        self._build(list(patterns))
+
+        logger.debug(f"Keyword automaton compiled: {len(self._patterns)} patterns, "
+                     f"{len(self._goto)} states")
+
+    def _build(self, keys: List[str]) -> None:
+        """Baue Trie, Fehlerlinks und Ausgabemengen (BFS über die Zustände)."""
+        for index, key in enumerate(keys):
+            state = 0
+            for char in key:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (index,)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    @property
+    def n_patterns(self) -> int:
+        """Anzahl der kompilierten (deduplizierten) Keywords."""
+        return len(self._patterns)
+
+    @property
+    def keywords(self) -> List[Tuple[str, Tuple[str, ...]]]:
+        """Kompilierte Keywords mit ihren Dimensionen, in Automaten-Reihenfolge."""
+        return [(keyword, dims) for keyword, _, dims, _ in self._patterns]
+
+    @staticmethod
+    def _is_whole_word(keyword: str) -> bool:
+        """Akronyme ("SAP", "CIO") und kurze Keywords nie als Wortanfang matchen."""
+        return keyword.isupper() or len(keyword) <= SHORT_KEYWORD_LENGTH
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Lowercase ohne Längenänderung, damit Offsets zum Original passen."""
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+    def find(self, text: str) -> List[KeywordHit]:
+        """
+        Finde alle Keyword-Vorkommen in einem einzigen Durchlauf.
+
+        Args:
+            text: Dokumenttext
+
+        Returns:
+            Liste von Treffern ``(start, end, keyword, dimension)``
+        """
+        lowered = self._normalize(text)
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self._patterns
+        check_start = self.boundary != "none"
+        check_end = self.boundary == "word"
+        check_whole_words = self.boundary == "prefix"
+        length = len(lowered)
+        hits: List[KeywordHit] = []
+
+        state = 0
+        for pos, char in enumerate(lowered):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not out[state]:
+                continue
+            end = pos + 1
+            for index in out[state]:
+                keyword, size, dims, whole_word = patterns[index]
+                start = end - size
+                if check_start and start > 0 and lowered[start - 1].isalnum():
+                    continue
+                if ((check_end or (check_whole_words and whole_word))
+                        and end < length and lowered[end].isalnum()):
+                    continue
+                for dim in dims:
+                    hits.append((start, end, keyword, dim))
+
+        hits.sort(key=lambda hit: (hit[0], hit[1]))
+        return hits
+
+    def scan(self, text: str) -> Dict[str, Any]:
+        """
+        Zähle Treffer je Dimension und liefere die Offsets mit.
+
+        Args:
+            text: Dokumenttext
+
+        Returns:
+            Dict mit ``counts`` (Dimension -> Anzahl) und ``hits``
+        """
+        hits = self.find(text)
+        counts = dict.fromkeys(self.dimensions, 0)
+        for _, _, _, dim in hits:
+            counts[dim] += 1
+        return {"counts": counts, "hits": hits}
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Zähle nur die Treffer je Dimension."""
+        return self.scan(text)["counts"]
+
+    def count_keywords(self, text: str) -> Dict[str, int]:
+        """Zähle Treffer je Keyword (jedes Vorkommen einmal, unabhängig von den Dimensionen)."""
+        counts: Dict[str, int] = {}
+        seen = set()
+        for start, end, keyword, _ in self.find(text):
+            if (start, end) not in seen:
+                seen.add((start, end))
+                counts[keyword] = counts.get(keyword, 0) + 1
+        return counts
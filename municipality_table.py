@@ -0,0 +1,82 @@
+"""
+Spaltenorientierte Sicht auf die Kommunen-Datenbank.
+Hält Bundesland, RIS-System, Einwohnerzahl und API-Verfügbarkeit als Arrays mit
+vorberechneten Indizes, sodass Filter als kombinierte Bitmasken ausgewertet werden.
+"""
+
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+
+class MunicipalityTable:
+    """
+    Spalten und Indizes über alle Kommunen.
+
+    - Bitmaps je Bundesland und je RIS-System
+    - Einwohnerzahlen sortiert für Binärsuche (``min_population``)
+    - API-Verfügbarkeit als boolesche Spalte (unbekannt zählt weder als ja noch nein)
+    """
+
+    def __init__(self, municipalities: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            municipalities: Schlüssel -> Kommunen-Dict wie in der JSON-Datenbank
+        """
+        self.records = list(municipalities.values())
+        n = len(self.records)
+
+        self.bundesland_bitmaps = self._bitmaps("bundesland")
+        self.ris_bitmaps = self._bitmaps("ris_system")
+
+        self.population = np.array(
+            [m.get("population", 0) or 0 for m in self.records], dtype=np.float64
+        )
+        self._population_order = np.argsort(self.population, kind="stable")
+        self._population_sorted = self.population[self._population_order]
+
+        api = [m.get("api_available") for m in self.records]
+        self.api_true = np.array([value is True for value in api], dtype=bool)
+        self.api_false = np.array([value is False for value in api], dtype=bool)
+        self._all = np.ones(n, dtype=bool)
+
+    def _bitmaps(self, field: str) -> Dict[Any, np.ndarray]:
+        bitmaps: Dict[Any, np.ndarray] = {}
+        for pos, muni in enumerate(self.records):
+            value = muni.get(field)
+            if value not in bitmaps:
+                bitmaps[value] = np.zeros(len(self.records), dtype=bool)
+            bitmaps[value][pos] = True
+        return bitmaps
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def population_mask(self, min_population: int) -> np.ndarray:
+        """Maske aller Kommunen mit mindestens ``min_population`` Einwohnern."""
+        start = np.searchsorted(self._population_sorted, min_population, side="left")
+        mask = np.zeros(len(self.records), dtype=bool)
+        mask[self._population_order[start:]] = True
+        return mask
+
+    def mask(self,
+             bundesland: Optional[str] = None,
+             min_population: Optional[int] = None,
+             ris_system: Optional[str] = None,
+             api_available: Optional[bool] = None) -> np.ndarray:
+        """Kombinierte Filtermaske; Kriterien mit ``None`` (bzw. leer/0) entfallen."""
+        mask = self._all.copy()
+        empty = np.zeros(len(self.records), dtype=bool)
+        if bundesland:
+            mask &= self.bundesland_bitmaps.get(bundesland, empty)
+        if min_population:
+            mask &= self.population_mask(min_population)
+        if ris_system:
+            mask &= self.ris_bitmaps.get(ris_system, empty)
+        if api_available is not None:
+            mask &= self.api_true if api_available else self.api_false
+        return mask
+
+    def select(self, mask: np.ndarray) -> List[Dict[str, Any]]:
+        """Alle Einträge, deren Maske gesetzt ist (die Original-Dicts, keine Kopien)."""
+        records = self.records
+        return [records[pos] for pos in np.flatnonzero(mask)]
@@ -0,0 +1,104 @@
+"""
+Namensindex für Kommunen.
+Normalisiert Schreibweisen (München/Muenchen/MÜNCHEN) für exakte Treffer und
+bietet über einen Trigramm-Index eine unscharfe Suche mit gerankten Kandidaten.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+from collections import Counter
+import re
+import unicodedata
+
+# Umlaute vor der Unicode-Zerlegung transliterieren, damit "ü" und "ue" zusammenfallen
+_TRANSLITERATION = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+# (Schlüssel, Score) - Score ist der Dice-Koeffizient der Trigramme
+NameCandidate = Tuple[str, float]
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalisiere einen Kommunennamen für den Vergleich.
+
+    Casefolding, Transliteration der Umlaute, Entfernen diakritischer Zeichen
+    und Vereinheitlichung von Trennzeichen ("Halle (Saale)" -> "halle saale").
+    """
+    folded = name.casefold().translate(_TRANSLITERATION)
+    decomposed = unicodedata.normalize("NFKD", folded)
+    ascii_name = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _SEPARATORS.sub(" ", ascii_name).strip()
+
+
+def trigrams(normalized: str) -> Counter:
+    """Trigramme eines normalisierten Namens (mit Randmarkierung)."""
+    padded = f"  {normalized} "
+    return Counter(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class NameIndex:
+    """
+    Exakter und unscharfer Index über Kommunennamen.
+
+    Wird einmal beim Laden aufgebaut; exakte Abfragen kosten O(1), unscharfe
+    Abfragen nur die Postings der Trigramme des Suchbegriffs statt eines
+    Scans über alle Namen.
+    """
+
+    def __init__(self, names: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            names: Paare aus Schlüssel und Anzeigename
+        """
+        self._exact: Dict[str, List[str]] = {}
+        self._postings: Dict[str, List[Tuple[str, int]]] = {}
+        self._sizes: Dict[str, int] = {}
+
+        for key, name in names:
+            normalized = normalize_name(name)
+            if not normalized:
+                continue
+            self._exact.setdefault(normalized, []).append(key)
+            if key in self._sizes:
+                continue
+            grams = trigrams(normalized)
+            self._sizes[key] = sum(grams.values())
+            for gram, count in grams.items():
+                self._postings.setdefault(gram, []).append((key, count))
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def lookup(self, name: str) -> List[str]:
+        """Schlüssel aller Einträge mit gleichem normalisierten Namen."""
+        return list(self._exact.get(normalize_name(name), ()))
+
+    def search(self, query: str, limit: int = 5, min_score: float = 0.3) -> List[NameCandidate]:
+        """
+        Unscharfe Suche über Trigramme.
+
+        Args:
+            query: Suchbegriff, z. B. eine Schreibvariante aus einem RIS-Dokument
+            limit: Maximale Anzahl Kandidaten
+            min_score: Mindest-Ähnlichkeit (Dice-Koeffizient, 0-1)
+
+        Returns:
+            Kandidaten als (Schlüssel, Score), absteigend nach Score
+        """
+        grams = trigrams(normalize_name(query))
+        query_size = sum(grams.values())
+        if not query_size:
+            return []
+
+        shared: Counter = Counter()
+        for gram, count in grams.items():
+            for key, key_count in self._postings.get(gram, ()):
+                shared[key] += min(count, key_count)
+
+        candidates = [
+            (key, 2.0 * overlap / (query_size + self._sizes[key]))
+            for key, overlap in shared.items()
+        ]
+        candidates = [c for c in candidates if c[1] >= min_score]
+        candidates.sort(key=lambda c: (-c[1], c[0]))
+        return candidates[:limit]
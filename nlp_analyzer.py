@@ -0,0 +1,56 @@
+"""
+Quantitative NLP-Analyse für Governance-Diskurse.
+Extrahiert Governance-Keywords aus RIS-Dokumenten über alle 4 Dimensionen.
+"""
+
+from typing import Dict, Any
+import json
+import logging
+
+from .keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+class QuantitativeNLPAnalyzer:
+    """
+    Quantitative Phase des Mixed-Methods-Designs.
+
+    Zählt Governance-Keywords und Stellenplan-Indikatoren in RIS-Dokumenten.
+    Alle Dimensionen werden über einen gemeinsamen Keyword-Automaten in einem
+    Durchlauf pro Dokument erfasst.
+    """
+
+    def __init__(self, keywords_file: str = "config/governance_keywords.json"):
+        """Initialize Quantitative NLP Analyzer."""
+        self.keywords_file = keywords_file
+        self.keyword_config = self._load_keywords()
+        self.governance_dimensions = self.keyword_config.get("governance_dimensions", {})
+        self.matcher = KeywordMatcher(self.governance_dimensions)
+
+        logger.info(f"🔍 Quantitative NLP Analyzer initialized: "
+                    f"{self.matcher.n_patterns} keywords")
+
+    def _load_keywords(self) -> Dict[str, Any]:
+        """Load keyword configuration from JSON file."""
+        try:
+            with open(self.keywords_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            logger.warning(f"Keyword file not found: {self.keywords_file}")
+            return {"governance_dimensions": {}}
+
+    def extract_governance_keywords(self,
+                                    documents: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Extrahiere Governance-Keywords aus RIS-Dokumenten.
+
+        Args:
+            documents: Dict Dokument-ID -> Dokumenttext
+
+        Returns:
+            Dict Dokument-ID -> ``{"counts": {Dimension: Anzahl},
+            "hits": [(start, end, keyword, dimension), ...]}``
+        """
+        logger.info(f"Extracting governance keywords from {len(documents)} documents")
+
+        return {doc_id: self.matcher.scan(text) for doc_id, text in documents.items()}
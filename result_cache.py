@@ -0,0 +1,178 @@
+"""
+Persistenter Ergebnis-Cache für Governance-Analysen.
+Ergebnisse werden inhaltsadressiert abgelegt: Der Schlüssel ergibt sich aus Kommune,
+Hash des Dokumentkorpus und Hash der Dimensions-Konfiguration. Ändert sich der
+Korpus oder die Konfiguration, entsteht automatisch ein neuer Schlüssel.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def config_hash(governance_dimensions: Dict[str, Any]) -> str:
+    """Hash der Dimensions-Konfiguration (unabhängig von der Schlüsselreihenfolge)."""
+    payload = json.dumps(governance_dimensions, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def corpus_hash(documents: Iterable[str]) -> str:
+    """Hash eines Dokument-Snapshots (Reihenfolge und Inhalt der Texte)."""
+    digest = hashlib.sha256()
+    for text in documents:
+        encoded = text.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "little"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    LRU-begrenzter Ergebnis-Cache auf SQLite-Basis.
+
+    Die Einträge überleben Prozessneustarts (Dashboards, Notebooks); mit
+    ``path=":memory:"`` bleibt der Cache im Prozess. Zugriffe sind
+    thread-sicher. ``stats()`` liefert Treffer-, Fehl- und Verdrängungszähler
+    für das Monitoring.
+
+    Die LRU-Reihenfolge beruht auf Zeitstempeln, damit mehrere Prozesse
+    dieselbe Datei teilen können. Treffer sind reine Lesezugriffe: Ihre
+    Zugriffszeiten werden gesammelt und gebündelt geschrieben (spätestens vor
+    einer Verdrängung und beim Schließen).
+    """
+
+    def __init__(self, path: str = "data/cache/results.sqlite", max_entries: int = 10000,
+                 touch_batch: int = 64):
+        """
+        Args:
+            path: SQLite-Datei (oder ``":memory:"``)
+            max_entries: Maximale Anzahl Einträge; darüber werden die am
+                längsten nicht genutzten verdrängt
+            touch_batch: Anzahl gesammelter Zugriffszeiten, ab der sie in die
+                Datenbank geschrieben werden
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = path
+        self.max_entries = max_entries
+        self.touch_batch = max(touch_batch, 1)
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY, kind TEXT, municipality TEXT,"
+            " value TEXT, last_access INTEGER)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS results_access ON results (last_access)"
+        )
+        self._conn.commit()
+        self._touched: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(kind: str, municipality: str, corpus: str, config: str) -> str:
+        """Inhaltsadresse eines Ergebnisses."""
+        payload = "\0".join((kind, municipality, corpus, config))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _flush_touched(self) -> None:
+        """Schreibe gesammelte Zugriffszeiten (Aufrufer hält den Lock)."""
+        if not self._touched:
+            return
+        self._conn.executemany(
+            "UPDATE results SET last_access = MAX(last_access, ?) WHERE key = ?",
+            [(stamp, key) for key, stamp in self._touched.items()],
+        )
+        self._conn.commit()
+        self._touched.clear()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Ergebnis zum Schlüssel oder ``None``; ein Treffer zählt als Zugriff."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = time.time()
+            if len(self._touched) >= self.touch_batch:
+                self._flush_touched()
+            return json.loads(row[0])
+
+    def put(self, key: str, value: Any, kind: str = "", municipality: str = "") -> None:
+        """Speichere ein (JSON-serialisierbares) Ergebnis und verdränge ggf. alte Einträge."""
+        payload = json.dumps(value, ensure_ascii=False, default=float)
+        with self._lock:
+            self._touched.pop(key, None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (key, kind, municipality, payload, time.time()),
+            )
+            excess = len(self) - self.max_entries
+            if excess > 0:
+                self._flush_touched()
+                self._conn.execute(
+                    "DELETE FROM results WHERE key IN ("
+                    " SELECT key FROM results ORDER BY last_access LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
+            self._conn.commit()
+
+    def invalidate(self, municipality: Optional[str] = None,
+                   kind: Optional[str] = None) -> int:
+        """
+        Entferne Einträge explizit.
+
+        Args:
+            municipality: Nur Einträge dieser Kommune (Standard: alle)
+            kind: Nur Einträge dieser Art, z. B. ``"analysis"`` (Standard: alle)
+
+        Returns:
+            Anzahl entfernter Einträge
+        """
+        clauses, params = [], []
+        if municipality is not None:
+            clauses.append("municipality = ?")
+            params.append(municipality)
+        if kind is not None:
+            clauses.append("kind = ?")
+            params.append(kind)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            removed = self._conn.execute(f"DELETE FROM results{where}", params).rowcount
+            self._conn.commit()
+        logger.info(f"🗑️ Result cache invalidated: {removed} entries")
+        return removed
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """Zähler für das Monitoring."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touched()
+            self._conn.close()
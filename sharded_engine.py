@@ -0,0 +1,223 @@
+"""
+Parallele Ausführung von Governance-Analysen über viele Kommunen.
+Teilt die Kommunen in Shards auf, bewertet sie in einem Prozess-Pool, legt je
+Shard eine Ergebnisdatei ab und führt die Dateien am Ende zusammen.
+"""
+
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from .core import get_analyzer
+
+logger = logging.getLogger(__name__)
+
+# Spalten mit festen Kategorien (siehe GovernanceAnalyzer._scores_frame)
+CATEGORY_COLUMNS = ("data_quality", "methodology")
+
+
+class ShardTask(NamedTuple):
+    """Arbeitspaket eines Workers."""
+    shard_id: int
+    municipalities: List[str]
+    documents: Optional[Dict[str, List[str]]]
+    config_path: Optional[str]
+    output_path: str
+    attempt: int = 0
+
+
+def run_shard(task: ShardTask) -> str:
+    """
+    Bewerte einen Shard und schreibe das Ergebnis atomar in ``task.output_path``.
+
+    Läuft im Worker-Prozess; der Analyzer je Konfiguration wird über
+    :func:`get_analyzer` einmal pro Prozess geladen und für alle weiteren
+    Shards wiederverwendet.
+    """
+    analyzer = get_analyzer(task.config_path)
+    frame = analyzer.compare_municipalities(task.municipalities, task.documents)
+    tmp_path = f"{task.output_path}.tmp"
+    frame.to_pickle(tmp_path)
+    os.replace(tmp_path, task.output_path)
+    return task.output_path
+
+
+def _init_worker() -> None:
+    # Geforkte Worker erben den Zufallszustand des Elternprozesses; ohne neuen
+    # Seed würden alle Shards dieselben simulierten Scores erhalten
+    import numpy as np
+    np.random.seed()
+
+
+def merge_shards(paths: Sequence[str]) -> pd.DataFrame:
+    """Führe Shard-Ergebnisse in Shard-Reihenfolge zu einem DataFrame zusammen."""
+    frame = pd.concat([pd.read_pickle(path) for path in paths], ignore_index=True)
+    for column in CATEGORY_COLUMNS:
+        if column in frame:
+            frame[column] = frame[column].astype("category")
+    return frame
+
+
+class ShardedAnalysisEngine:
+    """
+    Prozess-Pool-Ausführung von :meth:`GovernanceAnalyzer.compare_municipalities`.
+
+    - Kommunen werden in Shards fester Größe zerlegt
+    - Es sind höchstens ``max_pending`` Shards gleichzeitig eingereiht
+      (begrenzte Arbeitswarteschlange, auch bei sehr vielen Kommunen)
+    - Jeder Shard schreibt eine eigene Ergebnisdatei in ein Verzeichnis je Lauf;
+      ``run()`` führt sie zusammen und entfernt das Verzeichnis danach
+    - Fehlgeschlagene Shards werden bis zu ``max_retries`` Mal neu eingereiht
+    - Nach dem Absturz eines Workers laufen die betroffenen Shards einzeln
+      weiter, damit nur der verursachende Shard eine Wiederholung verbraucht
+    """
+
+    def __init__(self,
+                 config_path: Optional[str] = None,
+                 n_workers: Optional[int] = None,
+                 shard_size: int = 50,
+                 max_pending: Optional[int] = None,
+                 max_retries: int = 2,
+                 output_dir: Optional[str] = None,
+                 shard_worker: Callable[[ShardTask], str] = run_shard):
+        """
+        Args:
+            config_path: Konfiguration der Analyzer in den Workern
+            n_workers: Anzahl Prozesse (Standard: Anzahl CPU-Kerne)
+            shard_size: Kommunen je Shard
+            max_pending: Maximal gleichzeitig eingereihte Shards
+                (Standard: doppelte Anzahl Worker)
+            max_retries: Wiederholungen je fehlgeschlagenem Shard
+            output_dir: Elternverzeichnis der Laufverzeichnisse mit den
+                Shard-Ergebnisdateien (Standard: temporäres Verzeichnis des Systems)
+            shard_worker: Funktion, die einen Shard ausführt und den Pfad der
+                Ergebnisdatei zurückgibt (muss picklebar sein)
+        """
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        self.config_path = config_path
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.max_pending = max(max_pending or 2 * self.n_workers, 1)
+        self.max_retries = max_retries
+        self.output_dir = output_dir
+        self.shard_worker = shard_worker
+
+    def make_shards(self,
+                    municipality_names: Sequence[str],
+                    run_dir: Path,
+                    documents: Optional[Mapping[str, Iterable[str]]] = None) -> List[ShardTask]:
+        """Zerlege die Kommunen in Arbeitspakete mit Ergebnisdateien in ``run_dir``."""
+        tasks = []
+        for shard_id, start in enumerate(range(0, len(municipality_names), self.shard_size)):
+            names = list(municipality_names[start:start + self.shard_size])
+            shard_docs = None
+            if documents is not None:
+                shard_docs = {name: list(documents.get(name, ())) for name in names}
+            output_path = run_dir / f"shard_{shard_id:05d}.pkl"
+            tasks.append(ShardTask(shard_id, names, shard_docs, self.config_path,
+                                   str(output_path)))
+        return tasks
+
+    def run(self,
+            municipality_names: Sequence[str],
+            documents: Optional[Mapping[str, Iterable[str]]] = None) -> pd.DataFrame:
+        """
+        Bewerte alle Kommunen parallel.
+
+        Args:
+            municipality_names: Zu bewertende Kommunen
+            documents: Optional Dokumenttexte je Kommune (wie bei
+                :meth:`GovernanceAnalyzer.compare_municipalities`)
+
+        Returns:
+            DataFrame mit einer Zeile je Kommune, in Eingabereihenfolge
+
+        Raises:
+            RuntimeError: Wenn Shards auch nach allen Wiederholungen fehlschlagen
+        """
+        if self.output_dir is not None:
+            Path(self.output_dir).mkdir(parents=True, exist_ok=True)
+        # Eigenes Verzeichnis je Lauf: parallele Läufe überschreiben sich nicht
+        # gegenseitig, und Dateien früherer Läufe werden nie mitgelesen
+        run_dir = Path(tempfile.mkdtemp(prefix="shards_", dir=self.output_dir))
+        try:
+            tasks = self.make_shards(municipality_names, run_dir, documents)
+            logger.info(f"🚀 Analyzing {len(municipality_names)} municipalities in "
+                        f"{len(tasks)} shards on {self.n_workers} workers")
+
+            paths = self._execute(tasks)
+            failed = sorted(set(range(len(tasks))) - set(paths))
+            if failed:
+                raise RuntimeError(f"Shards failed after {self.max_retries} retries: {failed}")
+
+            if not tasks:
+                return get_analyzer(self.config_path).compare_municipalities([], documents)
+            result = merge_shards([paths[task.shard_id] for task in tasks])
+        finally:
+            shutil.rmtree(run_dir, ignore_errors=True)
+        logger.info(f"✅ Merged {len(tasks)} shards ({len(result)} municipalities)")
+        return result
+
+    def _execute(self, tasks: List[ShardTask]) -> Dict[int, str]:
+        """Führe die Shards aus; liefert Shard-ID -> Ergebnisdatei der erfolgreichen Shards."""
+        queue = list(reversed(tasks))
+        # Shards, die beim Absturz eines Workers liefen; welcher ihn verursacht
+        # hat, ist unbekannt, daher laufen sie danach einzeln
+        suspects: List[ShardTask] = []
+        paths: Dict[int, str] = {}
+        pending: Dict[Future, ShardTask] = {}
+        executor = ProcessPoolExecutor(self.n_workers, initializer=_init_worker)
+        try:
+            while queue or suspects or pending:
+                # Verdächtige gibt es nur nach einem Absturz, also bei leerem Pool
+                isolated = bool(suspects)
+                if isolated:
+                    task = suspects.pop()
+                    pending[executor.submit(self.shard_worker, task)] = task
+                while not isolated and queue and len(pending) < self.max_pending:
+                    task = queue.pop()
+                    pending[executor.submit(self.shard_worker, task)] = task
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                broken = False
+                for future in done:
+                    task = pending.pop(future)
+                    try:
+                        paths[task.shard_id] = future.result()
+                    except BrokenProcessPool as e:
+                        broken = True
+                        if isolated:
+                            # Allein gelaufen: dieser Shard hat den Worker beendet
+                            self._retry(task, e, suspects)
+                        else:
+                            suspects.append(task)
+                    except Exception as e:
+                        self._retry(task, e, queue)
+
+                if broken:
+                    # Ein abgestürzter Worker macht den ganzen Pool unbrauchbar
+                    suspects.extend(pending.values())
+                    pending.clear()
+                    executor.shutdown(wait=False)
+                    executor = ProcessPoolExecutor(self.n_workers, initializer=_init_worker)
+        finally:
+            executor.shutdown(wait=True)
+        return paths
+
+    def _retry(self, task: ShardTask, error: Exception, queue: List[ShardTask]) -> None:
+        if task.attempt >= self.max_retries:
+            logger.error(f"❌ Shard {task.shard_id} failed: {error}")
+            return
+        logger.warning(f"⚠️ Shard {task.shard_id} failed (attempt {task.attempt + 1}), "
+                       f"retrying: {error}")
+        queue.append(task._replace(attempt=task.attempt + 1))
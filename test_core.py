@@ -0,0 +1,246 @@
+import json
+import os
+import time
+
+import pytest
+
+import numpy as np
+
+from concurrent.futures import ThreadPoolExecutor
+
+from governance_framework.core import (
+    AnalyzerRegistry,
+    GovernanceAnalyzer,
+    MunicipalityDatabase,
+)
+from governance_framework.importtime_budget import check_budget, measure_import
+from governance_framework.result_cache import ResultCache
+from governance_framework.sharded_engine import ShardedAnalysisEngine, run_shard
+
+
+MUNICIPALITIES = {
+    "muenchen": {"name": "München", "bundesland": "Bayern", "population": 1500000,
+                 "ris_system": "SessionNet", "api_available": False},
+    "koeln": {"name": "Köln", "bundesland": "Nordrhein-Westfalen", "population": 1100000,
+              "ris_system": "SessionNet", "api_available": True},
+    "kiel": {"name": "Kiel", "bundesland": "Schleswig-Holstein", "population": 247000,
+             "ris_system": "ALLRIS", "api_available": True},
+    "moenchengladbach": {"name": "Mönchengladbach", "bundesland": "Nordrhein-Westfalen",
+                         "population": 260000, "ris_system": "ALLRIS",
+                         "api_available": False},
+}
+
+
+@pytest.fixture
+def database(tmp_path):
+    data_file = tmp_path / "municipalities.json"
+    data_file.write_text(json.dumps({"municipalities": MUNICIPALITIES}), encoding="utf-8")
+    return MunicipalityDatabase(str(data_file))
+
+
+@pytest.mark.parametrize("name", ["München", "Muenchen", "MÜNCHEN", " münchen "])
+def test_get_municipality_normalizes_spelling(database, name):
+    assert database.get_municipality(name)["name"] == "München"
+
+
+def test_fuzzy_lookup_ranks_candidates(database):
+    assert database.get_municipality("Munchen") is None
+    assert database.get_municipality("Munchen", fuzzy=True)["name"] == "München"
+
+    candidates = database.search_municipalities("Mönchengladbch")
+    assert candidates[0][0]["name"] == "Mönchengladbach"
+    assert [score for _, score in candidates] == sorted(
+        (score for _, score in candidates), reverse=True
+    )
+
+
+def test_filter_municipalities_combines_masks(database):
+    selection = database.filter_municipalities(bundesland="Nordrhein-Westfalen",
+                                               min_population=250000)
+
+    assert [m["name"] for m in selection] == ["Köln", "Mönchengladbach"]
+    assert selection[0] is database.municipalities["municipalities"]["koeln"]
+    assert database.filter_municipalities(ris_system="ALLRIS", api_available=True) \
+        == [database.municipalities["municipalities"]["kiel"]]
+    assert isinstance(selection, list)
+    assert json.loads(json.dumps(selection)) == selection
+    assert database.filter_municipalities(bundesland="Hessen") == []
+    assert len(database.filter_municipalities()) == 4
+
+
+def test_batch_scores_from_keyword_counts():
+    analyzer = GovernanceAnalyzer()
+    documents = {
+        "Kiel": ["Open Source statt Microsoft: Kiel setzt auf Linux.", "Open Data Portal"],
+        "München": ["SAP und Microsoft bleiben gesetzt."],
+        "Köln": [],
+    }
+
+    result = analyzer.compare_municipalities(list(documents), documents=documents)
+
+    assert list(result["municipality"]) == ["Kiel", "München", "Köln"]
+    assert str(result["municipality"].dtype) == "string"
+    assert result["data_quality"].dtype == "category"
+    kiel, muenchen, koeln = result.set_index("municipality").to_dict("index").values()
+    assert kiel["souveraenitaet"] > 0 and kiel["legitimation"] > 0
+    assert muenchen["macht"] == 1 - np.exp(-2 / 2.0)
+    assert koeln["overall_score"] == 0.0
+
+
+def test_simulated_comparison_keeps_columns():
+    result = GovernanceAnalyzer().compare_municipalities(["Kiel", "Köln"])
+
+    assert list(result.columns) == ["municipality", "timestamp", "overall_score",
+                                    "data_quality", "methodology", "macht",
+                                    "legitimation", "institution", "souveraenitaet"]
+    assert result["macht"].between(0.3, 0.95).all()
+
+
+def test_result_cache_is_content_addressed(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.sqlite"), max_entries=2)
+    analyzer = GovernanceAnalyzer(cache=cache)
+    docs = ["Open Source und Linux"]
+
+    first = analyzer.analyze_municipality("Kiel", docs)
+    assert analyzer.analyze_municipality("Kiel", docs) == first
+    analyzer.analyze_municipality("Kiel", docs + ["Open Data"])
+    assert cache.stats() == {"hits": 1, "misses": 2, "evictions": 0, "entries": 2}
+
+    analyzer.governance_dimensions["macht"]["keywords"].append("Oracle")
+    oracle = analyzer.analyze_municipality("Kiel", ["Oracle"])
+    assert cache.stats()["misses"] == 3 and cache.stats()["evictions"] == 1
+    assert oracle["governance_scores"]["macht"] > 0  # neuer Automat, nicht der alte
+
+    reopened = GovernanceAnalyzer(cache=ResultCache(str(tmp_path / "results.sqlite")))
+    report = reopened.generate_governance_report("Kiel", documents=docs)
+    assert reopened.generate_governance_report("Kiel", documents=docs) == report
+    assert reopened.cache.invalidate(kind="report") == 1
+    assert reopened.cache.invalidate(municipality="Kiel") == 3
+    assert len(reopened.cache) == 0
+
+    reopened.analyze_municipality("Kiel")
+    assert len(reopened.cache) == 0  # simulierte Scores werden nicht gecacht
+
+
+def test_result_cache_batches_access_times(tmp_path):
+    path = str(tmp_path / "results.sqlite")
+    cache = ResultCache(path, max_entries=2, touch_batch=10)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    stamps = dict(cache._conn.execute("SELECT key, last_access FROM results"))
+
+    assert cache.get("a") == 1
+    assert dict(cache._conn.execute("SELECT key, last_access FROM results")) == stamps
+
+    # Eine zweite Instanz (z. B. ein anderer Prozess) verdrängt nach Zeitstempeln;
+    # der gesammelte Zugriff auf "a" wird vorher geschrieben
+    cache.close()
+    other = ResultCache(path, max_entries=2)
+    other.put("c", 3)
+    assert other.get("a") == 1 and other.get("b") is None
+
+
+def test_registry_shares_warm_instances(tmp_path):
+    created = []
+
+    def factory(config_path):
+        created.append(config_path)
+        return GovernanceAnalyzer(config_path)
+
+    registry = AnalyzerRegistry(factory)
+    config = str(tmp_path / "settings.yaml")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        analyzers = list(pool.map(lambda _: registry.get(config), range(32)))
+
+    assert len(created) == 1 and all(a is analyzers[0] for a in analyzers)
+    assert registry.get(None) is not analyzers[0]
+    reloaded = registry.reload(config)
+    assert reloaded is not analyzers[0] and registry.get(config) is reloaded
+    assert len(created) == 3
+
+
+def test_registry_reload_reads_dimensions_from_config(tmp_path):
+    config = tmp_path / "governance_keywords.json"
+    dimension = {"description": "Test", "keywords": ["Linux"], "color": "#000000"}
+    config.write_text(json.dumps({"governance_dimensions": {"souveraenitaet": dimension}}),
+                      encoding="utf-8")
+    registry = AnalyzerRegistry()
+    assert list(registry.get(str(config)).governance_dimensions) == ["souveraenitaet"]
+    assert len(registry.get(None).governance_dimensions) == 4
+
+    config.write_text(json.dumps({"governance_dimensions": {"macht": dimension}}),
+                      encoding="utf-8")
+    assert list(registry.get(str(config)).governance_dimensions) == ["souveraenitaet"]
+    reloaded = registry.reload(str(config))
+    assert list(reloaded.governance_dimensions) == ["macht"]
+    assert reloaded.nlp_analyzer is reloaded.nlp_analyzer
+    assert list(reloaded.nlp_analyzer.governance_dimensions) == ["macht"]
+
+
+def test_core_import_defers_heavy_modules():
+    timings = measure_import("governance_framework.core")
+    total, problems = check_budget(timings, "governance_framework.core", budget_ms=float("inf"))
+    assert total > 0
+    assert problems == []
+
+
+def test_lazy_convenience_import():
+    import governance_framework.core as core
+
+    from governance_framework.mixed_methods import MixedMethodsIntegrator
+
+    assert core.MixedMethodsIntegrator is MixedMethodsIntegrator
+    assert "QuantitativeNLPAnalyzer" in dir(core)
+    with pytest.raises(AttributeError):
+        core.DoesNotExist
+
+
+def _flaky_shard(task):
+    if task.shard_id == 1 and task.attempt == 0:
+        raise RuntimeError("worker failure")
+    return run_shard(task)
+
+
+def _broken_shard(task):
+    raise RuntimeError("worker failure")
+
+
+def _poison_shard(task):
+    if task.shard_id == 1:
+        os._exit(1)
+    time.sleep(0.2)
+    return run_shard(task)
+
+
+def test_sharded_engine_matches_sequential_scores(tmp_path):
+    names = [f"Kommune {i}" for i in range(7)]
+    documents = {name: ["Open Source und Linux"] * (i + 1) + ["SAP Vendor"]
+                 for i, name in enumerate(names)}
+    engine = ShardedAnalysisEngine(n_workers=2, shard_size=3, max_pending=1,
+                                   output_dir=str(tmp_path), shard_worker=_flaky_shard)
+
+    result = engine.run(names, documents)
+    expected = GovernanceAnalyzer().compare_municipalities(names, documents)
+
+    assert list(tmp_path.iterdir()) == []
+    assert list(result["municipality"]) == names
+    assert result.dtypes.equals(expected.dtypes)
+    dims = list(GovernanceAnalyzer().governance_dimensions) + ["overall_score"]
+    np.testing.assert_allclose(result[dims].to_numpy(), expected[dims].to_numpy())
+
+
+def test_sharded_engine_reports_failed_shards(tmp_path):
+    engine = ShardedAnalysisEngine(n_workers=1, shard_size=2, max_retries=1,
+                                   output_dir=str(tmp_path), shard_worker=_broken_shard)
+
+    with pytest.raises(RuntimeError, match=r"\[0, 1\]"):
+        engine.run(["A", "B", "C"])
+
+
+def test_sharded_engine_charges_crashes_to_the_crashing_shard(tmp_path):
+    engine = ShardedAnalysisEngine(n_workers=2, shard_size=1, max_pending=4, max_retries=1,
+                                   output_dir=str(tmp_path), shard_worker=_poison_shard)
+
+    with pytest.raises(RuntimeError, match=r"\[1\]"):
+        engine.run(["A", "B", "C", "D"])
+    assert list(tmp_path.iterdir()) == []
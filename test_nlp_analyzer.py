@@ -0,0 +1,58 @@
+import json
+
+from governance_framework.keyword_matcher import KeywordMatcher
+from governance_framework.nlp_analyzer import QuantitativeNLPAnalyzer
+
+
+DIMENSIONS = {
+    "macht": {"keywords": ["SAP", "Microsoft"], "stellenplan_indicators": ["IT-Leiter"]},
+    "legitimation": {"keywords": ["Bürgerbeteiligung", "Beteiligung"],
+                     "stellenplan_indicators": ["Bürgerbeteiligung"]},
+}
+
+
+def test_keyword_matcher_counts_and_offsets():
+    matcher = KeywordMatcher(DIMENSIONS, boundary="word")
+    text = "Die IT-Leiterin? Nein: der IT-Leiter prüft SAP und Microsoft, nicht Sapporo."
+
+    result = matcher.scan(text)
+
+    assert result["counts"] == {"macht": 3, "legitimation": 0}
+    for start, end, keyword, _ in result["hits"]:
+        assert text[start:end].lower() == keyword.lower()
+
+
+def test_keyword_matcher_counts_compound_words():
+    matcher = KeywordMatcher(DIMENSIONS)
+    text = "Das Bürgerbeteiligungsverfahren nutzt SAP-Module und tagt in Sapporo."
+
+    keywords = [kw for _, _, kw, _ in matcher.find(text)]
+
+    # Präfix am Wortanfang zählt (Kompositum), Wortinnenteil "beteiligung" nicht;
+    # das Akronym "SAP" nur als ganzes Wort, also nicht in "Sapporo"
+    assert keywords == ["Bürgerbeteiligung", "SAP"]
+    assert KeywordMatcher(DIMENSIONS, boundary="word").count(text) == {
+        "macht": 1, "legitimation": 0}
+
+
+def test_keyword_matcher_deduplicates_across_fields():
+    matcher = KeywordMatcher(DIMENSIONS)
+
+    hits = matcher.find("Mehr BÜRGERBETEILIGUNG und Beteiligung")
+
+    assert [(kw, dim) for _, _, kw, dim in hits] == [
+        ("Bürgerbeteiligung", "legitimation"),
+        ("Beteiligung", "legitimation"),
+    ]
+
+
+def test_extract_governance_keywords(tmp_path):
+    keywords_file = tmp_path / "governance_keywords.json"
+    keywords_file.write_text(json.dumps({"governance_dimensions": DIMENSIONS}),
+                             encoding="utf-8")
+    analyzer = QuantitativeNLPAnalyzer(str(keywords_file))
+
+    result = analyzer.extract_governance_keywords({"kiel_2023_01": "SAP-Lizenzen"})
+
+    assert result["kiel_2023_01"]["counts"]["macht"] == 1
+    assert result["kiel_2023_01"]["hits"] == [(0, 3, "SAP", "macht")]
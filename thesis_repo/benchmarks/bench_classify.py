@@ -0,0 +1,45 @@
+"""
+Benchmark der Klassifikation: zeilenweises ``apply`` gegen den Batch‑Modus.
+
+Aufruf aus dem Projektroot::
+
+    python benchmarks/bench_classify.py --rows 10000000 --categories 3000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+base_dir = Path(__file__).resolve().parents[1]
+if str(base_dir) not in sys.path:
+    sys.path.insert(0, str(base_dir))
+
+from benchmarks.synthetic import make_ledger
+from src.nlp.classifier import classify
+
+
+def _rows_per_sec(df, **kwargs) -> float:
+    start = time.perf_counter()
+    classify(df, **kwargs)
+    return len(df) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--categories", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    df = make_ledger(args.rows, n_categories=args.categories, seed=args.seed)
+    apply_rate = _rows_per_sec(df, batch=False)
+    batch_rate = _rows_per_sec(df, batch=True)
+
+    print(f"Zeilen: {args.rows:,}  Kategorien: {args.categories:,}")
+    print(f"apply:  {apply_rate:>14,.0f} rows/s")
+    print(f"batch:  {batch_rate:>14,.0f} rows/s  ({batch_rate / apply_rate:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark des Kategorienmodells gegen die Schlüsselwortregeln.
+
+Vergleicht die Trefferquote (Recall je Klasse, Kreuzvalidierung über
+``configs/category_labels.csv``) und den Durchsatz beider Verfahren auf einem
+synthetischen Haushaltsbuch.
+
+Aufruf aus dem Projektroot::
+
+    python benchmarks/bench_model.py --rows 5000000 --categories 3000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+base_dir = Path(__file__).resolve().parents[1]
+if str(base_dir) not in sys.path:
+    sys.path.insert(0, str(base_dir))
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import recall_score
+from sklearn.model_selection import StratifiedKFold
+
+from benchmarks.synthetic import make_ledger
+from src.nlp.classifier import classify, classify_series
+from src.nlp.model import LABELS_FILE, CategoryModel, load_model
+
+
+def cross_validated_recall(labels: pd.DataFrame, folds: int, seed: int):
+    """Macro‑Recall von Regeln und Modell auf denselben Testfolds."""
+    truth, rules, model = [], [], []
+    splitter = StratifiedKFold(n_splits=folds, shuffle=True, random_state=seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (train, test) in enumerate(splitter.split(labels, labels["classification"])):
+            train_file = Path(tmp) / f"fold_{i}.csv"
+            labels.iloc[train].to_csv(train_file, index=False)
+            categories = labels["category"].iloc[test]
+            truth.extend(labels["classification"].iloc[test])
+            rules.extend(np.asarray(classify_series(categories)))
+            model.extend(CategoryModel.train(train_file).predict(categories.to_numpy(str)))
+    return (recall_score(truth, rules, average="macro", zero_division=0),
+            recall_score(truth, model, average="macro", zero_division=0))
+
+
+def _rows_per_sec(df: pd.DataFrame, method: str) -> float:
+    start = time.perf_counter()
+    classify(df, method=method)
+    return len(df) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--categories", type=int, default=3000)
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    labels = pd.read_csv(LABELS_FILE, dtype=str)
+    rules_recall, model_recall = cross_validated_recall(labels, args.folds, args.seed)
+
+    load_model()  # Laden bzw. Training nicht in den Durchsatz einrechnen
+    df = make_ledger(args.rows, n_categories=args.categories, seed=args.seed)
+    rules_rate = _rows_per_sec(df, "rules")
+    model_rate = _rows_per_sec(df, "model")
+
+    print(f"Zeilen: {args.rows:,}  Kategorien: {args.categories:,}  "
+          f"Labels: {len(labels):,} ({args.folds}-fach kreuzvalidiert)")
+    print(f"{'Verfahren':<10}{'Recall':>10}{'rows/s':>16}")
+    print(f"{'rules':<10}{rules_recall:>10.3f}{rules_rate:>16,.0f}")
+    print(f"{'model':<10}{model_recall:>10.3f}{model_rate:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Benchmark‑Suite der Haushaltspipeline mit Regressionsvergleich.
+
+Misst Durchsatz (Zeilen pro Sekunde) und Spitzenspeicher (``tracemalloc``) von
+``load_household_data``, ``parse_household_data``, ``classify`` und
+``compute_indicators`` auf synthetischen Daten einer festen Größe (siehe
+:data:`benchmarks.synthetic.SCALES`) oder auf den Beispieldaten
+(``--scale sample``). Die Ergebnisse werden mit der Baseline in
+``benchmarks/baselines/<scale>.json`` verglichen; liegt eine Stufe um mehr als
+``--threshold`` schlechter, endet der Lauf mit Exit‑Code 1.
+
+Aufruf aus dem Projektroot::
+
+    python benchmarks/suite.py --scale medium --save   # Baseline anlegen
+    python benchmarks/suite.py --scale medium          # gegen Baseline prüfen
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+base_dir = Path(__file__).resolve().parents[1]
+if str(base_dir) not in sys.path:
+    sys.path.insert(0, str(base_dir))
+
+from benchmarks.synthetic import SCALES, make_panel, write_raw_files
+from src.features.indicators import compute_indicators
+from src.nlp.classifier import classify
+from src.parsing.parser import parse_household_data
+from src.scraping.download import load_household_data
+
+BASELINE_DIR = base_dir / "benchmarks" / "baselines"
+SAMPLE_DIR = base_dir / "data" / "raw"
+
+
+def measure(func: Callable[..., Any], *args, rows: int, repeat: int = 3) -> Dict[str, float]:
+    """Misst eine Stufe.
+
+    Die Zeit ist das Minimum aus ``repeat`` Läufen ohne Speicherverfolgung;
+    der Spitzenspeicher stammt aus einem zusätzlichen Lauf mit
+    ``tracemalloc``, damit dessen Overhead die Zeitmessung nicht verfälscht.
+    """
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        seconds = min(seconds, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "seconds": seconds,
+        "rows_per_s": rows / seconds if seconds > 0 else float("inf"),
+        "peak_mb": peak / 1024 ** 2,
+    }
+
+
+def run_suite(raw_dir: Path, repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """Misst alle Stufen nacheinander auf den Rohdaten in ``raw_dir``."""
+    raw_df = load_household_data(str(raw_dir))
+    rows = len(raw_df)
+    parsed_df = parse_household_data(raw_df)
+    classified_df = classify(parsed_df)
+    return {
+        "load": measure(load_household_data, str(raw_dir), rows=rows, repeat=repeat),
+        "parse": measure(parse_household_data, raw_df, rows=rows, repeat=repeat),
+        "classify": measure(classify, parsed_df, rows=rows, repeat=repeat),
+        "indicators": measure(compute_indicators, classified_df, rows=rows, repeat=repeat),
+    }
+
+
+def compare_results(current: Dict[str, Dict[str, float]],
+                    baseline: Dict[str, Dict[str, float]],
+                    threshold: float = 0.2) -> List[str]:
+    """Liefert die Regressionen gegenüber der Baseline.
+
+    Eine Stufe gilt als regressiert, wenn ihr Durchsatz um mehr als
+    ``threshold`` (relativ) sinkt oder ihr Spitzenspeicher um mehr als
+    ``threshold`` steigt. Stufen ohne Baseline werden ignoriert.
+    """
+    regressions = []
+    for stage, result in current.items():
+        if stage not in baseline:
+            continue
+        old = baseline[stage]
+        if result["rows_per_s"] < old["rows_per_s"] * (1 - threshold):
+            regressions.append(
+                f"{stage}: throughput {result['rows_per_s']:,.0f} rows/s "
+                f"vs. baseline {old['rows_per_s']:,.0f} rows/s"
+            )
+        if result["peak_mb"] > old["peak_mb"] * (1 + threshold):
+            regressions.append(
+                f"{stage}: peak memory {result['peak_mb']:,.1f} MB "
+                f"vs. baseline {old['peak_mb']:,.1f} MB"
+            )
+    return regressions
+
+
+def git_commit() -> Optional[str]:
+    """Aktueller Commit des Repositorys, falls ermittelbar."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=base_dir,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", choices=["sample", *SCALES], default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="zulässige relative Verschlechterung (Standard 0.2)")
+    parser.add_argument("--baseline-dir", type=Path, default=BASELINE_DIR)
+    parser.add_argument("--save", action="store_true",
+                        help="Ergebnis als neue Baseline speichern")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.scale == "sample":
+            raw_dir = SAMPLE_DIR
+        else:
+            scale = SCALES[args.scale]
+            raw_dir = Path(tmp)
+            write_raw_files(make_panel(scale, seed=args.seed), raw_dir, scale.n_files)
+        results = run_suite(raw_dir, repeat=args.repeat)
+
+    print(f"{'Stufe':<12}{'Zeilen/s':>16}{'Peak MB':>10}")
+    for stage, result in results.items():
+        print(f"{stage:<12}{result['rows_per_s']:>16,.0f}{result['peak_mb']:>10.1f}")
+
+    baseline_file = args.baseline_dir / f"{args.scale}.json"
+    if args.save:
+        args.baseline_dir.mkdir(parents=True, exist_ok=True)
+        with open(baseline_file, "w", encoding="utf-8") as f:
+            json.dump({
+                "scale": args.scale,
+                "seed": args.seed,
+                "commit": git_commit(),
+                "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            }, f, indent=2)
+        print(f"Baseline gespeichert unter {baseline_file}.")
+        return 0
+
+    if not baseline_file.exists():
+        print(f"Keine Baseline unter {baseline_file}; mit --save anlegen.")
+        return 0
+    with open(baseline_file, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare_results(results, baseline["results"], args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(f"Keine Regression gegenüber Baseline {baseline.get('commit')} "
+              f"(Schwelle {args.threshold:.0%}).")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Synthetische Haushaltsdaten für Benchmarks.
+
+Erzeugt ein reproduzierbares Haushaltsbuch im Format der Rohdaten in
+``data/raw/`` (``commune``, ``year``, ``category``, ``amount``). Die Kategorien
+wiederholen sich wie in echten Haushaltsplänen über viele Zeilen.
+:func:`make_panel` erzeugt vollständige Haushalte je Kommune und Jahr in den
+Größenordnungen aus :data:`SCALES`, bis hin zu allen rund 11.000 Gemeinden
+über 20 Jahre.
+"""
+
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+CATEGORY_STEMS = [
+    "IT infrastructure",
+    "IT upgrade",
+    "Digital services",
+    "Personnel costs",
+    "Personnel digitalization",
+    "Outsourcing services",
+    "Outsourcing support",
+    "Other administration",
+    "General services",
+    "Building maintenance",
+]
+
+
+def make_categories(n_categories: int) -> np.ndarray:
+    """Erzeugt ``n_categories`` unterschiedliche Kategoriebezeichnungen."""
+    stems = np.resize(np.array(CATEGORY_STEMS, dtype=object), n_categories)
+    return np.array(
+        [f"{stem} {i}" for i, stem in enumerate(stems)], dtype=object
+    )
+
+
+def make_ledger(n_rows: int, n_categories: int = 3000, n_communes: int = 120,
+                years: range = range(2018, 2025), seed: int = 42) -> pd.DataFrame:
+    """Erzeugt ein synthetisches Haushaltsbuch.
+
+    Parameters
+    ----------
+    n_rows : int
+        Anzahl der Zeilen.
+    n_categories : int
+        Anzahl unterschiedlicher Kategoriebezeichnungen.
+    n_communes : int
+        Anzahl der Kommunen.
+    years : range
+        Abgedeckte Haushaltsjahre.
+    seed : int
+        Seed des Zufallsgenerators.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Rohdaten mit Spalten ``commune``, ``year``, ``category``, ``amount``.
+    """
+    rng = np.random.default_rng(seed)
+    communes = np.array([f"Gemeinde {i:05d}" for i in range(n_communes)], dtype=object)
+    categories = make_categories(n_categories)
+    year_values = np.array(list(years))
+    return pd.DataFrame({
+        "commune": communes[rng.integers(0, n_communes, n_rows)],
+        "year": year_values[rng.integers(0, len(year_values), n_rows)],
+        "category": categories[rng.integers(0, n_categories, n_rows)],
+        "amount": rng.integers(1_000, 5_000_000, n_rows).astype(float),
+    })
+
+
+class Scale(NamedTuple):
+    """Größe eines synthetischen Panels."""
+
+    n_communes: int
+    n_years: int
+    n_categories: int
+    lines_per_budget: int
+    n_files: int
+
+    @property
+    def n_rows(self) -> int:
+        return self.n_communes * self.n_years * self.lines_per_budget
+
+
+#: Benchmark‑Größen; ``"sample"`` steht für die Beispieldaten in ``data/raw``.
+SCALES: Dict[str, Scale] = {
+    "small": Scale(100, 5, 100, 20, 4),
+    "medium": Scale(1_000, 10, 300, 30, 16),
+    "large": Scale(11_000, 20, 300, 10, 64),
+    "full": Scale(11_000, 20, 500, 50, 256),
+}
+
+
+def german_amounts(amounts: np.ndarray) -> pd.Series:
+    """Formatiert Beträge in deutscher Schreibweise ("1.234.567,89 €")."""
+    formatted = pd.Series(amounts).map("{:,.2f}".format)
+    return formatted.str.translate(str.maketrans(",.", ".,")) + " €"
+
+
+def make_panel(scale: Scale, first_year: int = 2005, seed: int = 42,
+               german: bool = True) -> pd.DataFrame:
+    """Erzeugt ein vollständiges Panel aus Haushalten je Kommune und Jahr.
+
+    Jeder Haushalt umfasst ``scale.lines_per_budget`` Zeilen mit zufällig
+    gezogenen Kategorien. Die Zeilen sind nach Kommune und Jahr sortiert.
+
+    Parameters
+    ----------
+    scale : Scale
+        Größe des Panels (siehe :data:`SCALES`).
+    first_year : int
+        Erstes Haushaltsjahr.
+    seed : int
+        Seed des Zufallsgenerators.
+    german : bool
+        Beträge als Text in deutscher Schreibweise statt als Zahl ausgeben.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Rohdaten mit Spalten ``commune``, ``year``, ``category``, ``amount``.
+    """
+    rng = np.random.default_rng(seed)
+    n_budgets = scale.n_communes * scale.n_years
+    communes = np.array([f"Gemeinde {i:05d}" for i in range(scale.n_communes)], dtype=object)
+    categories = make_categories(scale.n_categories)
+    budget = np.repeat(np.arange(n_budgets), scale.lines_per_budget)
+    amounts = rng.integers(100_000, 500_000_000, scale.n_rows) / 100
+    return pd.DataFrame({
+        "commune": communes[budget // scale.n_years],
+        "year": first_year + budget % scale.n_years,
+        "category": categories[rng.integers(0, scale.n_categories, scale.n_rows)],
+        "amount": german_amounts(amounts) if german else amounts,
+    })
+
+
+def write_raw_files(df: pd.DataFrame, raw_dir: Path, n_files: int) -> List[Path]:
+    """Verteilt ein Haushaltsbuch auf ``n_files`` CSV‑Dateien in ``raw_dir``."""
+    raw_dir = Path(raw_dir)
+    raw_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    bounds = np.linspace(0, len(df), n_files + 1).astype(int)
+    for i, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:])):
+        path = raw_dir / f"synthetic_{i:04d}.csv"
+        df.iloc[start:stop].to_csv(path, index=False)
+        paths.append(path)
+    return paths
@@ -0,0 +1,142 @@
+"""
+Kleiner DAG‑Executor mit Stufen‑Cache.
+
+Die Pipeline besteht aus Stufen, deren Ergebnis nur von ihren Eingaben, ihrem
+Code und ihrer Konfiguration abhängt. Jede Stufe erhält daraus einen
+Cache‑Schlüssel; liegt das Ergebnis unter diesem Schlüssel bereits auf der
+Platte, wird es wiederverwendet. Ändern sich z. B. nur die
+Klassifikationsregeln, laufen ausschließlich ``classify`` und die davon
+abhängigen Stufen neu.
+"""
+
+import hashlib
+import inspect
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+
+def source_hash(func: Callable) -> str:
+    """Hash des Quellmoduls einer Funktion (erfasst auch Hilfsfunktionen)."""
+    source_file = inspect.getsourcefile(func)
+    digest = hashlib.sha256()
+    with open(source_file, "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+@dataclass
+class Stage:
+    """Eine Stufe des Pipeline‑DAG.
+
+    Attributes
+    ----------
+    name : str
+        Eindeutiger Name der Stufe.
+    func : callable
+        Berechnung; erhält die Ergebnisse der ``inputs`` in deren Reihenfolge.
+    inputs : sequence of str
+        Namen der vorgelagerten Stufen.
+    config : str or callable
+        Hash oder Version der Konfiguration, von der die Stufe abhängt (für
+        Quellstufen z. B. ein Hash der Rohdaten). Ein Callable wird erst
+        ausgewertet, wenn der Cache‑Schlüssel benötigt wird.
+    version : str
+        Codeversion; Standard ist der Hash des Moduls von ``func``.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    inputs: Sequence[str] = ()
+    config: Union[str, Callable[[], str]] = ""
+    version: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.version is None:
+            self.version = source_hash(self.func)
+
+
+@dataclass
+class DAGExecutor:
+    """Führt Stufen in Abhängigkeitsreihenfolge aus und cached die Ergebnisse.
+
+    Parameters
+    ----------
+    stages : list of Stage
+        Stufen des DAG.
+    cache_dir : pathlib.Path, optional
+        Verzeichnis des Stufen‑Caches; ohne Angabe wird nicht gecached.
+    """
+
+    stages: List[Stage]
+    cache_dir: Optional[Path] = None
+    #: Herkunft je Stufe nach :meth:`run` (``"cache"`` oder ``"computed"``).
+    status: Dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._stages = {stage.name: stage for stage in self.stages}
+        if len(self._stages) != len(self.stages):
+            raise ValueError("Stage names must be unique")
+        for stage in self.stages:
+            unknown = set(stage.inputs) - set(self._stages)
+            if unknown:
+                raise ValueError(f"Stage {stage.name!r} has unknown inputs: {unknown}")
+        for stage in self.stages:
+            self._check_acyclic(stage.name, ())
+        self._keys: Dict[str, str] = {}
+
+    def _check_acyclic(self, name: str, path: Sequence[str]) -> None:
+        if name in path:
+            raise ValueError(f"Cycle in stage graph: {' -> '.join((*path, name))}")
+        for input_name in self._stages[name].inputs:
+            self._check_acyclic(input_name, (*path, name))
+
+    def key(self, name: str) -> str:
+        """Cache‑Schlüssel einer Stufe aus Code, Konfiguration und Eingaben."""
+        if name not in self._keys:
+            stage = self._stages[name]
+            config = stage.config() if callable(stage.config) else stage.config
+            digest = hashlib.sha256()
+            for part in (stage.name, stage.version, config):
+                digest.update(part.encode("utf-8") + b"\0")
+            for input_name in stage.inputs:
+                digest.update(self.key(input_name).encode("utf-8"))
+            self._keys[name] = digest.hexdigest()[:16]
+        return self._keys[name]
+
+    def _cache_file(self, name: str) -> Path:
+        return self.cache_dir / f"{name}-{self.key(name)}.pkl"
+
+    def run(self, targets: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Berechnet die Zielstufen (Standard: alle) und liefert ihre Ergebnisse.
+
+        Vorgelagerte Stufen werden nur geladen oder berechnet, wenn eine
+        Zielstufe nicht aus dem Cache kommt.
+        """
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        results: Dict[str, Any] = {}
+
+        def resolve(name: str) -> Any:
+            if name in results:
+                return results[name]
+            if self.cache_dir is not None and self._cache_file(name).exists():
+                results[name] = pd.read_pickle(self._cache_file(name))
+                self.status[name] = "cache"
+                return results[name]
+            args = [resolve(input_name) for input_name in self._stages[name].inputs]
+            results[name] = self.run_stage(self._stages[name], args)
+            self.status[name] = "computed"
+            if self.cache_dir is not None:
+                pd.to_pickle(results[name], self._cache_file(name))
+            return results[name]
+
+        for name in targets or list(self._stages):
+            resolve(name)
+        return results
+
+    def run_stage(self, stage: Stage, args: List[Any]) -> Any:
+        """Führt eine einzelne Stufe aus (Erweiterungspunkt für Messungen)."""
+        return stage.func(*args)
@@ -7,11 +7,30 @@ Gesamtbudget). Die Formeln sind in ``configs/indicators.yml`` beschrieben.
 """
 
 import pandas as pd
-from typing import Dict, List
+from typing import Dict
 
+#: Klassen, deren Beträge als eigene Budgetspalte ausgewiesen werden.
+BUDGET_COLUMNS: Dict[str, str] = {
+    "digital": "digital_budget",
+    "outsourcing": "outsourcing_budget",
+    "personnel": "personnel_budget",
+}
 
-def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
-    """Aggregiert Ausgaben und berechnet Kennzahlen pro Kommune und Jahr.
+#: Kennzahlen aus ``configs/indicators.yml`` (Zähler / ``total_budget``).
+RATIO_COLUMNS: Dict[str, str] = {
+    "digital_ratio": "digital_budget",
+    "outsourcing_ratio": "outsourcing_budget",
+    "personnel_ratio": "personnel_budget",
+}
+
+GROUP_KEYS = ["commune", "year"]
+
+
+def budget_sums(df: pd.DataFrame) -> pd.DataFrame:
+    """Summiert Gesamt- und Klassenbudgets pro Kommune und Jahr.
+
+    Alle Summen entstehen in einer einzigen ``groupby``‑Aggregation über
+    maskierte Betragsspalten.
 
     Parameters
     ----------
@@ -22,32 +41,83 @@ def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
     Returns
     -------
     pandas.DataFrame
-        Aggregierte Daten mit Indikatoren.
+        Budgetsummen mit Index ``(commune, year)``.
     """
     required_cols = {"commune", "year", "amount", "classification"}
     missing = required_cols - set(df.columns)
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
-    grouped = df.groupby(["commune", "year"])
-    records: List[Dict[str, float]] = []
-    for (commune, year), group in grouped:
-        total_budget = group["amount"].sum()
-        digital_budget = group.loc[group["classification"] == "digital", "amount"].sum()
-        outsourcing_budget = group.loc[group["classification"] == "outsourcing", "amount"].sum()
-        personnel_budget = group.loc[group["classification"] == "personnel", "amount"].sum()
-
-        record = {
-            "commune": commune,
-            "year": int(year),
-            "total_budget": total_budget,
-            "digital_budget": digital_budget,
-            "outsourcing_budget": outsourcing_budget,
-            "personnel_budget": personnel_budget,
-            "digital_ratio": digital_budget / total_budget if total_budget else None,
-            "outsourcing_ratio": outsourcing_budget / total_budget if total_budget else None,
-            "personnel_ratio": personnel_budget / total_budget if total_budget else None,
-        }
-        records.append(record)
-
-    return pd.DataFrame(records)
\ No newline at end of file
+    amount = df["amount"]
+    columns = {"total_budget": amount}
+    for cls, column in BUDGET_COLUMNS.items():
+        columns[column] = amount.where(df["classification"] == cls, 0.0)
+    keys = [df[key] for key in GROUP_KEYS]
+    return pd.DataFrame(columns).groupby(keys, sort=True, observed=True).sum()
+
+
+def merge_budget_sums(*sums: pd.DataFrame) -> pd.DataFrame:
+    """Führt Teilsummen aus :func:`budget_sums` zusammen.
+
+    Budgetsummen sind additiv, daher können Blöcke oder Dateien getrennt
+    aggregiert und hier verlustfrei vereinigt werden.
+
+    Parameters
+    ----------
+    *sums : pandas.DataFrame
+        Teilsummen mit Index ``(commune, year)``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Summen je ``(commune, year)``, sortiert.
+    """
+    parts = [part for part in sums if part is not None and len(part)]
+    if not parts:
+        return budget_sums(pd.DataFrame(columns=["commune", "year", "amount",
+                                                 "classification"]))
+    merged = pd.concat(parts)
+    merged.index = merged.index.set_levels(
+        [level.astype(object) if isinstance(level, pd.CategoricalIndex) else level
+         for level in merged.index.levels]
+    )
+    return merged.groupby(level=GROUP_KEYS, sort=True).sum()
+
+
+def indicators_from_sums(sums: pd.DataFrame) -> pd.DataFrame:
+    """Berechnet die Kennzahlen aus Budgetsummen.
+
+    Parameters
+    ----------
+    sums : pandas.DataFrame
+        Ergebnis von :func:`budget_sums` mit Index ``(commune, year)``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Aggregierte Daten mit Indikatoren; Quoten sind ``NaN``, wenn das
+        Gesamtbudget 0 ist.
+    """
+    result = sums.reset_index()
+    result["year"] = result["year"].astype("int64")
+    total = result["total_budget"].where(result["total_budget"] != 0)
+    for ratio, column in RATIO_COLUMNS.items():
+        result[ratio] = result[column] / total
+    return result
+
+
+def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregiert Ausgaben und berechnet Kennzahlen pro Kommune und Jahr.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Klassifizierte Haushaltsdaten mit Spalten ``commune``, ``year``,
+        ``amount`` und ``classification``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Aggregierte Daten mit Indikatoren.
+    """
+    return indicators_from_sums(budget_sums(df))
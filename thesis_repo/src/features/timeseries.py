@@ -0,0 +1,212 @@
+"""
+Längsschnitt‑Indikatoren über mehrere Haushaltsjahre.
+
+:class:`BudgetTimeSeries` hält je Kommune die kumulierten Budgetsummen über
+alle Jahre in einem zusammenhängenden Array. Jede Fensterabfrage – Summe,
+Quote, gleitender Mittelwert oder Wachstum gegenüber dem Vorjahr – ist damit
+eine Differenz zweier Präfixsummen und kostet unabhängig von der
+Fensterlänge O(1). Neue Haushaltsjahre werden angehängt, ohne bestehende
+Präfixsummen neu zu berechnen; der Puffer wächst dabei geometrisch, sodass
+nur gelegentlich umkopiert wird.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .indicators import BUDGET_COLUMNS, GROUP_KEYS, RATIO_COLUMNS
+
+#: Spalten der Zeitreihe in Array‑Reihenfolge.
+SERIES_COLUMNS: List[str] = ["total_budget", *BUDGET_COLUMNS.values()]
+
+
+class BudgetTimeSeries:
+    """Präfixsummen der Budgetsummen je Kommune und Jahr.
+
+    ``cumsum[c, i, k]`` ist die Summe der Spalte ``k`` der Kommune ``c`` über
+    alle Jahre vor ``first_year + i``; ``present[c, i]`` zählt analog die
+    Jahre mit vorhandenem Haushalt. Fehlende Jahre gehen mit 0 ein und
+    zählen bei Mittelwerten nicht mit.
+
+    Parameters
+    ----------
+    sums : pandas.DataFrame
+        Budgetsummen mit Index ``(commune, year)``, z. B. aus
+        :func:`~src.features.indicators.budget_sums` oder
+        :func:`~src.features.indicators.merge_budget_sums`.
+    """
+
+    def __init__(self, sums: pd.DataFrame):
+        self.communes: List[str] = []
+        self._commune_index: Dict[str, int] = {}
+        self.first_year: Optional[int] = None
+        # Puffer mit Reserve; belegt sind die ersten len(communes) Zeilen und
+        # _n_steps Präfixpositionen (Jahre + 1)
+        self._cumsum = np.zeros((0, 1, len(SERIES_COLUMNS)))
+        self._present = np.zeros((0, 1), dtype=np.int64)
+        self._n_steps = 1
+        self.append(sums)
+
+    @property
+    def cumsum(self) -> np.ndarray:
+        """Präfixsummen (Kommunen × Jahre + 1 × Spalten) als Sicht auf den Puffer."""
+        return self._cumsum[:len(self.communes), :self._n_steps]
+
+    @property
+    def present(self) -> np.ndarray:
+        """Präfixzähler vorhandener Jahre (Kommunen × Jahre + 1)."""
+        return self._present[:len(self.communes), :self._n_steps]
+
+    @property
+    def last_year(self) -> Optional[int]:
+        if self.first_year is None:
+            return None
+        return self.first_year + self._n_steps - 2
+
+    @property
+    def years(self) -> range:
+        if self.first_year is None:
+            return range(0)
+        return range(self.first_year, self.last_year + 1)
+
+    def append(self, sums: pd.DataFrame) -> None:
+        """Hängt Budgetsummen neuer Jahre an.
+
+        Alle Jahre in ``sums`` müssen nach :attr:`last_year` liegen; neue
+        Kommunen sind erlaubt. Nur die neuen Jahre werden aufsummiert und in
+        den Puffer geschrieben; die Präfixsummen bestehender Jahre bleiben
+        unverändert. Reicht der Puffer nicht, wird er mindestens verdoppelt.
+        """
+        if not len(sums):
+            return
+        missing = set(SERIES_COLUMNS) - set(sums.columns)
+        if missing:
+            raise ValueError(f"Missing budget columns: {missing}")
+        frame = sums.reset_index()
+        years = frame["year"].astype("int64").to_numpy()
+        if self.first_year is None:
+            self.first_year = int(years.min())
+        elif years.min() <= self.last_year:
+            raise ValueError(
+                f"Can only append years after {self.last_year}, got {int(years.min())}"
+            )
+
+        for commune in pd.unique(frame["commune"].astype(object)):
+            if commune not in self._commune_index:
+                self._commune_index[commune] = len(self.communes)
+                self.communes.append(commune)
+        n_communes = len(self.communes)
+        start = self._n_steps - 1
+        n_new = int(years.max()) - self.first_year - start + 1
+        self._reserve(n_communes, start + 1 + n_new)
+
+        values = np.zeros((n_communes, n_new, len(SERIES_COLUMNS)))
+        counts = np.zeros((n_communes, n_new), dtype=np.int64)
+        rows = frame["commune"].astype(object).map(self._commune_index).to_numpy()
+        cols = years - self.first_year - start
+        np.add.at(values, (rows, cols), frame[SERIES_COLUMNS].to_numpy(float))
+        counts[rows, cols] = 1
+
+        end = start + 1 + n_new
+        cumsum, present = self._cumsum[:n_communes], self._present[:n_communes]
+        cumsum[:, start + 1:end] = cumsum[:, start:start + 1] + np.cumsum(values, axis=1)
+        present[:, start + 1:end] = present[:, start:start + 1] + np.cumsum(counts, axis=1)
+        self._n_steps = end
+
+    def _reserve(self, n_communes: int, n_steps: int) -> None:
+        """Vergrößert die Puffer bei Bedarf geometrisch (neue Felder sind 0)."""
+        old_rows, old_steps = self._present.shape
+        if n_communes <= old_rows and n_steps <= old_steps:
+            return
+        rows = max(n_communes, 2 * old_rows) if n_communes > old_rows else old_rows
+        steps = max(n_steps, 2 * old_steps) if n_steps > old_steps else old_steps
+        cumsum = np.zeros((rows, steps, len(SERIES_COLUMNS)))
+        present = np.zeros((rows, steps), dtype=np.int64)
+        cumsum[:old_rows, :old_steps] = self._cumsum
+        present[:old_rows, :old_steps] = self._present
+        self._cumsum, self._present = cumsum, present
+
+    def _bounds(self, start: int, end: int):
+        """Array‑Positionen eines geschlossenen Jahresfensters ``[start, end]``."""
+        if self.first_year is None:
+            raise ValueError("Time series is empty")
+        lo = np.clip(np.asarray(start) - self.first_year, 0, self.cumsum.shape[1] - 1)
+        hi = np.clip(np.asarray(end) - self.first_year + 1, 0, self.cumsum.shape[1] - 1)
+        return lo, np.maximum(hi, lo)
+
+    def _rows(self, communes: Optional[Sequence[str]]) -> np.ndarray:
+        if communes is None:
+            return np.arange(len(self.communes))
+        try:
+            return np.array([self._commune_index[c] for c in communes], dtype=np.int64)
+        except KeyError as exc:
+            raise KeyError(f"Unknown commune: {exc.args[0]!r}") from None
+
+    def window_sums(self, start: int, end: int,
+                    communes: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Budgetsummen je Kommune über die Jahre ``start`` bis ``end``."""
+        lo, hi = self._bounds(start, end)
+        rows = self._rows(communes)
+        values = self.cumsum[rows, hi] - self.cumsum[rows, lo]
+        index = pd.Index([self.communes[r] for r in rows], name="commune")
+        return pd.DataFrame(values, index=index, columns=SERIES_COLUMNS)
+
+    def window_ratios(self, start: int, end: int,
+                      communes: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Kennzahlen je Kommune über das Fenster ``[start, end]``.
+
+        Die Quoten beziehen sich auf die Summen des gesamten Fensters, nicht
+        auf den Mittelwert der Jahresquoten. Ist das Gesamtbudget 0, sind sie
+        ``NaN``.
+        """
+        sums = self.window_sums(start, end, communes)
+        total = sums["total_budget"].where(sums["total_budget"] != 0)
+        return pd.DataFrame({ratio: sums[column] / total
+                             for ratio, column in RATIO_COLUMNS.items()})
+
+    def rolling_mean(self, window: int, column: str = "total_budget") -> pd.DataFrame:
+        """Gleitender Mittelwert über ``window`` Jahre (Kommunen × Jahre).
+
+        Gemittelt wird über die Jahre mit vorhandenem Haushalt im Fenster;
+        ohne solche Jahre ist der Wert ``NaN``.
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        k = SERIES_COLUMNS.index(column)
+        hi = np.arange(1, len(self.years) + 1)
+        lo = np.maximum(hi - window, 0)
+        totals = self.cumsum[:, hi, k] - self.cumsum[:, lo, k]
+        counts = self.present[:, hi] - self.present[:, lo]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.where(counts > 0, totals / counts, np.nan)
+        return pd.DataFrame(means, index=pd.Index(self.communes, name="commune"),
+                            columns=pd.Index(list(self.years), name="year"))
+
+    def yoy_growth(self, column: str = "total_budget") -> pd.DataFrame:
+        """Wachstum gegenüber dem Vorjahr (Kommunen × Jahre).
+
+        ``NaN``, wenn das Vorjahr fehlt oder dessen Wert 0 ist.
+        """
+        k = SERIES_COLUMNS.index(column)
+        values = np.diff(self.cumsum[:, :, k], axis=1)
+        observed = np.diff(self.present, axis=1) > 0
+        previous = np.full_like(values, np.nan)
+        previous[:, 1:] = np.where(observed[:, :-1], values[:, :-1], np.nan)
+        current = np.where(observed, values, np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            growth = np.where(previous != 0, current / previous - 1, np.nan)
+        return pd.DataFrame(growth, index=pd.Index(self.communes, name="commune"),
+                            columns=pd.Index(list(self.years), name="year"))
+
+    def to_sums(self) -> pd.DataFrame:
+        """Rekonstruiert die Jahressummen mit Index ``(commune, year)``."""
+        values = np.diff(self.cumsum, axis=1)
+        observed = np.diff(self.present, axis=1) > 0
+        rows, cols = np.nonzero(observed)
+        index = pd.MultiIndex.from_arrays(
+            [np.array(self.communes, dtype=object)[rows],
+             np.asarray(self.first_year + cols, dtype="int64")],
+            names=GROUP_KEYS,
+        )
+        return pd.DataFrame(values[rows, cols], index=index, columns=SERIES_COLUMNS)
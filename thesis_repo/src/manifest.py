@@ -0,0 +1,122 @@
+"""
+Manifest der Rohdateien für inkrementelle Pipeline‑Läufe.
+
+Für jede Rohdatei werden Pfad, Größe, Änderungszeit und SHA‑256 des Inhalts
+festgehalten, zusammen mit den zwischengespeicherten Teilergebnissen
+(klassifizierte Zeilen und Budgetsummen). Ein erneuter Lauf verarbeitet nur
+neue oder geänderte Dateien und vereinigt sie mit den gespeicherten
+Teilergebnissen.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+#: Versionskennung des Manifest‑Formats.
+MANIFEST_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+PARTIALS_DIR = "partials"
+
+
+def file_sha256(path: Path, block_size: int = 1 << 20) -> str:
+    """Berechnet den SHA‑256‑Hash einer Datei blockweise."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_stamp(path: Path) -> Tuple[int, int]:
+    """Größe und Änderungszeit einer Datei (Schlüssel für Caches im Prozess)."""
+    stat = Path(path).stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def fingerprint(path: Path, sha256: Optional[str] = None) -> Dict[str, Any]:
+    """Erstellt den Manifest‑Eintrag einer Datei."""
+    stat = path.stat()
+    return {
+        "path": str(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": sha256 or file_sha256(path),
+    }
+
+
+def refresh_entry(path: Path, entry: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Prüft, ob die gespeicherten Teilergebnisse einer Datei noch gelten.
+
+    Stimmen Größe und Änderungszeit überein, gilt die Datei ohne Lesen als
+    unverändert. Andernfalls entscheidet der Inhalts‑Hash, sodass z. B. ein
+    bloßes ``touch`` keine Neuberechnung auslöst.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Aktuelle Rohdatei.
+    entry : dict, optional
+        Bisheriger Manifest‑Eintrag.
+
+    Returns
+    -------
+    dict or None
+        Aktualisierter Eintrag, wenn die Teilergebnisse gültig sind, sonst
+        ``None``.
+    """
+    if entry is None:
+        return None
+    stat = path.stat()
+    if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+        return entry
+    if stat.st_size != entry["size"]:
+        return None
+    sha256 = file_sha256(path)
+    if sha256 != entry["sha256"]:
+        return None
+    return fingerprint(path, sha256=sha256)
+
+
+class Manifest:
+    """Manifest und Teilergebnis‑Cache in einem Cache‑Verzeichnis.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path
+        Verzeichnis für ``manifest.json`` und die Teilergebnisse.
+    config_hash : str
+        Hash der Verarbeitungskonfiguration (z. B. der Klassifikationsregeln).
+        Weicht er vom gespeicherten Wert ab, werden alle Einträge verworfen.
+    """
+
+    def __init__(self, cache_dir: Path, config_hash: str):
+        self.cache_dir = Path(cache_dir)
+        self.config_hash = config_hash
+        self.files: Dict[str, Dict[str, Any]] = {}
+
+        manifest_file = self.cache_dir / MANIFEST_FILE
+        if manifest_file.exists():
+            with open(manifest_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if (data.get("version") == MANIFEST_VERSION
+                    and data.get("config_hash") == config_hash):
+                self.files = data.get("files", {})
+
+    def partial_path(self, name: str, kind: str) -> Path:
+        """Pfad eines Teilergebnisses (``kind`` z. B. ``"classified"``)."""
+        return self.cache_dir / PARTIALS_DIR / f"{name}.{kind}.pkl"
+
+    def save(self) -> None:
+        """Schreibt das Manifest atomar auf die Platte."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        manifest_file = self.cache_dir / MANIFEST_FILE
+        tmp_file = manifest_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": MANIFEST_VERSION,
+                "config_hash": self.config_hash,
+                "files": self.files,
+            }, f, indent=2, sort_keys=True)
+        tmp_file.replace(manifest_file)
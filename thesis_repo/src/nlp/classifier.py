@@ -2,23 +2,121 @@
 Einfache Klassifikation von Haushaltskategorien.
 
 Dieses Modul ordnet eine Freitextkategorie einer groben Klasse zu. In echten
-Anwendungen könnte hier ein maschinelles Lernmodell (z. B. BERT) eingesetzt
-werden. Für die Demo werden heuristische Regeln genutzt.
+Anwendungen könnte hier ein maschinelles Lernmodell (z. B. BERT) eingesetzt
+werden. Für die Demo werden heuristische Regeln genutzt, die in
+``configs/patterns.yml`` gepflegt und zu einem einzigen regulären Ausdruck
+kompiliert werden. Alternativ steht mit ``method="model"`` ein aus gelabelten
+Kategorien trainiertes Modell bereit (siehe :mod:`src.nlp.model`). Tragen die
+Daten Produktplan‑Codes (Spalte ``product_code``), entscheidet für codierte
+Zeilen der Produktplan (siehe :mod:`src.nlp.product_codes`); die Textregeln
+greifen nur für Zeilen ohne Code.
 """
 
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 import pandas as pd
+import yaml
+
+from ..manifest import file_stamp
+from .product_codes import CODE_COLUMN, PRODUCT_CODES_FILE, load_trie, normalize_codes
+
+#: Standardpfad der Klassifikationsregeln.
+PATTERNS_FILE = Path(__file__).resolve().parents[2] / "configs" / "patterns.yml"
+
+#: Klasse für Kategorien, auf die keine Regel passt.
+DEFAULT_CLASS = "other"
+
+#: Verfahren der Textklassifikation.
+CLASSIFY_METHODS = ("rules", "model")
+
+
+def load_rules(path: Union[str, Path] = PATTERNS_FILE) -> List[Tuple[str, List[str]]]:
+    """Lädt die Klassifikationsregeln, absteigend nach Priorität sortiert.
+
+    Jede Klasse ist entweder eine Liste von Mustern oder ein Mapping mit
+    ``patterns`` und optionaler ``priority`` (Standard 0). Bei gleicher
+    Priorität entscheidet die Reihenfolge in der Datei.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Pfad zur YAML‑Datei.
+
+    Returns
+    -------
+    list of (str, list of str)
+        Klassen mit ihren Mustern in Auswertungsreihenfolge.
+    """
+    with open(path, encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+
+    rules = []
+    for order, (name, spec) in enumerate(config.items()):
+        if isinstance(spec, dict):
+            patterns = spec.get("patterns", [])
+            priority = spec.get("priority", 0)
+        else:
+            patterns, priority = spec, 0
+        if not patterns:
+            raise ValueError(f"Rule {name!r} has no patterns")
+        rules.append((-priority, order, str(name), [str(p) for p in patterns]))
+    rules.sort()
+    return [(name, patterns) for _, _, name, patterns in rules]
 
 
-def classify_category(category: str) -> str:
-    """Mappt eine Kategorie auf eine von drei Klassen.
+def _pattern_regex(pattern: str) -> str:
+    """Übersetzt ein Muster in einen Ausdruck mit Wortgrenzen."""
+    if pattern.endswith("*"):
+        return r"\b" + re.escape(pattern[:-1])
+    return r"\b" + re.escape(pattern) + r"\b"
 
-    Die Klassifikation basiert auf einfachen Schlüsselwörtern. Sie kann in
-    ``configs/patterns.yml`` gepflegt und hier übernommen werden.
+
+def compile_rules(rules: List[Tuple[str, List[str]]]) -> re.Pattern:
+    """Kompiliert die Regeln zu einer priorisierten Alternation.
+
+    Jede Klasse wird zu einem Lookahead über den gesamten Text mit einer
+    leeren Gruppe dahinter. Da die Alternation von links nach rechts probiert
+    wird, gewinnt die erste (höchstpriorisierte) passende Klasse, unabhängig
+    davon, wo im Text ihr Schlüsselwort steht. Die Nummer der gefüllten Gruppe
+    ist der Index der Klasse.
+    """
+    branches = [
+        "(?=.*?(?:" + "|".join(_pattern_regex(p) for p in patterns) + "))()"
+        for _, patterns in rules
+    ]
+    return re.compile("^(?:" + "|".join(branches) + ")", re.IGNORECASE | re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def _compile_engine(path: str, stamp: Tuple[int, int]) -> Tuple[re.Pattern, Tuple[str, ...]]:
+    rules = load_rules(path)
+    classes = tuple(name for name, _ in rules)
+    if DEFAULT_CLASS not in classes:
+        classes += (DEFAULT_CLASS,)
+    return compile_rules(rules), classes
+
+
+def _load_engine(path: str) -> Tuple[re.Pattern, Tuple[str, ...]]:
+    """Kompilierte Regeln einer Datei; nach Änderungen der Datei neu kompiliert."""
+    return _compile_engine(path, file_stamp(path))
+
+
+def classify_category(category: str, patterns_file: Union[str, Path] = PATTERNS_FILE) -> str:
+    """Mappt eine Kategorie auf eine der konfigurierten Klassen.
+
+    Die Klassifikation basiert auf den Schlüsselwörtern aus
+    ``configs/patterns.yml``.
 
     Parameters
     ----------
     category : str
         Freitextbeschriftung aus den Haushaltsdaten.
+    patterns_file : str or pathlib.Path
+        Regeldatei (Standard: ``configs/patterns.yml``).
 
     Returns
     -------
@@ -26,29 +124,173 @@ def classify_category(category: str) -> str:
         Zuordnung zu einer Klasse ("digital", "outsourcing", "personnel" oder
         "other").
     """
-    text = category.lower()
-    if "it" in text or "digital" in text:
-        return "digital"
-    if "outsourcing" in text:
-        return "outsourcing"
-    if "personnel" in text:
-        return "personnel"
-    return "other"
+    regex, classes = _load_engine(str(patterns_file))
+    match = regex.match(category)
+    if match is None:
+        return DEFAULT_CLASS
+    return classes[match.lastindex - 1]
 
 
-def classify(df: pd.DataFrame) -> pd.DataFrame:
+def classify(df: pd.DataFrame, batch: bool = True,
+             patterns_file: Union[str, Path] = PATTERNS_FILE,
+             codes_file: Optional[Union[str, Path]] = PRODUCT_CODES_FILE,
+             method: str = "rules") -> pd.DataFrame:
     """Fügt dem DataFrame eine Spalte ``classification`` hinzu.
 
+    Im Batch-Modus wird jede unterschiedliche Kategorie nur einmal
+    klassifiziert und das Ergebnis über die Faktorisierungscodes auf alle
+    Zeilen zurückgespielt. Haushaltsdaten wiederholen wenige tausend
+    Kategorien über Millionen Zeilen, daher skaliert der Aufwand mit der Zahl
+    der Kategorien statt mit der Zahl der Zeilen.
+
+    Enthält ``df`` eine Spalte ``product_code``, werden codierte Zeilen über
+    den längsten passenden Produktplan‑Präfix klassifiziert (siehe
+    :func:`classify_codes`); ohne passenden Präfix gelten sie als "other".
+
     Parameters
     ----------
     df : pandas.DataFrame
         Geparste Haushaltsdaten.
+    batch : bool
+        ``True`` (Standard) klassifiziert deduplizierte Kategorien und liefert
+        eine kategoriale Spalte; ``False`` nutzt den zeilenweisen
+        ``apply``‑Pfad (Referenz für Benchmarks).
+    patterns_file : str or pathlib.Path
+        Regeldatei (Standard: ``configs/patterns.yml``).
+    codes_file : str or pathlib.Path, optional
+        Präfixdatei des Produktplans (Standard: ``configs/product_codes.yml``);
+        ``None`` klassifiziert ausschließlich über die Textregeln.
+    method : str
+        ``"rules"`` (Standard) für die Schlüsselwortregeln oder ``"model"``
+        für das trainierte Modell aus :mod:`src.nlp.model`. Das Modell sagt
+        stets gebündelt über die eindeutigen Kategorien vorher; ``batch``
+        betrifft nur die Regeln.
 
     Returns
     -------
     pandas.DataFrame
-        DataFrame mit zusätzlicher Spalte ``classification``.
+        DataFrame mit zusätzlicher Spalte ``classification``. Die
+        Eingabespalten werden nicht kopiert.
+    """
+    if method not in CLASSIFY_METHODS:
+        raise ValueError(f"Unknown method {method!r}, expected one of {CLASSIFY_METHODS}")
+    df = df.copy(deep=False)
+    if method == "model":
+        from .model import predict_series
+
+        predicted = predict_series(df["category"])
+        classification = predicted.set_categories(
+            _merge_classes(predicted.categories, patterns_file)
+        ).fillna(DEFAULT_CLASS)
+    elif not batch:
+        classification = df["category"].apply(classify_category, patterns_file=patterns_file)
+    else:
+        classification = classify_series(df["category"], patterns_file)
+    if codes_file is not None and CODE_COLUMN in df.columns:
+        by_code = classify_codes(df[CODE_COLUMN], codes_file)
+        classification = pd.Series(classification, index=df.index).astype(object)
+        classification = by_code.astype(object).fillna(classification)
+        if batch or method == "model":
+            classification = classification.astype(
+                pd.CategoricalDtype(_merge_classes(by_code.cat.categories, patterns_file))
+            )
+    df["classification"] = classification
+    return df
+
+
+def classify_uniques(values: pd.Series,
+                     classify_values: Callable[[pd.Series], np.ndarray],
+                     categories: Sequence[str],
+                     missing_code: int = -1) -> pd.Categorical:
+    """Klassifiziert jeden eindeutigen Wert einmal und verteilt das Ergebnis.
+
+    Parameters
+    ----------
+    values : pandas.Series
+        Zu klassifizierende Spalte.
+    classify_values : callable
+        Erhält die eindeutigen Werte (``object``‑Series) und liefert je Wert
+        den Index seiner Klasse in ``categories`` (``-1`` für fehlend).
+    categories : sequence of str
+        Klassen des Ergebnisses.
+    missing_code : int
+        Klassenindex für fehlende Werte in ``values`` (``-1`` = fehlend).
+
+    Returns
+    -------
+    pandas.Categorical
+        Klasse je Zeile von ``values``.
+    """
+    row_codes, uniques = pd.factorize(values)
+    class_codes = np.asarray(classify_values(pd.Series(uniques, dtype=object)))
+    # Letzter Eintrag bildet den Faktorisierungscode -1 (fehlende Werte) ab.
+    lookup = np.append(class_codes, missing_code).astype(np.int16)
+    return pd.Categorical.from_codes(lookup[row_codes], categories=list(categories))
+
+
+def _merge_classes(code_classes: pd.Index, patterns_file: Union[str, Path]) -> List[str]:
+    """Klassen der Textregeln, ergänzt um reine Code‑Klassen (vor "other")."""
+    _, classes = _load_engine(str(patterns_file))
+    extra = [name for name in code_classes if name not in classes]
+    return [name for name in classes if name != DEFAULT_CLASS] + extra + [DEFAULT_CLASS]
+
+
+def classify_codes(codes: pd.Series,
+                   codes_file: Union[str, Path] = PRODUCT_CODES_FILE) -> pd.Series:
+    """Klassifiziert Produktplan‑Codes über den längsten passenden Präfix.
+
+    Jeder eindeutige Code wird einmal im Trie nachgeschlagen.
+
+    Parameters
+    ----------
+    codes : pandas.Series
+        Produktcodes mit beliebigen Trennzeichen (``"11.4.01"``, ``"11401"``).
+    codes_file : str or pathlib.Path
+        Präfixdatei (Standard: ``configs/product_codes.yml``).
+
+    Returns
+    -------
+    pandas.Series
+        Kategoriale Klassen; "other" für Codes ohne passenden Präfix und
+        fehlende Werte für Zeilen ohne Code.
+    """
+    trie = load_trie(str(codes_file))
+    classes = list(trie.classes) + [DEFAULT_CLASS]
+
+    def lookup(uniques: pd.Series) -> np.ndarray:
+        normalized = normalize_codes(uniques)
+        class_codes = trie.lookup(normalized.fillna("").to_numpy(str))
+        class_codes[class_codes < 0] = len(classes) - 1
+        class_codes[normalized.isna().to_numpy()] = -1
+        return class_codes
+
+    return pd.Series(classify_uniques(codes, lookup, classes), index=codes.index)
+
+
+def classify_series(categories: pd.Series,
+                    patterns_file: Union[str, Path] = PATTERNS_FILE) -> pd.Categorical:
+    """Klassifiziert eine Kategorie‑Spalte über ihre eindeutigen Werte.
+
+    Die eindeutigen Kategorien werden in einem Durchlauf mit dem kompilierten
+    Regelausdruck ausgewertet (``Series.str.extract``).
+
+    Parameters
+    ----------
+    categories : pandas.Series
+        Freitextkategorien; fehlende Werte werden als "other" klassifiziert.
+    patterns_file : str or pathlib.Path
+        Regeldatei (Standard: ``configs/patterns.yml``).
+
+    Returns
+    -------
+    pandas.Categorical
+        Klassen in der Reihenfolge der Regelpriorität, "other" zuletzt.
     """
-    df = df.copy()
-    df["classification"] = df["category"].apply(classify_category)
-    return df
\ No newline at end of file
+    regex, classes = _load_engine(str(patterns_file))
+    default = classes.index(DEFAULT_CLASS)
+
+    def match(uniques: pd.Series) -> np.ndarray:
+        hit = uniques.astype(str).str.extract(regex).notna().to_numpy()
+        return np.where(hit.any(axis=1), hit.argmax(axis=1), default)
+
+    return classify_uniques(categories, match, classes, missing_code=default)
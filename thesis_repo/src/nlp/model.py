@@ -0,0 +1,167 @@
+"""
+Lernendes Klassifikationsmodell für Haushaltskategorien.
+
+Alternative zu den Schlüsselwortregeln aus :mod:`src.nlp.classifier`: Ein
+``HashingVectorizer`` über Zeichen‑n‑Gramme und ein lineares Modell werden
+aus den gelabelten Kategorien in ``configs/category_labels.csv`` trainiert.
+Zeichen‑n‑Gramme erkennen auch Komposita und Schreibvarianten ("EDV‑Wartung",
+"Softwarepflege"), die keine Regel abdeckt.
+
+Das trainierte Modell wird unter einem Hash aus Trainingsdaten, Parametern und
+scikit‑learn‑Version abgelegt und je Prozess nur einmal geladen. scikit‑learn
+wird erst beim ersten Laden importiert.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..manifest import file_stamp
+from .classifier import classify_uniques
+
+#: Gelabelte Kategorien (Spalten ``category`` und ``classification``).
+LABELS_FILE = Path(__file__).resolve().parents[2] / "configs" / "category_labels.csv"
+
+#: Ablage der trainierten Modelle.
+MODEL_DIR = Path(__file__).resolve().parents[2] / "data" / "interim" / "models"
+
+#: Modellparameter; sie fließen in den Konfigurations‑Hash ein.
+MODEL_PARAMS: Dict[str, Any] = {
+    "analyzer": "char_wb",
+    "ngram_range": [2, 5],
+    "n_features": 2 ** 18,
+    "C": 10.0,
+}
+
+#: Anzahl eindeutiger Kategorien je Vorhersage‑Batch.
+BATCH_SIZE = 50_000
+
+
+def _sklearn():
+    try:
+        import joblib
+        import sklearn
+        from sklearn.feature_extraction.text import HashingVectorizer
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import make_pipeline
+    except ImportError as exc:  # pragma: no cover - abhängig von der Umgebung
+        raise ImportError("The category model requires the 'scikit-learn' package") from exc
+    return joblib, sklearn, HashingVectorizer, LogisticRegression, make_pipeline
+
+
+def config_hash(labels_file: Union[str, Path] = LABELS_FILE,
+                params: Dict[str, Any] = MODEL_PARAMS) -> str:
+    """Hash aus Trainingsdaten, Modellparametern und scikit‑learn‑Version."""
+    _, sklearn, *_ = _sklearn()
+    digest = hashlib.sha256()
+    with open(labels_file, "rb") as f:
+        digest.update(f.read())
+    digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    digest.update(sklearn.__version__.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CategoryModel:
+    """Trainiertes Modell samt Konfigurations‑Hash.
+
+    Parameters
+    ----------
+    estimator : sklearn.pipeline.Pipeline
+        Vektorisierer und lineares Modell.
+    config_hash : str
+        Hash, unter dem das Modell abgelegt wird (siehe :func:`config_hash`).
+    """
+
+    def __init__(self, estimator: Any, config_hash: str):
+        self.estimator = estimator
+        self.config_hash = config_hash
+
+    @property
+    def classes(self) -> List[str]:
+        return [str(name) for name in self.estimator.classes_]
+
+    @classmethod
+    def train(cls, labels_file: Union[str, Path] = LABELS_FILE,
+              params: Dict[str, Any] = MODEL_PARAMS) -> "CategoryModel":
+        """Trainiert das Modell auf den gelabelten Kategorien."""
+        _, _, HashingVectorizer, LogisticRegression, make_pipeline = _sklearn()
+        labels = pd.read_csv(labels_file, dtype=str).dropna()
+        estimator = make_pipeline(
+            HashingVectorizer(analyzer=params["analyzer"],
+                              ngram_range=tuple(params["ngram_range"]),
+                              n_features=params["n_features"],
+                              lowercase=True, alternate_sign=False, norm="l2"),
+            LogisticRegression(C=params["C"], max_iter=1000),
+        )
+        estimator.fit(labels["category"], labels["classification"])
+        return cls(estimator, config_hash(labels_file, params))
+
+    def predict(self, categories: Sequence[str], batch_size: int = BATCH_SIZE) -> np.ndarray:
+        """Sagt die Klassen in Batches vorher (Ergebnis als ``object``‑Array)."""
+        result = np.empty(len(categories), dtype=object)
+        for start in range(0, len(categories), batch_size):
+            batch = categories[start:start + batch_size]
+            result[start:start + len(batch)] = self.estimator.predict(batch)
+        return result
+
+    def save(self, path: Path) -> None:
+        """Legt das Modell atomar ab."""
+        joblib, *_ = _sklearn()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_suffix(".tmp")
+        joblib.dump(self, tmp_file)
+        tmp_file.replace(path)
+
+
+def load_model(labels_file: str = str(LABELS_FILE),
+               model_dir: str = str(MODEL_DIR)) -> CategoryModel:
+    """Lädt das Modell zum aktuellen Konfigurations‑Hash.
+
+    Je Prozess wird das Modell nur einmal geladen, solange sich die
+    Trainingsdaten nicht ändern. Liegt noch kein Modell zu diesem Hash vor,
+    wird es trainiert und gespeichert.
+    """
+    return _load_model(labels_file, model_dir, file_stamp(labels_file))
+
+
+@lru_cache(maxsize=None)
+def _load_model(labels_file: str, model_dir: str, stamp: Tuple[int, int]) -> CategoryModel:
+    joblib, *_ = _sklearn()
+    path = Path(model_dir) / f"category_model-{config_hash(labels_file)[:16]}.joblib"
+    if path.exists():
+        return joblib.load(path)
+    model = CategoryModel.train(labels_file)
+    model.save(path)
+    return model
+
+
+def predict_series(categories: pd.Series,
+                   labels_file: Union[str, Path] = LABELS_FILE,
+                   model_dir: Optional[Union[str, Path]] = None) -> pd.Categorical:
+    """Klassifiziert eine Kategorie‑Spalte über ihre eindeutigen Werte.
+
+    Parameters
+    ----------
+    categories : pandas.Series
+        Freitextkategorien; fehlende Werte bleiben fehlend.
+    labels_file : str or pathlib.Path
+        Trainingsdaten (Standard: ``configs/category_labels.csv``).
+    model_dir : str or pathlib.Path, optional
+        Ablage der trainierten Modelle (Standard: :data:`MODEL_DIR`).
+
+    Returns
+    -------
+    pandas.Categorical
+        Vorhergesagte Klassen mit den Klassen des Modells als Kategorien.
+    """
+    model = load_model(str(labels_file), str(model_dir or MODEL_DIR))
+
+    def predict(uniques: pd.Series) -> np.ndarray:
+        return pd.Index(model.classes).get_indexer(model.predict(uniques.to_numpy(str)))
+
+    return classify_uniques(categories, predict, model.classes)
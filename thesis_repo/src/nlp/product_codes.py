@@ -0,0 +1,141 @@
+"""
+Klassifikation über Produktplan‑Codes.
+
+Kommunale Haushalte gliedern Buchungszeilen hierarchisch nach Produktbereich,
+‑gruppe und ‑produkt (z. B. ``11.4.01``). Die Präfixe aus
+``configs/product_codes.yml`` werden zu einem Ziffern‑Trie kompiliert; eine
+Zeile erhält die Klasse des längsten passenden Präfixes. Die Suche läuft
+vektorisiert Ebene für Ebene über alle eindeutigen Codes.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from ..manifest import file_stamp
+
+#: Standardpfad der Präfix‑Zuordnung.
+PRODUCT_CODES_FILE = Path(__file__).resolve().parents[2] / "configs" / "product_codes.yml"
+
+#: Spalte mit den Produktcodes in den geparsten Haushaltsdaten.
+CODE_COLUMN = "product_code"
+
+
+def load_product_codes(path: Union[str, Path] = PRODUCT_CODES_FILE) -> Dict[str, str]:
+    """Lädt die Zuordnung von Code‑Präfixen zu Klassen.
+
+    Die YAML‑Datei ordnet jeder Klasse eine Liste von Präfixen zu.
+    Trennzeichen in den Präfixen werden wie in :func:`normalize_codes`
+    entfernt.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Pfad zur YAML‑Datei.
+
+    Returns
+    -------
+    dict
+        Normalisierter Präfix → Klasse.
+    """
+    with open(path, encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+
+    prefixes: Dict[str, str] = {}
+    for name, codes in config.items():
+        for code in codes or []:
+            prefix = "".join(ch for ch in str(code) if ch.isdigit())
+            if not prefix:
+                raise ValueError(f"Invalid product code prefix {code!r} for {name!r}")
+            if prefixes.get(prefix, name) != name:
+                raise ValueError(
+                    f"Prefix {prefix!r} is mapped to {prefixes[prefix]!r} and {name!r}"
+                )
+            prefixes[prefix] = str(name)
+    return prefixes
+
+
+def normalize_codes(codes: pd.Series) -> pd.Series:
+    """Entfernt Trennzeichen aus Produktcodes (``"11.4.01"`` → ``"11401"``).
+
+    Leere Codes werden zu fehlenden Werten.
+    """
+    digits = codes.astype("string").str.replace(r"\D", "", regex=True)
+    return digits.mask(digits == "")
+
+
+class ProductCodeTrie:
+    """Ziffern‑Trie über Code‑Präfixe in Array‑Form.
+
+    ``children[node, digit]`` ist der Folgeknoten (``-1`` für keinen),
+    ``labels[node]`` der Klassenindex eines Präfixendes (``-1`` für keinen).
+
+    Parameters
+    ----------
+    prefixes : dict
+        Normalisierter Präfix → Klasse, z. B. aus :func:`load_product_codes`.
+    """
+
+    def __init__(self, prefixes: Dict[str, str]):
+        self.classes: Tuple[str, ...] = tuple(dict.fromkeys(prefixes.values()))
+        children = [[-1] * 10]
+        labels = [-1]
+        for prefix, name in prefixes.items():
+            node = 0
+            for digit in map(int, prefix):
+                if children[node][digit] < 0:
+                    children[node][digit] = len(children)
+                    children.append([-1] * 10)
+                    labels.append(-1)
+                node = children[node][digit]
+            labels[node] = self.classes.index(name)
+        self.children = np.array(children, dtype=np.int32)
+        self.labels = np.array(labels, dtype=np.int16)
+        self.depth = max((len(prefix) for prefix in prefixes), default=0)
+
+    def lookup(self, codes: np.ndarray) -> np.ndarray:
+        """Klassenindex des längsten passenden Präfixes je Code.
+
+        Parameters
+        ----------
+        codes : numpy.ndarray
+            Normalisierte Codes (nur Ziffern) als Strings.
+
+        Returns
+        -------
+        numpy.ndarray
+            Klassenindizes in :attr:`classes`; ``-1``, wenn kein Präfix passt.
+        """
+        best = np.full(len(codes), -1, dtype=np.int16)
+        if not len(codes) or not self.depth:
+            return best
+        width = min(max(len(code) for code in codes), self.depth)
+        if not width:
+            return best
+        digits = np.array(codes, dtype=f"S{width}").view(np.uint8).reshape(len(codes), width)
+        digits = digits.astype(np.int16) - ord("0")
+        state = np.zeros(len(codes), dtype=np.int32)
+        for level in range(width):
+            digit = digits[:, level]
+            active = (state >= 0) & (digit >= 0) & (digit <= 9)
+            if not active.any():
+                break
+            state = np.where(active, self.children[np.maximum(state, 0),
+                                                   np.clip(digit, 0, 9)], -1)
+            label = np.where(state >= 0, self.labels[np.maximum(state, 0)], -1)
+            best = np.where(label >= 0, label, best)
+        return best
+
+
+@lru_cache(maxsize=None)
+def _compile_trie(path: str, stamp: Tuple[int, int]) -> ProductCodeTrie:
+    return ProductCodeTrie(load_product_codes(path))
+
+
+def load_trie(path: str) -> ProductCodeTrie:
+    """Kompilierter Trie einer Präfixdatei (einmal je Prozess und Dateistand)."""
+    return _compile_trie(path, file_stamp(path))
@@ -6,17 +6,151 @@ und numerische Werte typisiert. Weitere Verarbeitungsschritte wie z. B.
 PDF‑Parsing könnten hier ergänzt werden.
 """
 
+from importlib.util import find_spec
+from numbers import Real
+
+import numpy as np
 import pandas as pd
-from typing import List
+from typing import Dict, List, Tuple
+
+#: String‑Dtype für die Betragsnormalisierung (Arrow‑Kernels, falls verfügbar).
+STRING_DTYPE = "string[pyarrow]" if find_spec("pyarrow") is not None else "string"
+
+#: Einheiten‑Multiplikatoren deutscher Haushaltspläne (Regex auf Kleinschreibung).
+UNIT_MULTIPLIERS: Dict[str, float] = {
+    r"t€|teur|tsd": 1e3,
+    r"mio": 1e6,
+    r"mrd": 1e9,
+}
+
+#: Einheiten und Währungszeichen, die vor dem Zahlenvergleich entfernt werden.
+UNIT_TOKENS = r"(?:t€|teur|tsd|mio|mrd)\.?|€|eur"
+
+#: Zulässige Zahlformate (Regex auf den bereinigten Wert) mit Tausender‑ und
+#: Dezimaltrenner; geprüft wird in dieser Reihenfolge, der erste Treffer gilt.
+AMOUNT_FORMATS: Dict[str, Tuple[str, str]] = {
+    r"[+-]?[1-9]\d{0,2}(?:\.\d{3})+": (".", ","),                   # 1.234.567
+    r"[+-]?(?:[1-9]\d{0,2}(?:\.\d{3})+|\d+),\d+": (".", ","),       # 1.234,56 / 12,5
+    r"[+-]?[1-9]\d{0,2}(?:,\d{3}){2,}": (",", "."),                 # 1,234,567
+    r"[+-]?(?:[1-9]\d{0,2}(?:,\d{3})+|\d+)(?:\.\d+)?": (",", "."),  # 1,234.56 / 250.5
+}
+
+#: Textspalten, die im kompakten Modus als Kategorien gespeichert werden.
+CATEGORICAL_COLUMNS: List[str] = ["commune", "category", "source_file"]
+
+
+def compact_dtypes(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """Wandelt geparste Haushaltsdaten in speichersparende Dtypes um.
+
+    Textspalten aus :data:`CATEGORICAL_COLUMNS` werden kategorial, ``year``
+    wird ``Int16`` und ``amount`` ``float32``, sofern dabei kein Wert seine
+    Genauigkeit verliert (sonst bleibt ``float64``).
+
+    Parameter
+    ----------
+    df : pandas.DataFrame
+        Geparste Haushaltsdaten.
+
+    Returns
+    -------
+    tuple of (pandas.DataFrame, dict)
+        Kompakter DataFrame und eingesparte Bytes je umgewandelter Spalte.
+    """
+    before = df.memory_usage(deep=True, index=False)
+    df = df.copy(deep=False)
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype("category")
+    df["year"] = df["year"].astype("Int16")
+    amount32 = df["amount"].astype(np.float32)
+    if np.array_equal(amount32.to_numpy(np.float64), df["amount"].to_numpy(np.float64),
+                      equal_nan=True):
+        df["amount"] = amount32
+    after = df.memory_usage(deep=True, index=False)
+    saved = {column: int(before[column] - after[column])
+             for column in df.columns if before[column] != after[column]}
+    return df, saved
 
 
-def parse_household_data(df: pd.DataFrame) -> pd.DataFrame:
+def parse_amounts(values: pd.Series) -> Tuple[pd.Series, int]:
+    """Wandelt Beträge in deutscher Schreibweise spaltenweise in Zahlen um.
+
+    Unterstützt werden Tausenderpunkte und Dezimalkomma ("1.234.567,89 €"),
+    negative Beträge in Klammern ("(1.000)") sowie Einheiten wie "T€",
+    "TEUR", "Tsd.", "Mio." und "Mrd.". Die Trennzeichen werden je Wert
+    erkannt: Kommen Punkt und Komma vor, ist das letzte das Dezimalzeichen
+    ("1,234.56" = 1234,56). Ohne Komma gilt ein Punkt nur dann als
+    Tausendertrenner, wenn ihm genau drei Ziffern folgen ("1.000" = 1000,
+    "250.5" = 250,5). Werte, die danach keine gültige Zahl sind (Exponenten
+    wie "1e6", unzulässige Trennzeichenfolgen, Freitext), werden verworfen
+    statt bereinigt. Numerische Zellen, z. B. aus gemischten Excel‑Spalten,
+    werden unverändert übernommen; alle übrigen Schritte laufen als
+    String‑Operationen auf der gesamten Spalte.
+
+    Parameter
+    ----------
+    values : pandas.Series
+        Rohwerte der Betragsspalte.
+
+    Returns
+    -------
+    tuple of (pandas.Series, int)
+        Beträge als ``float64`` und Anzahl nicht leerer Zellen, die nicht
+        geparst werden konnten (diese werden ``NaN``).
+    """
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        return values.astype(float), 0
+
+    numeric = np.zeros(len(values), dtype=bool)
+    if values.dtype == object:
+        numeric = np.fromiter(
+            (isinstance(v, Real) and not isinstance(v, (bool, np.bool_)) for v in values),
+            dtype=bool, count=len(values),
+        )
+    text = values.where(~numeric).astype(STRING_DTYPE)
+    text = text.str.replace("[\\s\u00a0\u202f']", "", regex=True).str.lower()
+    negative = text.str.startswith("(") & text.str.endswith(")")
+    multiplier = np.ones(len(text))
+    for pattern, factor in UNIT_MULTIPLIERS.items():
+        multiplier[text.str.contains(pattern, regex=True).fillna(False).to_numpy(bool)] = factor
+
+    number = text.where(~negative.fillna(False), text.str.slice(1, -1))
+    number = number.str.replace(UNIT_TOKENS, "", regex=True).str.replace(
+        r",-+$", "", regex=True)
+    parsed = pd.Series(np.nan, index=values.index)
+    for pattern, (thousands, decimal) in AMOUNT_FORMATS.items():
+        match = number.str.fullmatch(pattern).fillna(False).to_numpy(bool)
+        match &= parsed.isna().to_numpy()
+        if not match.any():
+            continue
+        canonical = number[match].str.replace(thousands, "", regex=False)
+        if decimal != ".":
+            canonical = canonical.str.replace(decimal, ".", regex=False)
+        parsed[match] = pd.to_numeric(canonical.astype(object),
+                                      errors="coerce").to_numpy(float)
+
+    amounts = parsed.to_numpy() * multiplier
+    amounts = np.where(negative.fillna(False).to_numpy(bool), -amounts, amounts)
+    amounts[numeric] = values[numeric].astype(float).to_numpy()
+
+    filled = text.fillna("").str.len().to_numpy() > 0
+    failed = int((np.isnan(amounts) & filled).sum())
+    return pd.Series(amounts, index=values.index, name=values.name), failed
+
+
+def parse_household_data(df: pd.DataFrame, compact: bool = False) -> pd.DataFrame:
     """Standardisiert Spalten und konvertiert numerische Felder.
 
+    Beträge werden mit :func:`parse_amounts` gelesen; die Zahl nicht
+    parsbarer Zellen steht in ``df.attrs["amount_parse_failures"]``.
+
     Parameter
     ----------
     df : pandas.DataFrame
         Rohdaten mit beliebigen Spaltennamen.
+    compact : bool
+        Speichersparende Dtypes verwenden (siehe :func:`compact_dtypes`). Die
+        eingesparten Bytes je Spalte stehen in ``df.attrs["bytes_saved"]``.
 
     Returns
     -------
@@ -34,7 +168,12 @@ def parse_household_data(df: pd.DataFrame) -> pd.DataFrame:
 
     # Year als int konvertieren
     df["year"] = pd.to_numeric(df["year"], errors="coerce").astype("Int64")
-    # Amount als float konvertieren
-    df["amount"] = pd.to_numeric(df["amount"], errors="coerce").astype(float)
+    # Amount als float konvertieren (deutsche Zahlenformate und Einheiten)
+    df["amount"], failures = parse_amounts(df["amount"])
+    df.attrs["amount_parse_failures"] = failures
+
+    if compact:
+        df, saved = compact_dtypes(df)
+        df.attrs["bytes_saved"] = saved
 
     return df
\ No newline at end of file
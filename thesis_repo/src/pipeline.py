@@ -19,24 +19,259 @@ parent_dir = current_dir.parent
 if str(parent_dir) not in sys.path:
     sys.path.insert(0, str(parent_dir))
 
-from src.scraping.download import load_household_data
+import hashlib
+from functools import partial
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from src.dag import DAGExecutor, Stage, source_hash
+from src.manifest import Manifest, file_sha256, fingerprint, refresh_entry
+from src.profiling import PipelineProfiler, ProfilingExecutor
+from src.scraping.download import (
+    RowFilter,
+    iter_household_chunks,
+    list_raw_files,
+    load_household_data,
+    read_household_file,
+)
 from src.parsing.parser import parse_household_data
-from src.nlp.classifier import classify
-from src.features.indicators import compute_indicators
+from src.nlp.classifier import CLASSIFY_METHODS, PATTERNS_FILE, classify
+from src.nlp.product_codes import PRODUCT_CODES_FILE
+from src.features.indicators import (
+    budget_sums,
+    compute_indicators,
+    indicators_from_sums,
+    merge_budget_sums,
+)
+from src.storage import ClassifiedWriter, write_indicators
+
+# Teilsummen werden gesammelt und erst nach so vielen Blöcken zusammengeführt
+SUMS_MERGE_BATCH = 64
+
+
+def run_streaming(raw_path: Path, out_path: Path, chunksize: int = 100_000,
+                  output_format: str = "csv",
+                  row_filter: Optional[RowFilter] = None,
+                  method: str = "rules", patterns_file: Path = PATTERNS_FILE) -> None:
+    """Führt die Pipeline blockweise mit konstantem Speicherbedarf aus.
+
+    Jeder Block wird geparst und klassifiziert und sofort an die
+    klassifizierte Ausgabe angehängt. Für die Indikatoren bleiben nur die
+    additiven Budgetsummen je (Kommune, Jahr) im Speicher; die Teilsummen
+    der Blöcke werden gesammelt und nur alle ``SUMS_MERGE_BATCH`` Blöcke
+    zusammengeführt.
+
+    Parameter
+    ---------
+    raw_path : pathlib.Path
+        Verzeichnis mit den Rohdaten.
+    out_path : pathlib.Path
+        Zielverzeichnis (muss existieren).
+    chunksize : int
+        Maximale Zeilenzahl je Block.
+    output_format : str
+        ``"csv"`` oder ``"parquet"`` (siehe :mod:`src.storage`).
+    row_filter : RowFilter, optional
+        Nur passende Dateien und Zeilen verarbeiten.
+    method : str
+        Klassifikationsverfahren (siehe :func:`~src.nlp.classifier.classify`).
+    patterns_file : pathlib.Path
+        Regeldatei der Klassifikation.
+    """
+    partial_sums = []
+    with ClassifiedWriter(out_path, output_format) as writer:
+        for chunk in iter_household_chunks(str(raw_path), chunksize=chunksize,
+                                           row_filter=row_filter):
+            classified_chunk = classify(parse_household_data(chunk), method=method,
+                                        patterns_file=patterns_file)
+            writer.write(classified_chunk)
+            partial_sums.append(budget_sums(classified_chunk))
+            if len(partial_sums) >= SUMS_MERGE_BATCH:
+                partial_sums = [merge_budget_sums(*partial_sums)]
+
+    indicators_df = indicators_from_sums(merge_budget_sums(*partial_sums))
+    write_indicators(indicators_df, out_path, output_format)
+
+
+def run_incremental(raw_path: Path, out_path: Path, cache_dir: Path,
+                    output_format: str = "csv", method: str = "rules",
+                    patterns_file: Path = PATTERNS_FILE) -> int:
+    """Verarbeitet nur neue oder geänderte Rohdateien.
+
+    Pro Rohdatei werden die klassifizierten Zeilen und die Budgetsummen im
+    Cache abgelegt und über das :class:`~src.manifest.Manifest` verfolgt.
+    Die Ausgabedateien entstehen anschließend aus allen Teilergebnissen.
+    Ändern sich Klassifikationsverfahren, ‑regeln, Trainingsdaten, die
+    Produktplan‑Präfixe oder der Code von Einlesen, Parsing, Klassifikation
+    und Budgetsummen, wird der gesamte Cache verworfen.
+
+    Parameter
+    ---------
+    raw_path : pathlib.Path
+        Verzeichnis mit den Rohdaten.
+    out_path : pathlib.Path
+        Zielverzeichnis (muss existieren).
+    cache_dir : pathlib.Path
+        Verzeichnis für Manifest und Teilergebnisse.
+    output_format : str
+        ``"csv"`` oder ``"parquet"`` (siehe :mod:`src.storage`).
+    method : str
+        Klassifikationsverfahren (siehe :func:`~src.nlp.classifier.classify`).
+    patterns_file : pathlib.Path
+        Regeldatei der Klassifikation.
+
+    Returns
+    -------
+    int
+        Anzahl der neu verarbeiteten Dateien.
+    """
+    manifest = Manifest(cache_dir, config_hash=incremental_hash(method, patterns_file))
+    (cache_dir / "partials").mkdir(parents=True, exist_ok=True)
+
+    files = {}
+    processed = 0
+    for raw_file in list_raw_files(str(raw_path)):
+        name = raw_file.name
+        classified_partial = manifest.partial_path(name, "classified")
+        sums_partial = manifest.partial_path(name, "sums")
+        entry = refresh_entry(raw_file, manifest.files.get(name))
+        if entry is None or not (classified_partial.exists() and sums_partial.exists()):
+            entry = fingerprint(raw_file)
+            df = read_household_file(raw_file)
+            df["source_file"] = pd.Categorical.from_codes(
+                np.zeros(len(df), dtype=np.int8), categories=[name]
+            )
+            classified_df = classify(parse_household_data(df), method=method,
+                                     patterns_file=patterns_file)
+            classified_df.to_pickle(classified_partial)
+            budget_sums(classified_df).to_pickle(sums_partial)
+            processed += 1
+        files[name] = entry
+
+    for name in set(manifest.files) - set(files):
+        for kind in ("classified", "sums"):
+            manifest.partial_path(name, kind).unlink(missing_ok=True)
+    manifest.files = files
+    manifest.save()
+
+    with ClassifiedWriter(out_path, output_format) as writer:
+        for name in files:
+            writer.write(pd.read_pickle(manifest.partial_path(name, "classified")))
+    sums = merge_budget_sums(
+        *(pd.read_pickle(manifest.partial_path(name, "sums")) for name in files)
+    )
+    write_indicators(indicators_from_sums(sums), out_path, output_format)
+    return processed
+
+
+def classification_hash(method: str = "rules", patterns_file: Path = PATTERNS_FILE) -> str:
+    """Hash der Klassifikationskonfiguration (Verfahren, Regeln bzw. Modell
+    und Produktplan)."""
+    if method == "model":
+        from src.nlp.model import config_hash
+
+        text_hash = config_hash()
+    else:
+        text_hash = file_sha256(patterns_file)
+    return f"{method}:{text_hash}{file_sha256(PRODUCT_CODES_FILE)}"
+
+
+def incremental_hash(method: str = "rules", patterns_file: Path = PATTERNS_FILE) -> str:
+    """Hash der Klassifikationskonfiguration und des Codes, aus dem die
+    Teilergebnisse des inkrementellen Modus entstehen."""
+    digest = hashlib.sha256(classification_hash(method, patterns_file).encode("utf-8"))
+    for func in (read_household_file, parse_household_data, classify, budget_sums):
+        digest.update(source_hash(func).encode("utf-8"))
+    return digest.hexdigest()
 
 
-def run_pipeline(raw_data_dir: str = "data/raw", processed_dir: str = "data/processed") -> None:
+def raw_data_hash(raw_path: Path) -> str:
+    """Inhalts‑Hash aller Rohdateien (Name und SHA‑256 je Datei)."""
+    digest = hashlib.sha256()
+    for raw_file in list_raw_files(str(raw_path)):
+        digest.update(f"{raw_file.name}\0{file_sha256(raw_file)}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def household_stages(raw_path: Path, row_filter: Optional[RowFilter] = None,
+                     method: str = "rules",
+                     patterns_file: Path = PATTERNS_FILE) -> List[Stage]:
+    """Stufen der Haushaltspipeline als DAG.
+
+    ``load_household_data`` → ``parse_household_data`` → ``classify`` →
+    ``compute_indicators``. Die Ladestufe hängt vom Inhalt der Rohdaten und
+    vom Filter ab, die Klassifikation zusätzlich vom Verfahren, seiner
+    Konfiguration und ``configs/product_codes.yml``.
+    """
+    filter_key = "" if row_filter is None else row_filter.cache_key()
+    return [
+        Stage("load", lambda: load_household_data(str(raw_path), row_filter=row_filter),
+              config=lambda: raw_data_hash(raw_path) + filter_key,
+              version=source_hash(load_household_data)),
+        Stage("parse", parse_household_data, inputs=["load"]),
+        Stage("classify", partial(classify, method=method, patterns_file=patterns_file),
+              inputs=["parse"], config=lambda: classification_hash(method, patterns_file),
+              version=source_hash(classify)),
+        Stage("indicators", compute_indicators, inputs=["classify"]),
+    ]
+
+
+def run_pipeline(raw_data_dir: str = "data/raw", processed_dir: str = "data/processed",
+                 streaming: bool = False, chunksize: int = 100_000,
+                 incremental: bool = False, cache_dir: str = "data/interim",
+                 output_format: str = "csv", stage_cache: bool = False,
+                 communes: Optional[Sequence[str]] = None,
+                 years: Optional[Sequence[int]] = None,
+                 file_pattern: Optional[str] = None,
+                 profile: bool = False, method: str = "rules",
+                 patterns_file: Optional[str] = None) -> None:
     """
     Führt den kompletten Pipeline‑Prozess aus.
 
     Parameter
     ---------
     raw_data_dir : str
-        Verzeichnis mit den Rohdaten (CSV‑Dateien). Wenn relativ, wird es
-        relativ zum Projektroot (Verzeichnis über ``src``) aufgelöst.
+        Verzeichnis mit den Rohdaten (CSV‑ oder Excel‑Dateien). Wenn relativ,
+        wird es relativ zum Projektroot (Verzeichnis über ``src``) aufgelöst.
     processed_dir : str
         Zielverzeichnis für die Ausgabedateien. Wenn relativ, wird es relativ
         zum Projektroot aufgelöst.
+    streaming : bool
+        Rohdaten blockweise verarbeiten (siehe :func:`run_streaming`), statt
+        alle Daten gleichzeitig im Speicher zu halten.
+    chunksize : int
+        Maximale Zeilenzahl je Block im Streaming‑Modus.
+    incremental : bool
+        Nur neue oder geänderte Rohdateien verarbeiten (siehe
+        :func:`run_incremental`).
+    cache_dir : str
+        Cache‑Verzeichnis für den inkrementellen Modus und den Stufen‑Cache;
+        relative Pfade werden wie ``processed_dir`` aufgelöst.
+    output_format : str
+        ``"csv"`` (Standard) oder ``"parquet"``: nach Jahr und Kommune
+        partitioniertes Parquet‑Verzeichnis ``classified_data/`` und
+        ``indicators.parquet`` (siehe :mod:`src.storage`).
+    stage_cache : bool
+        Ergebnisse der Stufen unter ``cache_dir/stages`` ablegen und
+        wiederverwenden (siehe :mod:`src.dag`). Nur für den Standardmodus.
+    communes, years : sequence, optional
+        Nur diese Kommunen bzw. Jahre verarbeiten. Die Filter greifen schon
+        beim Einlesen (siehe :class:`~src.scraping.download.RowFilter`).
+    file_pattern : str, optional
+        Regulärer Ausdruck mit den Gruppen ``commune``/``year`` für
+        Dateinamen, anhand dessen nicht passende Dateien übersprungen werden.
+    profile : bool
+        Je Stufe Wand‑ und CPU‑Zeit, Zeilen, Durchsatz, Spitzen‑RSS und die
+        größten Allokationen messen, als ``profile.json`` neben den
+        Ausgabedateien ablegen und als Tabelle ausgeben (siehe
+        :mod:`src.profiling`). Nur für den Standardmodus.
+    method : str
+        ``"rules"`` (Standard) für die Schlüsselwortregeln oder ``"model"``
+        für das trainierte Kategorienmodell (siehe :mod:`src.nlp.model`).
+    patterns_file : str, optional
+        Regeldatei der Klassifikation (Standard: ``configs/patterns.yml``);
+        relative Pfade werden wie ``processed_dir`` aufgelöst.
     """
     # Basisverzeichnis bestimmen (ein Verzeichnis oberhalb von ``src``)
     base_dir = Path(__file__).resolve().parents[1]
@@ -46,23 +281,60 @@ def run_pipeline(raw_data_dir: str = "data/raw", processed_dir: str = "data/proc
     out_path = Path(processed_dir)
     if not out_path.is_absolute():
         out_path = base_dir / out_path
+    cache_path = Path(cache_dir)
+    if not cache_path.is_absolute():
+        cache_path = base_dir / cache_path
+    patterns_path = PATTERNS_FILE if patterns_file is None else Path(patterns_file)
+    if not patterns_path.is_absolute():
+        patterns_path = base_dir / patterns_path
+
+    if method not in CLASSIFY_METHODS:
+        raise ValueError(f"Unknown method {method!r}, expected one of {CLASSIFY_METHODS}")
+    if streaming and incremental:
+        raise ValueError("streaming and incremental mode cannot be combined")
+    row_filter = RowFilter.create(communes, years, file_pattern)
+    if incremental and row_filter is not None:
+        raise ValueError("commune/year filters are not supported in incremental mode")
+    if profile and (streaming or incremental):
+        raise ValueError("profiling is only supported in the default mode")
+
+    if incremental:
+        out_path.mkdir(parents=True, exist_ok=True)
+        processed = run_incremental(raw_path, out_path, cache_path, output_format,
+                                    method=method, patterns_file=patterns_path)
+        print(f"Pipeline abgeschlossen ({processed} Datei(en) neu verarbeitet). "
+              f"Dateien gespeichert unter {out_path}.")
+        return
+
+    if streaming:
+        out_path.mkdir(parents=True, exist_ok=True)
+        run_streaming(raw_path, out_path, chunksize=chunksize, output_format=output_format,
+                      row_filter=row_filter, method=method, patterns_file=patterns_path)
+        print(f"Pipeline abgeschlossen. Dateien gespeichert unter {out_path}.")
+        return
 
-    # Schritt 1: Daten laden
-    raw_df = load_household_data(str(raw_path))
-    # Schritt 2: Parsing
-    parsed_df = parse_household_data(raw_df)
-    # Schritt 3: Klassifikation
-    classified_df = classify(parsed_df)
-    # Schritt 4: Indikatoren berechnen
-    indicators_df = compute_indicators(classified_df)
+    # Laden, Parsing, Klassifikation und Indikatoren als DAG ausführen
+    stages = household_stages(raw_path, row_filter, method, patterns_path)
+    stage_cache_dir = cache_path / "stages" if stage_cache else None
+    profiler = PipelineProfiler() if profile else None
+    if profiler is None:
+        results = DAGExecutor(stages, cache_dir=stage_cache_dir).run(["classify", "indicators"])
+    else:
+        with profiler:
+            executor = ProfilingExecutor(stages, cache_dir=stage_cache_dir, profiler=profiler)
+            results = executor.run(["classify", "indicators"])
+    classified_df = results["classify"]
+    indicators_df = results["indicators"]
 
     # Ausgabeverzeichnis anlegen
     out_path.mkdir(parents=True, exist_ok=True)
     # Dateien schreiben
-    classified_file = out_path / "classified_data.csv"
-    indicators_file = out_path / "indicators.csv"
-    classified_df.to_csv(classified_file, index=False)
-    indicators_df.to_csv(indicators_file, index=False)
+    with ClassifiedWriter(out_path, output_format) as writer:
+        writer.write(classified_df)
+    write_indicators(indicators_df, out_path, output_format)
+    if profiler is not None:
+        profiler.write(out_path)
+        print(profiler.format_table())
     # Ausgabe für den Nutzer
     print(f"Pipeline abgeschlossen. Dateien gespeichert unter {out_path}.")
 
@@ -0,0 +1,228 @@
+"""
+Profiling der Pipeline‑Stufen.
+
+Misst je Stufe Laufzeit (Wand‑ und CPU‑Zeit), Zeilen vor und nach der Stufe,
+Durchsatz, den Spitzenwert des Arbeitsspeichers (RSS) während der Stufe sowie
+die größten Python‑Allokationen laut ``tracemalloc``. Das Ergebnis wird als JSON neben den
+Ausgabedateien abgelegt und als kurze Tabelle ausgegeben.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from src.dag import DAGExecutor, Stage
+
+try:
+    import psutil
+except ImportError:  # pragma: no cover - optional
+    psutil = None
+
+PROFILE_FILE = "profile.json"
+
+
+def n_rows(value: Any) -> int:
+    """Zeilenzahl eines Stufenergebnisses (0 für Objekte ohne Länge)."""
+    try:
+        return len(value)
+    except TypeError:
+        return 0
+
+
+def current_rss_mb() -> float:
+    """Aktueller Arbeitsspeicher (RSS) des Prozesses in MB.
+
+    Nutzt ``psutil``, falls installiert, sonst ``/proc/self/statm`` (Linux);
+    ohne beide Quellen ``NaN``.
+    """
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / 1024 ** 2
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):  # pragma: no cover - kein Linux
+        return float("nan")
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+
+
+class RSSSampler:
+    """Tastet den RSS in einem Hintergrund‑Thread ab und merkt sich das Maximum.
+
+    Der Spitzenwert bezieht sich damit auf die Dauer der Messung und nicht,
+    wie ``ru_maxrss``, auf die gesamte Prozesslaufzeit. Kurze Spitzen
+    zwischen zwei Abtastungen können entgehen.
+
+    Parameters
+    ----------
+    interval : float
+        Abstand der Abtastungen in Sekunden.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.start_mb = self.peak_mb = current_rss_mb()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, current_rss_mb())
+
+    def __enter__(self) -> "RSSSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak_mb = max(self.peak_mb, current_rss_mb())
+
+
+class PipelineProfiler:
+    """Sammelt Messwerte je Stufe.
+
+    ``run_pipeline(profile=True)`` misst die Stufen des DAG‑Modus (Streaming
+    und inkrementelle Läufe werden nicht profiliert). Eine Stufe darf
+    mehrfach gemessen werden; Zeiten und Zeilen werden dann aufsummiert,
+    Speicherwerte als Maximum geführt. Die ``tracemalloc``‑Auswertung der
+    größten Allokationen erfolgt nur bei der ersten Messung einer Stufe.
+
+    ``peak_rss_mb`` ist der höchste RSS während der Stufe, ``rss_delta_mb``
+    dessen Zuwachs gegenüber dem RSS beim Start der Stufe (siehe
+    :class:`RSSSampler`).
+
+    Parameters
+    ----------
+    top_allocations : int
+        Anzahl der gemeldeten Allokationsstellen je Stufe.
+    rss_interval : float
+        Abtastintervall des RSS in Sekunden.
+    """
+
+    def __init__(self, top_allocations: int = 5, rss_interval: float = 0.01):
+        self.top_allocations = top_allocations
+        self.rss_interval = rss_interval
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._started_tracing = False
+
+    def __enter__(self) -> "PipelineProfiler":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def measure(self, stage: str, rows_in: int = 0) -> Iterator[Dict[str, Any]]:
+        """Misst einen Durchlauf einer Stufe.
+
+        Der gelieferte Datensatz nimmt über ``record["rows_out"]`` die Zahl
+        der erzeugten Zeilen auf.
+        """
+        record: Dict[str, Any] = {"rows_out": 0}
+        first = stage not in self.stages
+        tracing = tracemalloc.is_tracing()
+        before = tracemalloc.take_snapshot() if first and tracing else None
+        if tracing:
+            tracemalloc.reset_peak()
+        sampler = RSSSampler(self.rss_interval)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            with sampler:
+                yield record
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            entry = self.stages.setdefault(stage, {
+                "stage": stage, "calls": 0, "wall_s": 0.0, "cpu_s": 0.0,
+                "rows_in": 0, "rows_out": 0, "peak_rss_mb": 0.0, "rss_delta_mb": 0.0,
+                "traced_peak_mb": 0.0, "top_allocations": [],
+            })
+            entry["calls"] += 1
+            entry["wall_s"] += wall
+            entry["cpu_s"] += cpu
+            entry["rows_in"] += int(rows_in)
+            entry["rows_out"] += int(record["rows_out"])
+            entry["peak_rss_mb"] = max(entry["peak_rss_mb"], sampler.peak_mb)
+            entry["rss_delta_mb"] = max(entry["rss_delta_mb"],
+                                        sampler.peak_mb - sampler.start_mb)
+            if tracing:
+                traced_peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+                entry["traced_peak_mb"] = max(entry["traced_peak_mb"], traced_peak)
+            if before is not None:
+                entry["top_allocations"] = self._top_allocations(before)
+
+    def _top_allocations(self, before: tracemalloc.Snapshot) -> List[Dict[str, Any]]:
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        after = tracemalloc.take_snapshot().filter_traces(ignore)
+        stats = after.compare_to(before.filter_traces(ignore), "lineno")
+        stats = [stat for stat in stats if stat.size_diff > 0][:self.top_allocations]
+        return [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_kb": round(stat.size_diff / 1024, 1),
+                "count": stat.count_diff,
+            }
+            for stat in stats
+        ]
+
+    def report(self) -> Dict[str, Any]:
+        """Messwerte aller Stufen inklusive Durchsatz (Zeilen pro Sekunde)."""
+        stages = []
+        for entry in self.stages.values():
+            rows = max(entry["rows_in"], entry["rows_out"])
+            stages.append({
+                **entry,
+                "rows_per_s": rows / entry["wall_s"] if entry["wall_s"] > 0 else None,
+            })
+        return {"python": sys.version.split()[0], "stages": stages}
+
+    def write(self, out_path: Path) -> Path:
+        """Schreibt den Bericht als ``profile.json`` in das Zielverzeichnis."""
+        path = Path(out_path) / PROFILE_FILE
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        return path
+
+    def format_table(self) -> str:
+        """Kurze Konsolentabelle der Messwerte."""
+        header = (f"{'Stufe':<12}{'Wand s':>9}{'CPU s':>9}{'Zeilen ein':>12}"
+                  f"{'Zeilen aus':>12}{'Zeilen/s':>13}{'RSS MB':>9}{'+RSS MB':>9}")
+        lines = [header, "-" * len(header)]
+        for entry in self.report()["stages"]:
+            rate = entry["rows_per_s"]
+            lines.append(
+                f"{entry['stage']:<12}{entry['wall_s']:>9.3f}{entry['cpu_s']:>9.3f}"
+                f"{entry['rows_in']:>12,}{entry['rows_out']:>12,}"
+                f"{(f'{rate:,.0f}' if rate is not None else '-'):>13}"
+                f"{entry['peak_rss_mb']:>9.1f}{entry['rss_delta_mb']:>9.1f}"
+            )
+        return "\n".join(lines)
+
+
+class ProfilingExecutor(DAGExecutor):
+    """:class:`~src.dag.DAGExecutor`, der jede berechnete Stufe misst.
+
+    Aus dem Stufen‑Cache geladene Stufen werden nicht gemessen; ihre Herkunft
+    steht wie gewohnt in :attr:`status`.
+    """
+
+    def __init__(self, *args, profiler: PipelineProfiler, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.profiler = profiler
+
+    def run_stage(self, stage: Stage, args: List[Any]) -> Any:
+        with self.profiler.measure(stage.name, sum(n_rows(arg) for arg in args)) as record:
+            result = super().run_stage(stage, args)
+            record["rows_out"] = n_rows(result)
+        return result
@@ -2,40 +2,430 @@
 Module zum Laden der Rohdaten.
 
 In realen Projekten könnten hier API‑Aufrufe oder Scraper stehen, die Daten von
-Open‑Data‑Portalen wie GovData abrufen. Für diese Demo werden die CSV‑Dateien
-im Verzeichnis ``data/raw/`` eingelesen.
+Open‑Data‑Portalen wie GovData abrufen. Für diese Demo werden die CSV‑ und
+Excel‑Dateien im Verzeichnis ``data/raw/`` eingelesen.
 """
 
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
 import pandas as pd
-from typing import List
+from pandas.api.types import union_categoricals
+
+#: Standard‑Dtypes der Rohdaten. Textspalten mit vielen Wiederholungen werden
+#: als Kategorien gelesen; ``year`` und ``amount`` typisiert erst der Parser.
+DEFAULT_DTYPES: Dict[str, str] = {
+    "commune": "category",
+    "category": "category",
+    # Produktcodes als Text lesen, damit führende Nullen erhalten bleiben
+    "product_code": "category",
+}
+
+#: Dateiendungen von Excel‑Haushaltsplänen.
+EXCEL_SUFFIXES = (".xlsx", ".xlsm")
+
+#: Dateiendungen, die als Rohdaten eingelesen werden.
+RAW_SUFFIXES = (".csv",) + EXCEL_SUFFIXES
+
+#: Spalten eines Datenblatts in Excel‑Dateien (nach :func:`_normalize_column`).
+DATA_COLUMNS: FrozenSet[str] = frozenset({"commune", "year", "category", "amount"})
+
+#: Zeilenzahl je Block, wenn beim Laden gefiltert wird.
+FILTER_CHUNKSIZE = 100_000
+
+
+def default_engine() -> str:
+    """Liefert ``"pyarrow"``, wenn installiert, sonst die C‑Engine."""
+    return "pyarrow" if find_spec("pyarrow") is not None else "c"
+
+
+def _combine_frames(frames: List[pd.DataFrame],
+                    names: Optional[List[str]] = None) -> pd.DataFrame:
+    """Setzt die Einzeltabellen spaltenweise zum Ergebnis zusammen.
+
+    Kategoriale Spalten werden über ``union_categoricals`` vereinigt (ein
+    ``pd.concat`` würde sie bei abweichenden Kategorien zu ``object``
+    machen). Mit ``names`` wird ``source_file`` direkt aus Codes gebildet.
+    """
+    columns = list(dict.fromkeys(c for frame in frames for c in frame.columns))
+    data = {}
+    for column in columns:
+        parts = [
+            frame[column] if column in frame.columns
+            else pd.Series(np.nan, index=frame.index)
+            for frame in frames
+        ]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            data[column] = union_categoricals(parts, ignore_order=True)
+        else:
+            data[column] = pd.concat(parts, ignore_index=True)
+    if names is None:
+        return pd.DataFrame(data)
+    lengths = [len(frame) for frame in frames]
+    data["source_file"] = pd.Categorical.from_codes(
+        np.repeat(np.arange(len(frames)), lengths), categories=names
+    )
+    return pd.DataFrame(data)
+
+
+def _normalize_column(name: str) -> str:
+    """Spaltenname wie in ``parse_household_data`` vereinheitlichen."""
+    return str(name).strip().lower().replace(" ", "_")
+
+
+@dataclass(frozen=True)
+class RowFilter:
+    """Filter auf Kommunen und Jahre, der bereits beim Einlesen greift.
+
+    Dateien, die nicht passen können, werden übersprungen: über
+    ``file_pattern`` (regulärer Ausdruck mit den benannten Gruppen
+    ``commune`` und/oder ``year``, z. B. ``r"(?P<commune>.+)_(?P<year>\\d{4})"``
+    für ``Augsburg_2020.csv``) oder weil der Kopfzeile die gefilterte Spalte
+    fehlt. Alle übrigen Dateien werden blockweise gelesen und gefiltert, bevor
+    sie zusammengesetzt werden.
+
+    Attributes
+    ----------
+    communes : frozenset of str, optional
+        Zu behaltende Kommunen (exakter Vergleich der Werte).
+    years : frozenset of int, optional
+        Zu behaltende Jahre.
+    file_pattern : str, optional
+        Muster für den Dateinamen (ohne Endung); Kommunennamen werden dabei
+        ohne Beachtung der Groß‑/Kleinschreibung verglichen.
+    """
+
+    communes: Optional[FrozenSet[str]] = None
+    years: Optional[FrozenSet[int]] = None
+    file_pattern: Optional[str] = None
+
+    @classmethod
+    def create(cls, communes: Optional[Iterable[str]] = None,
+               years: Optional[Iterable[int]] = None,
+               file_pattern: Optional[str] = None) -> Optional["RowFilter"]:
+        """Erzeugt einen Filter oder ``None``, wenn nichts gefiltert wird."""
+        if communes is None and years is None:
+            return None
+        return cls(
+            communes=None if communes is None else frozenset(communes),
+            years=None if years is None else frozenset(int(year) for year in years),
+            file_pattern=file_pattern,
+        )
+
+    def cache_key(self) -> str:
+        """Deterministische Beschreibung des Filters (z. B. für Cache‑Schlüssel)."""
+        communes = None if self.communes is None else sorted(self.communes)
+        years = None if self.years is None else sorted(self.years)
+        return f"communes={communes};years={years};file_pattern={self.file_pattern}"
+
+    def skip_file(self, raw_file: Path) -> bool:
+        """Prüft anhand von Dateiname und Kopfzeile, ob die Datei entfallen kann."""
+        if self.file_pattern is not None:
+            match = re.fullmatch(self.file_pattern, raw_file.stem)
+            if match is not None:
+                names = match.groupdict()
+                commune, year = names.get("commune"), names.get("year")
+                if (self.communes is not None and commune is not None
+                        and commune.casefold() not in {c.casefold() for c in self.communes}):
+                    return True
+                if (self.years is not None and year is not None
+                        and year.isdigit() and int(year) not in self.years):
+                    return True
+        if _is_excel(raw_file):
+            return False
+        return self.lacks_columns(pd.read_csv(raw_file, nrows=0).columns)
+
+    def lacks_columns(self, columns: Iterable[str]) -> bool:
+        """Prüft, ob eine gefilterte Spalte fehlt (dann passt keine Zeile)."""
+        names = {_normalize_column(c) for c in columns}
+        return ((self.communes is not None and "commune" not in names)
+                or (self.years is not None and "year" not in names))
+
+    def apply(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Behält nur die passenden Zeilen eines Blocks.
+
+        Fehlt eine gefilterte Spalte (z. B. in einem Excel‑Blatt, dessen
+        Kopfzeile :meth:`skip_file` nicht prüft), entfällt der ganze Block.
+        """
+        if self.lacks_columns(chunk.columns):
+            return chunk.iloc[:0]
+        columns = {_normalize_column(c): c for c in chunk.columns}
+        mask = np.ones(len(chunk), dtype=bool)
+        if self.communes is not None:
+            mask &= chunk[columns["commune"]].isin(self.communes).to_numpy(bool)
+        if self.years is not None:
+            year = pd.to_numeric(chunk[columns["year"]], errors="coerce")
+            mask &= year.isin(self.years).to_numpy(bool)
+        if mask.all():
+            return chunk
+        return chunk[mask].reset_index(drop=True)
+
+
+def list_raw_files(data_dir: str) -> List[Path]:
+    """Listet die CSV‑ und Excel‑Dateien des Rohdatenverzeichnisses sortiert auf."""
+    raw_dir = Path(data_dir)
+    if not raw_dir.exists():
+        raise FileNotFoundError(f"Raw data directory {raw_dir} does not exist")
+
+    raw_files: List[Path] = sorted(
+        path for path in raw_dir.iterdir()
+        if path.is_file() and path.suffix.lower() in RAW_SUFFIXES
+        and not path.name.startswith("~$")
+    )
+    if not raw_files:
+        raise FileNotFoundError(f"No CSV or Excel files found in {raw_dir}")
+    return raw_files
+
+
+def _is_excel(path: Path) -> bool:
+    return path.suffix.lower() in EXCEL_SUFFIXES
+
+
+def iter_excel_chunks(excel_file: Path,
+                      chunksize: int = 100_000,
+                      dtype: Optional[Dict[str, str]] = None,
+                      usecols: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+    """Liest eine Excel‑Datei zeilenweise, Blatt für Blatt, in Blöcken.
 
+    ``openpyxl`` wird im Read‑only‑Modus genutzt, d. h. die Arbeitsmappe wird
+    nicht vollständig in den Speicher geladen. Die erste nicht leere Zeile
+    jedes Blatts gilt als Kopfzeile; leere Blätter und Zeilen werden
+    übersprungen, ebenso Blätter, deren Kopfzeile die Spalten aus
+    ``usecols`` bzw. :data:`DATA_COLUMNS` fehlen (z. B. Erläuterungen).
 
-def load_household_data(data_dir: str = "data/raw") -> pd.DataFrame:
-    """Lädt alle CSV‑Dateien aus dem angegebenen Verzeichnis und gibt sie als
-    zusammengesetzten DataFrame zurück.
+    Parameter
+    ----------
+    excel_file : pathlib.Path
+        Pfad zur ``.xlsx``‑Datei.
+    chunksize : int
+        Maximale Zeilenzahl je Block.
+    dtype : dict, optional
+        Explizite Dtypes je Spalte; Standard ist :data:`DEFAULT_DTYPES`.
+    usecols : sequence of str, optional
+        Nur diese Spalten übernehmen.
+
+    Yields
+    ------
+    pandas.DataFrame
+        Block im selben Format wie beim CSV‑Import.
+    """
+    from openpyxl import load_workbook
+
+    dtype = DEFAULT_DTYPES if dtype is None else dtype
+    workbook = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            header = None
+            rows: List[tuple] = []
+            for row in sheet.iter_rows(values_only=True):
+                if all(value is None for value in row):
+                    continue
+                if header is None:
+                    header = [None if value is None else str(value).strip() for value in row]
+                    if not _is_data_header(header, usecols):
+                        break
+                    continue
+                rows.append(row)
+                if len(rows) >= chunksize:
+                    yield _excel_frame(rows, header, dtype, usecols)
+                    rows = []
+            if rows:
+                yield _excel_frame(rows, header, dtype, usecols)
+    finally:
+        workbook.close()
+
+
+def _is_data_header(header: List[Optional[str]], usecols: Optional[Sequence[str]]) -> bool:
+    """Prüft, ob eine Kopfzeile alle benötigten Spalten enthält."""
+    if usecols is not None:
+        return set(usecols) <= set(header)
+    return DATA_COLUMNS <= {_normalize_column(name) for name in header if name}
+
+
+def _excel_frame(rows: List[tuple], header: List[Optional[str]],
+                 dtype: Dict[str, str], usecols: Optional[Sequence[str]]) -> pd.DataFrame:
+    """Baut aus gelesenen Excel‑Zeilen einen typisierten Block."""
+    width = len(header)
+    frame = pd.DataFrame.from_records(
+        [tuple(row[:width]) + (None,) * (width - len(row)) for row in rows],
+        columns=[name or f"unnamed_{i}" for i, name in enumerate(header)],
+    )
+    frame = frame[[name for name in header if name]]
+    if usecols is not None:
+        frame = frame[list(usecols)]
+    return frame.astype({column: kind for column, kind in dtype.items()
+                         if column in frame.columns})
+
+
+def read_excel_file(excel_file: Path,
+                    dtype: Optional[Dict[str, str]] = None,
+                    usecols: Optional[Sequence[str]] = None,
+                    row_filter: Optional[RowFilter] = None) -> pd.DataFrame:
+    """Liest alle Blätter einer Excel‑Datei (siehe :func:`iter_excel_chunks`)."""
+    chunks = list(iter_excel_chunks(excel_file, dtype=dtype, usecols=usecols))
+    if row_filter is not None:
+        chunks = [row_filter.apply(chunk) for chunk in chunks
+                  if not row_filter.lacks_columns(chunk.columns)]
+    if not chunks:
+        return pd.DataFrame(columns=list(usecols or []))
+    if len(chunks) == 1:
+        return chunks[0]
+    return _combine_frames(chunks)
+
+
+def read_household_file(raw_file: Path,
+                        dtype: Optional[Dict[str, str]] = None,
+                        usecols: Optional[Sequence[str]] = None,
+                        engine: Optional[str] = None,
+                        row_filter: Optional[RowFilter] = None) -> pd.DataFrame:
+    """Liest eine einzelne Rohdatendatei (CSV oder Excel) mit expliziten Dtypes.
+
+    Die Parameter entsprechen denen von :func:`load_household_data`; eine
+    Spalte ``source_file`` wird nicht angefügt. Mit ``row_filter`` wird die
+    Datei blockweise gelesen und jeder Block sofort gefiltert.
+    """
+    if _is_excel(raw_file):
+        return read_excel_file(raw_file, dtype=dtype, usecols=usecols,
+                               row_filter=row_filter)
+    if row_filter is not None:
+        chunks = [
+            row_filter.apply(chunk)
+            for chunk in _iter_file_chunks(raw_file, FILTER_CHUNKSIZE, dtype, usecols)
+        ]
+        return _combine_frames(chunks)
+    return pd.read_csv(
+        raw_file,
+        dtype=DEFAULT_DTYPES if dtype is None else dtype,
+        usecols=usecols,
+        engine=engine or default_engine(),
+    )
+
+
+def load_household_data(data_dir: str = "data/raw",
+                        dtype: Optional[Dict[str, str]] = None,
+                        usecols: Optional[Sequence[str]] = None,
+                        max_workers: Optional[int] = None,
+                        engine: Optional[str] = None,
+                        row_filter: Optional[RowFilter] = None) -> pd.DataFrame:
+    """Lädt alle CSV‑ und Excel‑Dateien aus dem angegebenen Verzeichnis und
+    gibt sie als zusammengesetzten DataFrame zurück.
+
+    CSV‑Dateien werden parallel in einem Thread‑Pool gelesen (mit der
+    PyArrow‑Engine, sofern verfügbar), Excel‑Dateien parallel in einem
+    Prozess‑Pool, da ``openpyxl`` reiner Python‑Code ist. Die Ergebnisse
+    werden spaltenweise zusammengesetzt.
 
     Parameter
     ----------
     data_dir : str
         Pfad zum Ordner mit den Rohdaten.
+    dtype : dict, optional
+        Explizite Dtypes je Spalte; Standard ist :data:`DEFAULT_DTYPES`.
+    usecols : sequence of str, optional
+        Nur diese Spalten einlesen.
+    max_workers : int, optional
+        Anzahl der Lese‑Threads bzw. ‑Prozesse (Standard der Executors).
+    engine : str, optional
+        ``read_csv``‑Engine; Standard ist :func:`default_engine`.
+    row_filter : RowFilter, optional
+        Nur passende Dateien und Zeilen laden (siehe :class:`RowFilter`).
 
     Returns
     -------
     pandas.DataFrame
-        Zusammengeführter DataFrame aller CSV‑Dateien.
+        Zusammengeführter DataFrame aller Dateien; ``source_file`` ist
+        kategorial.
     """
-    raw_dir = Path(data_dir)
-    if not raw_dir.exists():
-        raise FileNotFoundError(f"Raw data directory {raw_dir} does not exist")
+    raw_files = _select_files(list_raw_files(data_dir), row_filter)
+    if not raw_files:
+        raise FileNotFoundError(f"No raw data files in {data_dir} match the filter")
+    engine = engine or default_engine()
+    has_excel = any(_is_excel(raw_file) for raw_file in raw_files)
+
+    def read(csv_file: Path) -> pd.DataFrame:
+        return read_household_file(csv_file, dtype=dtype, usecols=usecols, engine=engine,
+                                   row_filter=row_filter)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as threads, \
+            (ProcessPoolExecutor(max_workers=max_workers) if has_excel
+             else nullcontext()) as processes:
+        futures = [
+            processes.submit(read_excel_file, raw_file, dtype, usecols, row_filter)
+            if _is_excel(raw_file) else threads.submit(read, raw_file)
+            for raw_file in raw_files
+        ]
+        frames = [future.result() for future in futures]
+    return _combine_frames(frames, [raw_file.name for raw_file in raw_files])
+
+
+def iter_household_chunks(data_dir: str = "data/raw",
+                          chunksize: int = 100_000,
+                          dtype: Optional[Dict[str, str]] = None,
+                          usecols: Optional[Sequence[str]] = None,
+                          row_filter: Optional[RowFilter] = None) -> Iterator[pd.DataFrame]:
+    """Liest die Rohdaten blockweise, ohne sie vollständig zu laden.
+
+    Jeder Block umfasst höchstens ``chunksize`` Zeilen einer Datei. Der
+    Speicherbedarf ist damit unabhängig von der Gesamtgröße der Rohdaten.
+
+    Parameter
+    ----------
+    data_dir : str
+        Pfad zum Ordner mit den Rohdaten.
+    chunksize : int
+        Maximale Zeilenzahl je Block.
+    dtype : dict, optional
+        Explizite Dtypes je Spalte; Standard ist :data:`DEFAULT_DTYPES`.
+    usecols : sequence of str, optional
+        Nur diese Spalten einlesen.
+    row_filter : RowFilter, optional
+        Nur passende Dateien und Zeilen liefern; leere Blöcke entfallen.
+
+    Yields
+    ------
+    pandas.DataFrame
+        Block mit zusätzlicher kategorialer Spalte ``source_file``.
+    """
+    raw_files = _select_files(list_raw_files(data_dir), row_filter)
+    names = [raw_file.name for raw_file in raw_files]
+    for code, raw_file in enumerate(raw_files):
+        for chunk in _iter_file_chunks(raw_file, chunksize, dtype, usecols):
+            if row_filter is not None:
+                chunk = row_filter.apply(chunk)
+                if chunk.empty:
+                    continue
+            chunk["source_file"] = pd.Categorical.from_codes(
+                np.full(len(chunk), code), categories=names
+            )
+            yield chunk
+
+
+def _select_files(raw_files: List[Path], row_filter: Optional[RowFilter]) -> List[Path]:
+    """Entfernt Dateien, die laut :meth:`RowFilter.skip_file` nicht passen."""
+    if row_filter is None:
+        return raw_files
+    return [raw_file for raw_file in raw_files if not row_filter.skip_file(raw_file)]
 
-    csv_files: List[Path] = list(raw_dir.glob("*.csv"))
-    if not csv_files:
-        raise FileNotFoundError(f"No CSV files found in {raw_dir}")
 
-    frames = []
-    for csv_file in csv_files:
-        df = pd.read_csv(csv_file)
-        df["source_file"] = csv_file.name
-        frames.append(df)
-    return pd.concat(frames, ignore_index=True)
\ No newline at end of file
+def _iter_file_chunks(raw_file: Path, chunksize: int,
+                      dtype: Optional[Dict[str, str]],
+                      usecols: Optional[Sequence[str]]) -> Iterator[pd.DataFrame]:
+    """Liest eine CSV‑ oder Excel‑Datei in Blöcken."""
+    if _is_excel(raw_file):
+        yield from iter_excel_chunks(raw_file, chunksize=chunksize, dtype=dtype,
+                                     usecols=usecols)
+        return
+    reader = pd.read_csv(
+        raw_file,
+        dtype=DEFAULT_DTYPES if dtype is None else dtype,
+        usecols=usecols,
+        chunksize=chunksize,
+    )
+    with reader:
+        yield from reader
@@ -0,0 +1,143 @@
+"""
+Ablage der Pipeline‑Ergebnisse.
+
+Die Ergebnisse werden entweder als CSV (Standard) oder spaltenorientiert als
+Parquet geschrieben. Im Parquet‑Format werden die klassifizierten Daten nach
+``year`` und ``commune`` partitioniert, Textspalten dictionary‑kodiert und
+Spaltenstatistiken abgelegt. Nachgelagerte Auswertungen (Case Selection,
+Dashboards) lesen so nur die benötigten Partitionen und Spalten.
+"""
+
+import shutil
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+OUTPUT_FORMATS = ("csv", "parquet")
+
+#: Partitionierung der klassifizierten Daten im Parquet‑Format.
+PARTITION_COLS = ["year", "commune"]
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - abhängig von der Umgebung
+        raise ImportError("Parquet output requires the 'pyarrow' package") from exc
+    return pa, pq
+
+
+def _check_format(output_format: str) -> None:
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unknown output format {output_format!r}, expected one of {OUTPUT_FORMATS}"
+        )
+
+
+class ClassifiedWriter:
+    """Schreibt klassifizierte Daten blockweise in das Zielverzeichnis.
+
+    CSV‑Ausgabe landet in ``classified_data.csv``, Parquet‑Ausgabe im
+    partitionierten Verzeichnis ``classified_data/``. Bestehende Ausgaben
+    werden beim Öffnen ersetzt.
+
+    Parameters
+    ----------
+    out_path : pathlib.Path
+        Zielverzeichnis (muss existieren).
+    output_format : str
+        ``"csv"`` oder ``"parquet"``.
+    """
+
+    def __init__(self, out_path: Path, output_format: str = "csv"):
+        _check_format(output_format)
+        self.output_format = output_format
+        self._parts = 0
+        self._file = None
+        if output_format == "csv":
+            self.path = Path(out_path) / "classified_data.csv"
+            self._file = open(self.path, "w", encoding="utf-8", newline="")
+        else:
+            _pyarrow()
+            self.path = Path(out_path) / "classified_data"
+            if self.path.exists():
+                shutil.rmtree(self.path)
+            self.path.mkdir(parents=True)
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Hängt einen Block klassifizierter Daten an."""
+        if self.output_format == "csv":
+            df.to_csv(self._file, header=(self._parts == 0), index=False)
+        elif len(df):
+            pa, pq = _pyarrow()
+            pq.write_to_dataset(
+                pa.Table.from_pandas(df, preserve_index=False),
+                self.path,
+                partition_cols=PARTITION_COLS,
+                basename_template=f"part-{self._parts:05d}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+                use_dictionary=True,
+                write_statistics=True,
+            )
+        self._parts += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "ClassifiedWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_indicators(df: pd.DataFrame, out_path: Path, output_format: str = "csv") -> Path:
+    """Schreibt die Indikatoren als ``indicators.csv`` bzw. ``indicators.parquet``."""
+    _check_format(output_format)
+    if output_format == "csv":
+        path = Path(out_path) / "indicators.csv"
+        df.to_csv(path, index=False)
+    else:
+        _pyarrow()
+        path = Path(out_path) / "indicators.parquet"
+        df.to_parquet(path, index=False, use_dictionary=True, write_statistics=True)
+    return path
+
+
+def read_classified(path: Path,
+                    communes: Optional[Sequence[str]] = None,
+                    years: Optional[Sequence[int]] = None,
+                    columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Liest einen Ausschnitt der partitionierten klassifizierten Daten.
+
+    Filter auf ``commune`` und ``year`` werden auf Partitionsebene
+    ausgewertet; nicht passende Partitionen werden nicht gelesen.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        Verzeichnis ``classified_data/`` einer Parquet‑Ausgabe.
+    communes : sequence of str, optional
+        Nur diese Kommunen lesen.
+    years : sequence of int, optional
+        Nur diese Jahre lesen.
+    columns : list of str, optional
+        Nur diese Spalten lesen.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Gefilterte klassifizierte Daten.
+    """
+    _, pq = _pyarrow()
+    filters = []
+    if communes is not None:
+        filters.append(("commune", "in", list(communes)))
+    if years is not None:
+        filters.append(("year", "in", [int(year) for year in years]))
+    table = pq.read_table(path, columns=columns, filters=filters or None)
+    return table.to_pandas()
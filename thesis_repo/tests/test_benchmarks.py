@@ -0,0 +1,32 @@
+import pandas as pd
+
+from benchmarks.suite import compare_results
+from benchmarks.synthetic import Scale, make_panel, write_raw_files
+from src.parsing.parser import parse_household_data
+from src.scraping.download import load_household_data
+
+
+def test_make_panel_is_complete_and_seeded(tmp_path):
+    scale = Scale(n_communes=3, n_years=4, n_categories=10, lines_per_budget=5, n_files=2)
+    df = make_panel(scale, seed=1)
+
+    assert len(df) == scale.n_rows == 60
+    assert (df.groupby(["commune", "year"]).size() == 5).all()
+    pd.testing.assert_frame_equal(df, make_panel(scale, seed=1))
+
+    write_raw_files(df, tmp_path, scale.n_files)
+    parsed = parse_household_data(load_household_data(str(tmp_path)))
+    assert parsed.attrs["amount_parse_failures"] == 0
+    assert len(parsed) == 60
+
+
+def test_compare_results_flags_regressions():
+    baseline = {"parse": {"rows_per_s": 1000.0, "peak_mb": 10.0},
+                "classify": {"rows_per_s": 1000.0, "peak_mb": 10.0}}
+    current = {"parse": {"rows_per_s": 850.0, "peak_mb": 11.0},
+               "classify": {"rows_per_s": 700.0, "peak_mb": 13.0},
+               "indicators": {"rows_per_s": 1.0, "peak_mb": 1.0}}
+
+    regressions = compare_results(current, baseline, threshold=0.2)
+    assert len(regressions) == 2
+    assert all(r.startswith("classify:") for r in regressions)
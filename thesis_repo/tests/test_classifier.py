@@ -1,10 +1,71 @@
+import pandas as pd
 import pytest
 
-from src.nlp.classifier import classify_category
+from src.nlp.classifier import classify, classify_category, classify_series
 
 
 def test_classify_category():
     assert classify_category("IT infrastructure") == "digital"
     assert classify_category("Personnel costs digital") == "personnel"
     assert classify_category("Outsourcing services") == "outsourcing"
-    assert classify_category("Other administration") == "other"
\ No newline at end of file
+    assert classify_category("Other administration") == "other"
+    # Bei gleicher Priorität gewinnt digital (vor outsourcing in patterns.yml)
+    assert classify_category("IT Outsourcing") == "digital"
+
+
+def test_classify_batch_matches_apply():
+    df = pd.DataFrame({
+        "category": ["IT upgrade", "Outsourcing services", "IT upgrade", None, "Other"],
+        "amount": [1.0, 2.0, 3.0, 4.0, 5.0],
+    })
+    batch = classify(df.dropna())
+    rowwise = classify(df.dropna(), batch=False)
+
+    assert list(batch["classification"]) == list(rowwise["classification"])
+    assert classify(df)["classification"].iloc[3] == "other"
+    assert "classification" not in df.columns
+
+
+def test_rules_respect_priority_and_word_boundaries(tmp_path):
+    rules = tmp_path / "patterns.yml"
+    rules.write_text(
+        "digital:\n  - IT\noutsourcing:\n  priority: 5\n  patterns: [Outsourc*]\n",
+        encoding="utf-8",
+    )
+
+    assert classify_category("IT outsourcing", patterns_file=rules) == "outsourcing"
+    assert classify_category("Kita-Betrieb", patterns_file=rules) == "other"
+    assert classify_category("Kita IT", patterns_file=rules) == "digital"
+    series = pd.Series(["Outsourced IT", "Kita", "it"])
+    assert list(classify_series(series, rules)) == ["outsourcing", "other", "digital"]
+
+    # Geänderte Regeldatei wird ohne Neustart neu kompiliert
+    rules.write_text("digital:\n  - IT\n  - Kita\n", encoding="utf-8")
+    assert classify_category("Kita", patterns_file=rules) == "digital"
+
+
+def test_product_codes_use_longest_prefix_and_fall_back_to_text():
+    df = pd.DataFrame({
+        "category": ["Sonstiges", "Sonstiges", "IT infrastructure", "Personnel costs",
+                     "Outsourcing services"],
+        "product_code": ["11.4.01", "11.4.9.1", None, "11.1.2.05", "42.1"],
+    })
+
+    result = classify(df)
+
+    assert result["classification"].tolist() == [
+        "digital", "outsourcing", "digital", "personnel", "other"
+    ]
+    assert classify(df, batch=False)["classification"].tolist() == \
+        result["classification"].tolist()
+
+
+def test_product_codes_file_changes_are_picked_up(tmp_path):
+    codes_file = tmp_path / "product_codes.yml"
+    codes_file.write_text("digital:\n  - '11.4'\n", encoding="utf-8")
+    df = pd.DataFrame({"category": ["Sonstiges"], "product_code": ["11.4.9.1"]})
+    assert classify(df, codes_file=codes_file)["classification"].tolist() == ["digital"]
+
+    codes_file.write_text("digital:\n  - '11.4'\noutsourcing:\n  - '11.4.9'\n",
+                          encoding="utf-8")
+    assert classify(df, codes_file=codes_file)["classification"].tolist() == ["outsourcing"]
@@ -0,0 +1,47 @@
+import pytest
+
+from src.dag import DAGExecutor, Stage
+
+
+def _stages(calls, rules="v1"):
+    def load():
+        calls.append("load")
+        return [1, 2, 3]
+
+    def parse(values):
+        calls.append("parse")
+        return [v * 10 for v in values]
+
+    def classify(values):
+        calls.append("classify")
+        return [(v, rules) for v in values]
+
+    return [
+        Stage("load", load, config="raw-1", version="1"),
+        Stage("parse", parse, inputs=["load"], version="1"),
+        Stage("classify", classify, inputs=["parse"], config=rules, version="1"),
+    ]
+
+
+def test_changed_config_reruns_only_downstream_stages(tmp_path):
+    calls = []
+    DAGExecutor(_stages(calls), cache_dir=tmp_path).run()
+    assert calls == ["load", "parse", "classify"]
+
+    calls.clear()
+    executor = DAGExecutor(_stages(calls), cache_dir=tmp_path)
+    assert executor.run(["classify"])["classify"] == [(10, "v1"), (20, "v1"), (30, "v1")]
+    assert calls == []
+
+    calls.clear()
+    executor = DAGExecutor(_stages(calls, rules="v2"), cache_dir=tmp_path)
+    assert executor.run(["classify"])["classify"][0] == (10, "v2")
+    assert calls == ["classify"]
+    assert executor.status == {"parse": "cache", "classify": "computed"}
+
+
+def test_cycles_are_rejected():
+    stages = [Stage("a", lambda b: b, inputs=["b"], version="1"),
+              Stage("b", lambda a: a, inputs=["a"], version="1")]
+    with pytest.raises(ValueError, match="Cycle"):
+        DAGExecutor(stages)
@@ -0,0 +1,101 @@
+import pandas as pd
+import pytest
+
+from src.scraping.download import RowFilter, iter_household_chunks, load_household_data
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_load_household_data_unions_categories(tmp_path, engine):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    (tmp_path / "kiel.csv").write_text(
+        "commune,year,category,amount\nKiel,2020,IT,1\nKiel,2021,Personnel,2\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "luebeck.csv").write_text(
+        "commune,year,category,amount\nLübeck,2020,Outsourcing,3\n", encoding="utf-8"
+    )
+
+    df = load_household_data(str(tmp_path), engine=engine, max_workers=2)
+    assert isinstance(df["commune"].dtype, pd.CategoricalDtype)
+    assert list(df["commune"]) == ["Kiel", "Kiel", "Lübeck"]
+    assert list(df["source_file"]) == ["kiel.csv", "kiel.csv", "luebeck.csv"]
+    assert list(df["amount"]) == [1, 2, 3]
+
+    df = load_household_data(str(tmp_path), usecols=["commune", "amount"], engine=engine)
+    assert list(df.columns) == ["commune", "amount", "source_file"]
+
+
+def test_load_household_data_reads_excel_sheets(tmp_path):
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    first = workbook.active
+    first.append(["commune", "year", "category", "amount"])
+    first.append(["Kiel", 2020, "IT", 1000])
+    second = workbook.create_sheet("2021")
+    second.append(["commune", "year", "category", "amount"])
+    second.append([])
+    second.append(["Kiel", 2021, "Personnel", 2000])
+    second.append(["Kiel", 2021, "Outsourcing", 3000])
+    workbook.save(tmp_path / "kiel.xlsx")
+    (tmp_path / "luebeck.csv").write_text(
+        "commune,year,category,amount\nLübeck,2020,IT,4\n", encoding="utf-8"
+    )
+
+    df = load_household_data(str(tmp_path), max_workers=2)
+    assert list(df["category"]) == ["IT", "Personnel", "Outsourcing", "IT"]
+    assert list(df["source_file"]) == ["kiel.xlsx"] * 3 + ["luebeck.csv"]
+    assert isinstance(df["commune"].dtype, pd.CategoricalDtype)
+
+    chunks = list(iter_household_chunks(str(tmp_path), chunksize=1))
+    assert [len(chunk) for chunk in chunks] == [1, 1, 1, 1]
+
+
+def test_row_filter_skips_files_and_rows(tmp_path):
+    header = "commune,year,category,amount\n"
+    (tmp_path / "kiel_2021.csv").write_text(header + "Kiel,2021,IT,1\n", encoding="utf-8")
+    (tmp_path / "kiel_2020.csv").write_text(header + "Kiel,2020,IT,2\n", encoding="utf-8")
+    (tmp_path / "luebeck_2021.csv").write_text("not,a,budget\n", encoding="utf-8")
+    (tmp_path / "other.csv").write_text(
+        "commune,year\nKiel,2021\nLübeck,2021\nKiel,2020\n", encoding="utf-8"
+    )
+    (tmp_path / "notes.csv").write_text("text\nhello\n", encoding="utf-8")
+    row_filter = RowFilter.create(communes=["Kiel"], years=[2021],
+                                  file_pattern=r"(?P<commune>[a-z]+)_(?P<year>\d{4})")
+
+    assert row_filter.skip_file(tmp_path / "luebeck_2021.csv")
+    assert row_filter.skip_file(tmp_path / "notes.csv")
+    df = load_household_data(str(tmp_path), row_filter=row_filter)
+    assert list(df["source_file"]) == ["kiel_2021.csv", "other.csv"]
+    assert list(df["year"]) == [2021, 2021]
+    chunks = list(iter_household_chunks(str(tmp_path), chunksize=1, row_filter=row_filter))
+    assert sum(len(chunk) for chunk in chunks) == 2
+
+
+def test_excel_sheets_without_data_columns_are_skipped(tmp_path):
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    workbook.active.append(["commune", "year", "category", "amount"])
+    workbook.active.append(["Kiel", 2021, "IT", 1000])
+    notes = workbook.create_sheet("Erläuterungen")
+    notes.append(["Hinweis"])
+    notes.append(["Beträge in Euro"])
+    second = workbook.create_sheet("2022")
+    second.append(["commune", "year", "category", "amount"])
+    second.append(["Kiel", 2022, "Personnel", 2000])
+    workbook.save(tmp_path / "kiel.xlsx")
+    columns = ["commune", "year", "category", "amount", "source_file"]
+
+    df = load_household_data(str(tmp_path))
+    assert list(df.columns) == columns
+    assert list(df["amount"]) == [1000, 2000]
+    df = load_household_data(str(tmp_path), usecols=["commune", "amount"])
+    assert list(df.columns) == ["commune", "amount", "source_file"]
+    assert list(df["amount"]) == [1000, 2000]
+    df = load_household_data(str(tmp_path), row_filter=RowFilter.create(years=[2021]))
+    assert list(df.columns) == columns
+    assert list(df["amount"]) == [1000]
+    chunks = list(iter_household_chunks(str(tmp_path), chunksize=1))
+    assert sum(len(chunk) for chunk in chunks) == 2
@@ -16,15 +16,30 @@ def test_compute_indicators():
     # Augsburg 2020
     row = df_ind[(df_ind["commune"] == "Augsburg") & (df_ind["year"] == 2020)].iloc[0]
     assert abs(row["total_budget"] - 1100000.0) < 1e-6
-    assert abs(row["digital_budget"] - 700000.0) < 1e-6
+    assert abs(row["digital_budget"] - 500000.0) < 1e-6
     assert abs(row["outsourcing_budget"] - 100000.0) < 1e-6
-    assert abs(row["personnel_budget"] - 0.0) < 1e-6
-    assert abs(row["digital_ratio"] - (700000.0 / 1100000.0)) < 1e-6
+    assert abs(row["personnel_budget"] - 200000.0) < 1e-6
+    assert abs(row["digital_ratio"] - (500000.0 / 1100000.0)) < 1e-6
     assert abs(row["outsourcing_ratio"] - (100000.0 / 1100000.0)) < 1e-6
 
     # Munich 2020
     row_m = df_ind[(df_ind["commune"] == "Munich") & (df_ind["year"] == 2020)].iloc[0]
     assert abs(row_m["total_budget"] - 1800000.0) < 1e-6
-    assert abs(row_m["digital_budget"] - 1100000.0) < 1e-6
+    assert abs(row_m["digital_budget"] - 800000.0) < 1e-6
     assert abs(row_m["outsourcing_budget"] - 200000.0) < 1e-6
-    assert abs(row_m["personnel_budget"] - 0.0) < 1e-6
\ No newline at end of file
+    assert abs(row_m["personnel_budget"] - 300000.0) < 1e-6
+
+
+def test_compute_indicators_zero_budget_and_missing_classes():
+    df = pd.DataFrame({
+        "commune": ["Kiel", "Kiel", "Lübeck"],
+        "year": [2021, 2021, 2021],
+        "amount": [0.0, 0.0, 50.0],
+        "classification": ["digital", "other", "personnel"],
+    })
+    df_ind = compute_indicators(df)
+
+    assert list(df_ind["commune"]) == ["Kiel", "Lübeck"]
+    assert pd.isna(df_ind.loc[0, "digital_ratio"])
+    assert df_ind.loc[1, "personnel_ratio"] == 1.0
+    assert df_ind.loc[1, "digital_budget"] == 0.0
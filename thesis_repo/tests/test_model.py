@@ -0,0 +1,36 @@
+import pandas as pd
+
+from src.nlp.classifier import classify
+from src.nlp.model import LABELS_FILE, load_model
+
+
+def test_model_is_trained_once_and_persisted(tmp_path):
+    model = load_model(str(LABELS_FILE), str(tmp_path))
+
+    assert load_model(str(LABELS_FILE), str(tmp_path)) is model
+    assert list(tmp_path.glob(f"category_model-{model.config_hash[:16]}.joblib"))
+    assert set(model.classes) == {"digital", "outsourcing", "personnel", "other"}
+
+
+def test_model_is_retrained_when_labels_change(tmp_path):
+    labels = tmp_path / "labels.csv"
+    labels.write_bytes(LABELS_FILE.read_bytes())
+    model = load_model(str(labels), str(tmp_path))
+
+    with open(labels, "a", encoding="utf-8") as f:
+        f.write("Glasfaser Schulen,digital\n")
+
+    retrained = load_model(str(labels), str(tmp_path))
+    assert retrained is not model
+    assert retrained.config_hash != model.config_hash
+
+
+def test_model_classifies_unseen_german_categories(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.nlp.model.MODEL_DIR", tmp_path)
+    df = pd.DataFrame({"category": ["EDV-Wartung Rathaus", "Reinigung durch Fremdfirma",
+                                    "Beamtenbezüge Kämmerei", None]})
+
+    result = classify(df, method="model")["classification"]
+
+    assert result.tolist() == ["digital", "outsourcing", "personnel", "other"]
+    assert list(result.cat.categories)[-1] == "other"
@@ -0,0 +1,59 @@
+import pandas as pd
+
+from src.parsing.parser import parse_amounts, parse_household_data
+
+
+def test_parse_household_data_compact():
+    raw = pd.DataFrame({
+        "Commune": ["Kiel", "Kiel", "Lübeck"],
+        "Year": ["2020", "2021", "x"],
+        "Category": ["IT", "IT", "Personnel"],
+        "Amount": ["1000", "250.5", "3"],
+        "source_file": ["a.csv", "a.csv", "b.csv"],
+    })
+    df = parse_household_data(raw, compact=True)
+
+    assert str(df["year"].dtype) == "Int16"
+    assert df["year"].isna().sum() == 1
+    assert df["amount"].dtype == "float32"
+    assert isinstance(df["commune"].dtype, pd.CategoricalDtype)
+    assert set(df.attrs["bytes_saved"]) >= {"commune", "category", "year", "amount"}
+
+    precise = raw.assign(Amount=["1234567.89", "1", "2"])
+    assert parse_household_data(precise, compact=True)["amount"].dtype == "float64"
+
+
+def test_parse_amounts_german_formats():
+    values = pd.Series(["1.234.567,89 €", "(1.000)", "12,5 T€", "2 Mio. €",
+                        "250.5", "1.000", "-3,20", "n/a", None, ""])
+    amounts, failed = parse_amounts(values)
+
+    assert amounts.iloc[:7].tolist() == [1234567.89, -1000.0, 12500.0, 2e6,
+                                         250.5, 1000.0, -3.2]
+    assert amounts.iloc[7:].isna().all()
+    assert failed == 1
+
+
+def test_parse_amounts_rejects_ambiguous_and_keeps_numeric_cells():
+    values = pd.Series(["1,234.56", "1,234,567", "1.000,-", "1e6", "1.2.3,4",
+                        "1,2.3,4", 123.456, 7, "1.000", None], dtype=object)
+    amounts, failed = parse_amounts(values)
+
+    assert amounts.iloc[:3].tolist() == [1234.56, 1234567.0, 1000.0]
+    assert amounts.iloc[3:6].isna().all()
+    assert amounts.iloc[6:9].tolist() == [123.456, 7.0, 1000.0]
+    assert failed == 3
+
+    df = parse_household_data(pd.DataFrame({
+        "commune": ["Kiel"] * 2, "year": [2020] * 2,
+        "category": ["IT"] * 2, "amount": pd.Series([123.456, "1e6"], dtype=object),
+    }))
+    assert df["amount"].iloc[0] == 123.456
+    assert df.attrs["amount_parse_failures"] == 1
+
+
+def test_parse_amounts_leading_zero_is_a_decimal_point():
+    amounts, failed = parse_amounts(pd.Series(["0.001", "0.500", "-0.250", "0,5"]))
+
+    assert amounts.tolist() == [0.001, 0.5, -0.25, 0.5]
+    assert failed == 0
@@ -0,0 +1,136 @@
+import json
+
+import pandas as pd
+
+from src.nlp.classifier import PATTERNS_FILE
+from src.pipeline import run_pipeline
+from src.profiling import PipelineProfiler
+from src.storage import read_classified
+
+
+def test_streaming_matches_in_memory_run(tmp_path, monkeypatch):
+    # Drei Blöcke: Teilsummen werden auch zwischendurch zusammengeführt
+    monkeypatch.setattr("src.pipeline.SUMS_MERGE_BATCH", 2)
+    run_pipeline("data/raw", str(tmp_path / "full"))
+    run_pipeline("data/raw", str(tmp_path / "stream"), streaming=True, chunksize=5)
+
+    for name in ("classified_data.csv", "indicators.csv"):
+        expected = pd.read_csv(tmp_path / "full" / name)
+        actual = pd.read_csv(tmp_path / "stream" / name)
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_incremental_run_reprocesses_only_changed_files(tmp_path, capsys, monkeypatch):
+    raw = tmp_path / "raw"
+    raw.mkdir()
+    sample = pd.read_csv("data/raw/sample_household_data.csv")
+    sample[sample["commune"] == "Augsburg"].to_csv(raw / "augsburg.csv", index=False)
+    sample[sample["commune"] == "Munich"].to_csv(raw / "munich.csv", index=False)
+    kwargs = dict(incremental=True, cache_dir=str(tmp_path / "cache"))
+
+    run_pipeline(str(raw), str(tmp_path / "out"), **kwargs)
+    assert "(2 Datei(en) neu verarbeitet)" in capsys.readouterr().out
+    run_pipeline(str(raw), str(tmp_path / "out"), **kwargs)
+    assert "(0 Datei(en) neu verarbeitet)" in capsys.readouterr().out
+
+    munich = sample[sample["commune"] == "Munich"].assign(amount=lambda d: d["amount"] * 2)
+    munich.to_csv(raw / "munich.csv", index=False)
+    run_pipeline(str(raw), str(tmp_path / "out"), **kwargs)
+    assert "(1 Datei(en) neu verarbeitet)" in capsys.readouterr().out
+
+    indicators = pd.read_csv(tmp_path / "out" / "indicators.csv")
+    assert indicators.loc[indicators["commune"] == "Munich", "total_budget"].item() == 3600000.0
+    assert indicators.loc[indicators["commune"] == "Augsburg", "total_budget"].sum() == 2420000.0
+
+    # Geänderter Parser- oder Klassifikationscode verwirft alle Teilergebnisse
+    monkeypatch.setattr("src.pipeline.source_hash", lambda func: f"patched {func.__name__}")
+    run_pipeline(str(raw), str(tmp_path / "out"), **kwargs)
+    assert "(2 Datei(en) neu verarbeitet)" in capsys.readouterr().out
+
+
+def test_parquet_output_is_partitioned(tmp_path):
+    run_pipeline("data/raw", str(tmp_path), output_format="parquet")
+
+    assert (tmp_path / "classified_data" / "year=2020" / "commune=Munich").is_dir()
+    subset = read_classified(tmp_path / "classified_data", communes=["Augsburg"],
+                             years=[2021], columns=["category", "amount"])
+    assert len(subset) == 4
+    assert subset["amount"].sum() == 1320000.0
+    indicators = pd.read_parquet(tmp_path / "indicators.parquet")
+    assert len(indicators) == 3
+
+
+def test_stage_cache_reuses_parsed_data(tmp_path):
+    patterns_file = tmp_path / "patterns.yml"
+    patterns_file.write_text(PATTERNS_FILE.read_text(encoding="utf-8"), encoding="utf-8")
+    kwargs = dict(cache_dir=str(tmp_path / "cache"), stage_cache=True,
+                  patterns_file=str(patterns_file))
+    stage_dir = tmp_path / "cache" / "stages"
+    run_pipeline("data/raw", str(tmp_path / "first"), **kwargs)
+    before = {p.name: p.stat().st_mtime_ns for p in stage_dir.iterdir()}
+    assert sorted(name.split("-")[0] for name in before) == [
+        "classify", "indicators", "load", "parse"]
+
+    # Neue Regel: "General services" wird digital statt other
+    rules = patterns_file.read_text(encoding="utf-8")
+    patterns_file.write_text(rules.replace('    - "Digital*"\n',
+                                           '    - "Digital*"\n    - "General*"\n'),
+                             encoding="utf-8")
+    run_pipeline("data/raw", str(tmp_path / "second"), **kwargs)
+
+    after = {p.name: p.stat().st_mtime_ns for p in stage_dir.iterdir()}
+    for name, mtime in before.items():
+        assert after[name] == mtime  # load und parse aus dem Cache, nichts überschrieben
+    recomputed = sorted(name.split("-")[0] for name in set(after) - set(before))
+    assert recomputed == ["classify", "indicators"]
+
+    classified = pd.read_csv(tmp_path / "second" / "classified_data.csv")
+    general = classified.loc[classified["category"] == "General services", "classification"]
+    assert general.tolist() == ["digital"]
+
+
+def test_commune_filter_is_pushed_down(tmp_path):
+    run_pipeline("data/raw", str(tmp_path), communes=["Augsburg"], years=[2021])
+
+    indicators = pd.read_csv(tmp_path / "indicators.csv")
+    assert indicators[["commune", "year"]].values.tolist() == [["Augsburg", 2021]]
+    assert len(pd.read_csv(tmp_path / "classified_data.csv")) == 4
+
+
+def test_profile_writes_stage_report(tmp_path, capsys):
+    run_pipeline("data/raw", str(tmp_path), profile=True)
+
+    report = json.loads((tmp_path / "profile.json").read_text(encoding="utf-8"))
+    stages = {entry["stage"]: entry for entry in report["stages"]}
+    assert list(stages) == ["load", "parse", "classify", "indicators"]
+    assert stages["parse"]["rows_in"] == stages["parse"]["rows_out"] == 12
+    assert stages["indicators"]["rows_out"] == 3
+    assert stages["classify"]["peak_rss_mb"] > 0
+    assert 0 <= stages["classify"]["rss_delta_mb"] <= stages["classify"]["peak_rss_mb"]
+    assert "classify" in capsys.readouterr().out
+
+
+def test_profiler_reports_rss_per_stage(monkeypatch):
+    # RSS beim Start und Spitzenwert je Messung: large, small, large
+    samples = iter([(100.0, 300.0), (120.0, 130.0), (110.0, 150.0)])
+
+    class ScriptedSampler:
+        def __init__(self, interval):
+            self.start_mb, self.peak_mb = next(samples)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            pass
+
+    monkeypatch.setattr("src.profiling.RSSSampler", ScriptedSampler)
+    profiler = PipelineProfiler()
+    for stage in ("large", "small", "large"):
+        with profiler.measure(stage):
+            pass
+
+    large, small = profiler.stages["large"], profiler.stages["small"]
+    assert large["calls"] == 2
+    assert (large["peak_rss_mb"], large["rss_delta_mb"]) == (300.0, 200.0)
+    assert (small["peak_rss_mb"], small["rss_delta_mb"]) == (130.0, 10.0)
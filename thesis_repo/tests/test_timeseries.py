@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.indicators import budget_sums, indicators_from_sums
+from src.features.timeseries import BudgetTimeSeries
+from src.nlp.classifier import classify
+from src.parsing.parser import parse_household_data
+
+
+@pytest.fixture
+def sums():
+    df = pd.read_csv("data/raw/sample_household_data.csv")
+    return budget_sums(classify(parse_household_data(df)))
+
+
+def test_window_queries_match_direct_aggregation(sums):
+    series = BudgetTimeSeries(sums)
+
+    window = series.window_sums(2020, 2021)
+    assert window.loc["Augsburg", "total_budget"] == 2420000.0
+    assert window.loc["Munich", "total_budget"] == 1800000.0
+    ratios = series.window_ratios(2020, 2020)
+    expected = indicators_from_sums(sums).set_index(["commune", "year"])
+    assert ratios.loc["Augsburg", "digital_ratio"] == expected.loc[("Augsburg", 2020), "digital_ratio"]
+
+    growth = series.yoy_growth()
+    assert growth.loc["Augsburg", 2021] == pytest.approx(0.2)
+    assert np.isnan(growth.loc["Munich", 2021])
+    rolling = series.rolling_mean(2)
+    assert rolling.loc["Augsburg", 2021] == 1210000.0
+    assert rolling.loc["Munich", 2021] == 1800000.0
+
+
+def test_append_extends_without_rebuilding(sums):
+    series = BudgetTimeSeries(sums.loc[sums.index.get_level_values("year") == 2020])
+    series.append(sums.loc[sums.index.get_level_values("year") == 2021])
+
+    pd.testing.assert_frame_equal(series.to_sums(), BudgetTimeSeries(sums).to_sums())
+    assert list(series.years) == [2020, 2021]
+    with pytest.raises(ValueError):
+        series.append(sums)
+
+
+def test_append_grows_buffer_geometrically(sums):
+    base = sums.reset_index()
+    frames = []
+    for offset in range(32):
+        frame = base.assign(year=base["year"] + 2 * offset)
+        if offset % 5 == 0:
+            frame = pd.concat([frame, frame.assign(commune=f"Neu {offset}")])
+        frames.append(frame.set_index(["commune", "year"]))
+
+    series = BudgetTimeSeries(frames[0])
+    reallocations = 0
+    for frame in frames[1:]:
+        buffer = series._cumsum
+        series.append(frame)
+        reallocations += series._cumsum is not buffer
+
+    expected = BudgetTimeSeries(pd.concat(frames))
+    pd.testing.assert_frame_equal(series.to_sums().sort_index(), expected.to_sums().sort_index())
+    assert reallocations <= 10